@@ -12,6 +12,9 @@ from resume_scanner.ui.charts import (
     create_skill_radar, 
     create_job_match_chart
 )
+from resume_scanner.ui.highlight import highlight_spans
+from resume_scanner.ats_scorer import load_role_keywords
+from resume_scanner.ngram_model import load_language_model
 
 # Page Configuration
 st.set_page_config(
@@ -24,6 +27,14 @@ st.set_page_config(
 # Apply Premium CSS
 st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
+
+@st.cache_resource
+def load_analyzers():
+    """Analyzers keep no per-request state, so one set serves all sessions."""
+    return (NLPEngine(use_spacy=False), ATSScorer(load_role_keywords()),
+            AIDetector(language_model=load_language_model()), JobMatcher())
+
+
 def main():
     # Hero Section
     st.markdown("""
@@ -43,6 +54,10 @@ def main():
              "Software Engineer", "Data Engineer"],
             help="Select your target job role for better analysis"
         )
+        job_description = st.text_area(
+            "📄 Job Description (optional)",
+            help="Paste the posting to score keywords against it instead of the role"
+        )
         
         st.markdown("---")
         st.markdown("### 📊 Analysis Modules")
@@ -76,7 +91,7 @@ def main():
         progress = st.progress(0, text="🔍 Initializing analysis...")
         
         # Parse Resume
-        parser = ResumeParser()
+        parser = ResumeParser(track_offsets=True)
         try:
             progress.progress(20, text="📄 Parsing document...")
             file_type = uploaded_file.name.split('.')[-1]
@@ -87,25 +102,27 @@ def main():
         
         # Initialize analyzers
         progress.progress(40, text="🧠 Loading NLP engine...")
-        nlp_engine = NLPEngine(use_spacy=False)
-        ats_scorer = ATSScorer()
-        ai_detector = AIDetector()
-        job_matcher = JobMatcher()
+        nlp_engine, ats_scorer, ai_detector, job_matcher = load_analyzers()
         
         # Run analyses
         progress.progress(60, text="📊 Extracting skills...")
-        skills = nlp_engine.extract_skills(text) if run_skills else {}
+        # One skill scan feeds the badges, keyword scoring, job matching and highlighting
+        skill_mentions = nlp_engine.scan_skills(text)
+        skills = skill_mentions.by_category() if run_skills else {}
         text_quality = nlp_engine.analyze_text_quality(text)
         
         progress.progress(75, text="🎯 Calculating scores...")
         role = None if target_role == "Auto-Detect" else target_role.lower().replace(' ', '_')
-        ats_results = ats_scorer.calculate_score(text, role) if run_ats else {}
+        ats_results = ats_scorer.score(
+            text, role, features=parser.get_features(),
+            job_description=job_description.strip() or None, skills=skill_mentions
+        ).to_dict() if run_ats else {}
         
         progress.progress(85, text="🤖 Analyzing content...")
         ai_results = ai_detector.analyze(text) if run_ai else {}
         
         progress.progress(95, text="💼 Matching jobs...")
-        job_results = job_matcher.match(text) if run_jobs else {}
+        job_results = job_matcher.match(text, skills=skill_mentions) if run_jobs else {}
         
         progress.progress(100, text="✨ Analysis complete!")
         
@@ -191,12 +208,16 @@ def main():
                     st.plotly_chart(create_skill_radar(skills), use_container_width=True)
                 with col2:
                     st.markdown('<h3 class="section-header">🎯 Detected Skills</h3>', unsafe_allow_html=True)
+                    counts = skill_mentions.counts()
                     for category, skill_list in skills.items():
                         if skill_list:
                             cat_name = category.replace('_', ' ').title()
                             st.markdown(f'<div class="category-title">{cat_name} ({len(skill_list)})</div>', 
                                        unsafe_allow_html=True)
-                            badges = ''.join([f'<span class="skill-badge">{s}</span>' for s in skill_list[:12]])
+                            badges = ''.join([
+                                f'<span class="skill-badge">{s}' + (f' ×{counts[s]}' if counts[s] > 1 else '') + '</span>'
+                                for s in sorted(skill_list, key=lambda s: -counts[s])[:12]
+                            ])
                             st.markdown(badges, unsafe_allow_html=True)
                             st.markdown('<br>', unsafe_allow_html=True)
         
@@ -246,6 +267,18 @@ def main():
                         </div>
                         """, unsafe_allow_html=True)
         
+        # Highlighted Resume Expander
+        if run_skills or run_ai:
+            with st.expander("🖍️ Highlighted Resume"):
+                spans = []
+                if run_skills:
+                    spans += [dict(hit, **{'class': 'highlight-skill'})
+                              for hit in skill_mentions.hits()]
+                if run_ai:
+                    spans += [dict(hit, **{'class': 'highlight-ai'})
+                              for hit in ai_detector.find_phrase_spans(text)]
+                st.markdown(highlight_spans(parser.raw_text, spans), unsafe_allow_html=True)
+        
         # Text Stats Expander
         with st.expander("📈 Document Statistics"):
             cols = st.columns(5)
@@ -3,10 +3,30 @@ AI Content Detection Module
 Analyzes text to detect AI-generated content in resumes.
 """
 
+import json
 import re
 import math
-from typing import Dict, List
-from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+from collections import Counter, deque
+from itertools import chain
+
+from .matching import DATA_DIR, PhraseMatcher, popcount, text_tokens
+from .ngram_model import NGramModel
+from .sections import RESUME_SEGMENTER
+from .tables import to_table
+from .text_buffer import original_span
+
+
+_WORD_PATTERN = re.compile(r'\b[a-z]+\b')
+_TERMINATOR_PATTERN = re.compile(r'[.!?]+')
+
+
+class PhraseHits(NamedTuple):
+    """AI-style phrase and buzzword hits of one text, from a single scan."""
+    phrases: Dict[str, int]
+    verbs: Dict[str, int]
+    spans: Tuple[Tuple[str, str, int, int], ...]
 
 
 class AIDetector:
@@ -26,81 +46,496 @@ class AIDetector:
         'pioneered', 'championed', 'cultivated', 'revolutionized', 'transformed'
     ]
     
-    def __init__(self):
+    # (minimum distinct hits, score), highest first
+    PHRASE_SCORE_STEPS = [(6, 90), (4, 70), (2, 45), (1, 25), (0, 10)]
+    VERB_SCORE_STEPS = [(5, 85), (3, 60), (1, 30), (0, 10)]
+    
+    # (minimum probability, confidence, verdict), highest first
+    VERDICTS = [
+        (70, 'High', 'Likely AI-Generated'),
+        (45, 'Medium', 'Possibly AI-Assisted'),
+        (25, 'Low', 'Mixed Human/AI'),
+        (0, 'Low', 'Likely Human-Written')
+    ]
+    
+    # Raw features behind the scores, as returned by ``features``; ratios are
+    # NaN when the text has no words or no comparable sentences
+    FEATURES = ['phrase_count', 'verb_count', 'ttr', 'max_start_ratio', 'word_count', 'sentence_count']
+    
+    def __init__(self, phrases: Optional[Sequence[str]] = None, verbs: Optional[Sequence[str]] = None,
+                 language_model: Optional[NGramModel] = None, language_model_weight: float = 0.3,
+                 calibrator=None):
+        """
+        Initialize the detector.
+        
+        Args:
+            phrases: AI-style phrases (defaults to ``AI_PHRASES``; see
+                ``load_ai_lexicon`` for a larger lexicon from a data file)
+            verbs: Overused verbs (defaults to ``OVERUSED_VERBS``)
+            language_model: Trained n-gram model (see ``NGramModel.load``);
+                its probability is blended into ``ai_probability``
+            language_model_weight: Share of the language model in the blend
+            calibrator: Streaming ``FeatureCalibrator``; every analyzed text
+                is added to its population and gets a
+                'calibrated_probability' against it
+        """
         self.analysis_results = {}
+        self.calibrator = calibrator
+        self.language_model = language_model
+        self.language_model_weight = language_model_weight
+        self.phrases = list(phrases) if phrases is not None else self.AI_PHRASES
+        self.verbs = list(verbs) if verbs is not None else self.OVERUSED_VERBS
+        if self.phrases is AIDetector.AI_PHRASES and self.verbs is AIDetector.OVERUSED_VERBS:
+            self._matcher = _DEFAULT_PHRASE_MATCHER
+        else:
+            self._matcher = _compile_lexicon(self.phrases, self.verbs)
+        self._phrase_mask = (1 << len(self.phrases)) - 1
     
     def analyze(self, text: str) -> Dict:
         """Analyze text for AI-generated content."""
-        text_lower = text.lower()
+        self.analysis_results = self._analyze(text)
+        if self.calibrator is not None:
+            np = _require_numpy()
+            features = np.array([self.features(text)], dtype=np.float64)
+            self.calibrator.update(features, self.FEATURES)
+            probability = self.calibrator.calibrated_probability(features, self.FEATURES)[0]
+            self.analysis_results['calibrated_probability'] = round(float(probability), 1)
+        return self.analysis_results
+    
+    def _analyze(self, text: str) -> Dict:
+        hits = self.scan(text)
+        words = self._words(text.lower())
+        starts = self._sentence_starts(text)
+        
+        return self.result_from_counts(
+            list(hits.phrases), list(hits.verbs), len(words), len(set(words)),
+            len(starts), max(Counter(starts).values()) if starts else 0,
+            self.language_model_score(text)
+        )
+    
+    def analyze_windows(self, text: str, window: int = 100, step: Optional[int] = None) -> Dict:
+        """
+        Score the text in sliding word windows in one streaming pass.
+        
+        Words, phrase hits and sentence starts enter and leave the window
+        as it moves, with type/token, phrase and first-word counts kept up
+        to date, so the cost is linear in the text length. Each window is
+        scored like a whole document.
+        
+        Args:
+            text: Resume text content
+            window: Window length in words
+            step: Words the window advances by (defaults to half a window)
+            
+        Returns:
+            Dictionary with the per-window results (character span, word
+            count and the ``analyze`` fields), the aggregate result over the
+            whole text (equal to ``analyze``) and the peak window probability
+        """
+        step = step or max(window // 2, 1)
+        if window < 1 or not 0 < step <= window:
+            raise ValueError("window must be positive and step between 1 and window")
+        
+        phrase_count = len(self.phrases)
+        hits = iter(self._matcher.finditer(text))
+        sentences = self._iter_sentences(text)
+        next_hit = next(hits, None)
+        next_sentence = next(sentences, None)
+        
+        # Current window contents and counts, and totals over the whole text
+        words, window_hits, window_sentences = deque(), deque(), deque()
+        word_counts, hit_counts, start_counts = Counter(), Counter(), Counter()
+        all_words, all_hits, all_starts = Counter(), set(), Counter()
+        windows = []
+        covered = 0
+        index = 0
+        
+        def emit():
+            found = sorted(hit_counts)
+            start, end = (words[0][0], words[-1][1]) if words else (0, len(text))
+            result = self.result_from_counts(
+                [self.phrases[i] for i in found if i < phrase_count],
+                [self.verbs[i - phrase_count] for i in found if i >= phrase_count],
+                len(words), len(word_counts),
+                sum(start_counts.values()), max(start_counts.values(), default=0),
+                self.language_model_score(text[start:end])
+            )
+            start, end = original_span(text, start, end)
+            windows.append({'start': start, 'end': end, 'words': len(words), **result})
+        
+        def admit(limit):
+            nonlocal next_hit, next_sentence
+            while next_hit is not None and next_hit[1] < limit:
+                window_hits.append((next_hit[1], next_hit[0]))
+                hit_counts[next_hit[0]] += 1
+                all_hits.add(next_hit[0])
+                next_hit = next(hits, None)
+            while next_sentence is not None and next_sentence[0] < limit:
+                window_sentences.append(next_sentence)
+                start_counts[next_sentence[1]] += 1
+                all_starts[next_sentence[1]] += 1
+                next_sentence = next(sentences, None)
+        
+        for match in _WORD_PATTERN.finditer(text.lower()):
+            word = match.group()
+            words.append((match.start(), match.end(), word))
+            word_counts[word] += 1
+            all_words[word] += 1
+            admit(match.end())
+            index += 1
+            
+            if len(words) == window:
+                emit()
+                covered = index
+                for _ in range(step):
+                    _, _, old = words.popleft()
+                    word_counts[old] -= 1
+                    if not word_counts[old]:
+                        del word_counts[old]
+                first = words[0][0] if words else match.end()
+                for queue, counts, key in ((window_hits, hit_counts, 1), (window_sentences, start_counts, 1)):
+                    while queue and queue[0][0] < first:
+                        item = queue.popleft()[key]
+                        counts[item] -= 1
+                        if not counts[item]:
+                            del counts[item]
+        
+        # Hits and sentences after the last word belong to the last window
+        admit(len(text) + 1)
+        if index > covered or not windows:
+            emit()
+        
+        aggregate = self.result_from_counts(
+            [self.phrases[i] for i in sorted(all_hits) if i < phrase_count],
+            [self.verbs[i - phrase_count] for i in sorted(all_hits) if i >= phrase_count],
+            sum(all_words.values()), len(all_words),
+            sum(all_starts.values()), max(all_starts.values(), default=0),
+            self.language_model_score(text)
+        )
+        return {
+            'windows': windows,
+            'aggregate': aggregate,
+            'peak_probability': max(w['ai_probability'] for w in windows)
+        }
+    
+    def analyze_sections(self, text: str) -> Dict:
+        """
+        Score every resume section separately.
+        
+        Args:
+            text: Resume text content
+            
+        Returns:
+            Dictionary with one result per section (name, character span
+            and the ``analyze`` fields) and the aggregate result
+        """
+        sections = []
+        for section in RESUME_SEGMENTER.segment(text):
+            start, end = original_span(text, section.start, section.end)
+            sections.append({'section': section.name, 'start': start, 'end': end,
+                             **self._analyze(text[section.start:section.end])})
+        return {'sections': sections, 'aggregate': self._analyze(text)}
+    
+    def features(self, text: str) -> Tuple[int, int, float, float, int, int]:
+        """
+        Raw detector features of a text (see ``FEATURES``).
+        
+        The words counted for the type/token ratio are the all-letter
+        tokens, found with one regular expression search as in ``analyze``;
+        phrases and verbs are then only looked up where one starts with one
+        of those words (see ``PhraseMatcher.sparse_hits``).
+        """
+        words = self._words(text.lower())
+        unique = set(words)
+        mask = self._matcher.sparse_hits(text, unique)
+        starts = [sentence.split(None, 1)[0].lower()
+                  for sentence in map(str.strip, _TERMINATOR_PATTERN.split(text)) if len(sentence) > 20]
+        return (
+            popcount(mask & self._phrase_mask),
+            popcount(mask >> len(self.phrases)),
+            len(unique) / len(words) if words else math.nan,
+            max(Counter(starts).values()) / len(starts) if starts else math.nan,
+            len(words),
+            len(starts)
+        )
+    
+    def extract_features_batch(self, texts: Sequence[str]):
+        """
+        Raw features of many texts.
+        
+        Returns:
+            float64 array of shape (len(texts), len(FEATURES))
+        """
+        np = _require_numpy()
+        features = np.empty((len(texts), len(self.FEATURES)), dtype=np.float64)
+        for row, text in enumerate(texts):
+            features[row] = self.features(text)
+        return features
+    
+    def analyze_batch(self, texts: Sequence[str], calibrator=None):
+        """
+        Analyze many texts at once.
+        
+        Features are extracted per text; the scores, probability and
+        verdict are then computed for all texts together as NumPy array
+        operations, with the same results as ``analyze``. Flags are not
+        generated here.
         
-        phrase_score = self._check_ai_phrases(text_lower)
-        verb_score = self._check_overused_verbs(text_lower)
-        ttr_score = self._calculate_ttr(text)
-        repetition_score = self._check_repetition(text)
+        Args:
+            texts: Resume texts
+            calibrator: ``FeatureCalibrator`` (defaults to the detector's
+                own); the texts are added to its population in one update,
+                as ``analyze`` would add them one by one, and a
+                'calibrated_probability' column ranks every text against it
+            
+        Returns:
+            pandas DataFrame with one row per text: the raw features,
+            detailed scores, ai_probability, confidence and verdict (a NumPy
+            record array if pandas is not installed)
+        """
+        np = _require_numpy()
+        features = self.extract_features_batch(texts)
+        result = {name: features[:, index] for index, name in enumerate(self.FEATURES)}
+        scores = self.score_features(np, result)
+        probability = (scores['ai_phrases'] * 0.3 + scores['overused_verbs'] * 0.2 +
+                       (100 - scores['vocabulary_diversity']) * 0.25 + scores['repetition'] * 0.25)
+        if self.language_model is not None:
+            scores['language_model'] = self.language_model.probabilities(texts)
+            weight = self.language_model_weight
+            probability = probability * (1 - weight) + scores['language_model'] * weight
+        probability = np.clip(probability, 0, 100)
+        
+        for name in ('phrase_count', 'verb_count', 'word_count', 'sentence_count'):
+            result[name] = result[name].astype(np.int64)
+        result.update({name: np.round(score, 1) for name, score in scores.items()})
+        result['ai_probability'] = np.round(probability, 1)
+        # Probability floors are descending: count how many the text misses
+        step = (probability[:, None] < np.array([floor for floor, _, _ in self.VERDICTS])[None, :]).sum(axis=1)
+        step = np.minimum(step, len(self.VERDICTS) - 1)
+        result['confidence'] = np.array([confidence for _, confidence, _ in self.VERDICTS])[step]
+        result['verdict'] = np.array([verdict for _, _, verdict in self.VERDICTS])[step]
+        if calibrator is None:
+            calibrator = self.calibrator
+        if calibrator is not None:
+            calibrator.update(features, self.FEATURES)
+            result['calibrated_probability'] = np.round(calibrator.calibrated_probability(features, self.FEATURES), 1)
+        return to_table(np, result)
+    
+    def score_features(self, np, columns: Dict) -> Dict:
+        """Detailed scores of feature columns (as in ``analyze``), as arrays."""
+        words = columns['word_count']
+        sentences = columns['sentence_count']
+        with np.errstate(invalid='ignore'):
+            ttr_score = np.clip((columns['ttr'] - 0.3) / 0.4 * 100, 0, 100)
+            repetition_score = np.minimum(columns['max_start_ratio'] * 100, 100)
+        return {
+            'ai_phrases': self._vector_steps(np, columns['phrase_count'], self.PHRASE_SCORE_STEPS),
+            'overused_verbs': self._vector_steps(np, columns['verb_count'], self.VERB_SCORE_STEPS),
+            'vocabulary_diversity': np.where(words < 50, 50.0, ttr_score),
+            'repetition': np.where(sentences < 5, 30.0, repetition_score)
+        }
+    
+    @staticmethod
+    def _vector_steps(np, found, steps):
+        return np.select([found >= low for low, _ in steps], [score for _, score in steps]).astype(np.float64)
+    
+    def scan(self, text: str) -> PhraseHits:
+        """
+        Find all AI-style phrases and overused verbs in one pass.
+        
+        Args:
+            text: Resume text content
+            
+        Returns:
+            PhraseHits with occurrence counts (in lexicon order) and the
+            (term, type, start, end) span of every hit in text order
+        """
+        phrase_count = len(self.phrases)
+        counts = Counter()
+        spans = []
+        for term_id, start, end in self._matcher.finditer(text):
+            counts[term_id] += 1
+            if term_id < phrase_count:
+                spans.append((self.phrases[term_id], 'phrase', start, end))
+            else:
+                spans.append((self.verbs[term_id - phrase_count], 'verb', start, end))
+        
+        return PhraseHits(
+            phrases={p: counts[i] for i, p in enumerate(self.phrases) if i in counts},
+            verbs={v: counts[phrase_count + i] for i, v in enumerate(self.verbs) if phrase_count + i in counts},
+            spans=tuple(sorted(spans, key=lambda span: span[2]))
+        )
+    
+    def hit_ids(self, text: str) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        """Indices of the phrases and of the verbs present in the text."""
+        mask = self._matcher.hits(text)
+        phrase_count = len(self.phrases)
+        phrase_ids = tuple(i for i in range(phrase_count) if mask >> i & 1)
+        verb_ids = tuple(i for i in range(len(self.verbs)) if mask >> (phrase_count + i) & 1)
+        return phrase_ids, verb_ids
+    
+    def language_model_score(self, text: str) -> Optional[float]:
+        """Language model probability (0-100) of the text, or None without a model."""
+        if self.language_model is None:
+            return None
+        return self.language_model.probability(text)
+    
+    def result_from_counts(self, phrases_found: List[str], verbs_found: List[str],
+                           word_count: int, unique_words: int,
+                           sentence_count: int, max_same_start: int,
+                           language_model_score: Optional[float] = None) -> Dict:
+        """
+        Build the analysis result from counts taken over the whole text.
+        
+        Args:
+            phrases_found: AI-style phrases present (in lexicon order)
+            verbs_found: Overused verbs present (in lexicon order)
+            word_count: Number of words (``_words``)
+            unique_words: Number of distinct words
+            sentence_count: Number of sentences long enough to compare
+            max_same_start: Most sentences starting with the same word
+            language_model_score: ``language_model_score`` of the text
+            
+        Returns:
+            Analysis result dictionary (as returned by ``analyze``)
+        """
+        phrase_score = self._phrase_score(len(phrases_found))
+        verb_score = self._verb_score(len(verbs_found))
+        ttr_score = self._ttr_score(word_count, unique_words)
+        repetition_score = self._repetition_score(sentence_count, max_same_start)
         
         ai_probability = (phrase_score * 0.3 + verb_score * 0.2 + 
                          (100 - ttr_score) * 0.25 + repetition_score * 0.25)
+        detailed_scores = {
+            'ai_phrases': round(phrase_score, 1),
+            'overused_verbs': round(verb_score, 1),
+            'vocabulary_diversity': round(ttr_score, 1),
+            'repetition': round(repetition_score, 1)
+        }
+        if language_model_score is not None:
+            weight = self.language_model_weight
+            ai_probability = ai_probability * (1 - weight) + language_model_score * weight
+            detailed_scores['language_model'] = round(language_model_score, 1)
         ai_probability = max(0, min(100, ai_probability))
         
-        self.analysis_results = {
+        return {
             'ai_probability': round(ai_probability, 1),
             'confidence': self._get_confidence(ai_probability),
             'verdict': self._get_verdict(ai_probability),
-            'detailed_scores': {
-                'ai_phrases': round(phrase_score, 1),
-                'overused_verbs': round(verb_score, 1),
-                'vocabulary_diversity': round(ttr_score, 1),
-                'repetition': round(repetition_score, 1)
-            },
-            'flags': self._get_flags(text_lower)
+            'detailed_scores': detailed_scores,
+            'flags': self._flags(phrases_found, verbs_found)
         }
-        return self.analysis_results
     
-    def _check_ai_phrases(self, text: str) -> float:
-        found = sum(1 for p in self.AI_PHRASES if p in text)
-        if found >= 6: return 90
-        elif found >= 4: return 70
-        elif found >= 2: return 45
-        elif found >= 1: return 25
-        return 10
-    
-    def _check_overused_verbs(self, text: str) -> float:
-        found = sum(1 for v in self.OVERUSED_VERBS if v in text)
-        if found >= 5: return 85
-        elif found >= 3: return 60
-        elif found >= 1: return 30
-        return 10
+    @staticmethod
+    def _words(text_lower: str) -> List[str]:
+        return _WORD_PATTERN.findall(text_lower)
+    
+    @classmethod
+    def _sentence_starts(cls, text: str) -> List[str]:
+        """First word of every sentence long enough to compare."""
+        return [word for _, word in cls._iter_sentences(text)]
+    
+    @staticmethod
+    def _iter_sentences(text: str) -> Iterator[Tuple[int, str]]:
+        """Yield (start offset, lowercase first word) of every sentence long enough to compare."""
+        start = 0
+        for match in chain(_TERMINATOR_PATTERN.finditer(text), [None]):
+            end = match.start() if match is not None else len(text)
+            sentence = text[start:end].strip()
+            if len(sentence) > 20:
+                yield text.index(sentence[0], start), sentence.split(None, 1)[0].lower()
+            if match is not None:
+                start = match.end()
+    
+    def _phrase_score(self, found: int) -> float:
+        return next(score for low, score in self.PHRASE_SCORE_STEPS if found >= low)
+    
+    def _verb_score(self, found: int) -> float:
+        return next(score for low, score in self.VERB_SCORE_STEPS if found >= low)
     
     def _calculate_ttr(self, text: str) -> float:
-        words = re.findall(r'\b[a-z]+\b', text.lower())
-        if len(words) < 50: return 50
-        ttr = len(set(words)) / len(words)
+        words = self._words(text.lower())
+        return self._ttr_score(len(words), len(set(words)))
+    
+    def _ttr_score(self, word_count: int, unique_words: int) -> float:
+        if word_count < 50: return 50
+        ttr = unique_words / word_count
         return max(0, min(100, (ttr - 0.3) / 0.4 * 100))
     
     def _check_repetition(self, text: str) -> float:
-        sentences = [s.strip() for s in re.split(r'[.!?]+', text) if len(s.strip()) > 20]
-        if len(sentences) < 5: return 30
-        starts = [s.split()[0].lower() for s in sentences if s.split()]
-        max_same = max(Counter(starts).values()) if starts else 0
-        return min(100, (max_same / len(sentences)) * 100)
+        starts = self._sentence_starts(text)
+        return self._repetition_score(len(starts), max(Counter(starts).values()) if starts else 0)
+    
+    def _repetition_score(self, sentence_count: int, max_same_start: int) -> float:
+        if sentence_count < 5: return 30
+        return min(100, (max_same_start / sentence_count) * 100)
     
     def _get_confidence(self, prob: float) -> str:
-        if prob >= 70: return "High"
-        elif prob >= 45: return "Medium"
-        return "Low"
+        return next((confidence for low, confidence, _ in self.VERDICTS if prob >= low), self.VERDICTS[-1][1])
     
     def _get_verdict(self, prob: float) -> str:
-        if prob >= 70: return "Likely AI-Generated"
-        elif prob >= 45: return "Possibly AI-Assisted"
-        elif prob >= 25: return "Mixed Human/AI"
-        return "Likely Human-Written"
+        return next((verdict for low, _, verdict in self.VERDICTS if prob >= low), self.VERDICTS[-1][2])
+    
+    def find_phrase_spans(self, text: str) -> List[Dict]:
+        """Locate AI-style phrases and buzzwords, with spans in the original text."""
+        hits = []
+        for term, kind, start, end in self.scan(text).spans:
+            start, end = original_span(text, start, end)
+            hits.append({'term': term, 'type': kind, 'start': start, 'end': end})
+        return hits
     
-    def _get_flags(self, text: str) -> List[str]:
+    def _flags(self, ai_found: List[str], verb_found: List[str]) -> List[str]:
         flags = []
-        ai_found = [p for p in self.AI_PHRASES if p in text]
         if ai_found:
             flags.append(f"Found {len(ai_found)} AI-style phrases")
-        verb_found = [v for v in self.OVERUSED_VERBS if v in text]
         if len(verb_found) >= 3:
             flags.append(f"Overused buzzwords: {', '.join(verb_found[:3])}")
         return flags
+
+
+def _require_numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("numpy is required for batch analysis. Install with: pip install numpy")
+    return np
+
+
+def _compile_lexicon(phrases: Sequence[str], verbs: Sequence[str]) -> PhraseMatcher:
+    """One matcher for phrases (ids from 0) and verbs (ids after the phrases)."""
+    terms = {}
+    for term_id, term in enumerate(list(phrases) + list(verbs)):
+        terms.setdefault(term, term_id)
+    return PhraseMatcher(terms)
+
+
+# Matcher for the built-in lexicon, compiled once and shared (read-only)
+_DEFAULT_PHRASE_MATCHER = _compile_lexicon(AIDetector.AI_PHRASES, AIDetector.OVERUSED_VERBS)
+
+
+def load_ai_lexicon(path: Union[str, Path, None] = None) -> Tuple[List[str], List[str]]:
+    """
+    Load an AI phrase lexicon from a JSON file, merged with the built-in one.
+    
+    Args:
+        path: JSON file with 'phrases' and 'overused_verbs' lists (defaults
+            to ``data/ai_phrases.json``)
+        
+    Returns:
+        Tuple of (phrases, verbs), for ``AIDetector(phrases, verbs)``
+    """
+    path = Path(path) if path is not None else DATA_DIR / 'ai_phrases.json'
+    with open(path, encoding='utf-8') as f:
+        lexicon = json.load(f)
+    
+    merged = []
+    for base, extra in ((AIDetector.AI_PHRASES, lexicon.get('phrases', [])),
+                        (AIDetector.OVERUSED_VERBS, lexicon.get('overused_verbs', []))):
+        terms = list(base)
+        known = {term.lower() for term in terms}
+        for term in extra:
+            if term.lower() not in known:
+                terms.append(term)
+                known.add(term.lower())
+        merged.append(terms)
+    return merged[0], merged[1]
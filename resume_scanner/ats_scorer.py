@@ -3,14 +3,201 @@ ATS Scorer Module
 Calculates ATS (Applicant Tracking System) compatibility scores.
 """
 
+import json
 import re
-from typing import Dict, List, Tuple, Optional
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple, Optional, NamedTuple, Sequence, Set, Union
 from collections import Counter
 
+from .features import LexicalFeatures, scan_features
+from .job_description import JobDescription, get_job_description
+from .matching import DATA_DIR, KeywordSetMatcher
+from .sections import SectionSegmenter
+from .skill_mentions import SkillMentions
+from .tables import to_table
+from .text_buffer import split_words
+
+
+class ATSSignals(NamedTuple):
+    """Raw measurements of one resume from which scores and feedback are derived."""
+    role: str
+    missing_required: Tuple[str, ...]
+    optional_found: int
+    special_chars: int
+    bullet_types: int
+    all_caps_words: int
+    has_table: bool
+    keywords_found: int
+    keywords_total: int
+    missing_keywords: Tuple[str, ...]
+    word_count: int
+    sentence_count: int
+    passive_count: int
+    has_email: bool
+    has_phone: bool
+    mentions_linkedin: bool
+    mentions_portfolio: bool
+
+
+class ATSResult(NamedTuple):
+    """Immutable ATS scoring result; feedback and suggestions are derived on demand."""
+    total: float
+    sections: float
+    formatting: float
+    keywords: float
+    length: float
+    readability: float
+    contact: float
+    grade: str
+    pass_ats: bool
+    signals: ATSSignals
+    
+    @property
+    def scores(self) -> Dict[str, float]:
+        """Rounded total and component scores."""
+        return {name: getattr(self, name) for name in ('total',) + tuple(ATSScorer.COMPONENTS)}
+    
+    @property
+    def feedback(self) -> List[str]:
+        """Feedback messages for this result."""
+        return ATSScorer.feedback_from_signals(self.signals)
+    
+    def improvement_suggestions(self) -> List[str]:
+        """Prioritized list of improvements for this result."""
+        return ATSScorer.suggestions_from_scores(self.scores)
+    
+    def to_dict(self) -> Dict:
+        """Dictionary in the format returned by ``ATSScorer.calculate_score``."""
+        return {
+            'scores': self.scores,
+            'feedback': self.feedback,
+            'grade': self.grade,
+            'pass_ats': self.pass_ats
+        }
+    
+    def compact(self) -> 'CompactATSResult':
+        """Packed copy for holding many results in memory."""
+        return CompactATSResult.from_result(self)
+
+
+class CompactATSResult:
+    """
+    ATSResult packed for holding many results in memory (e.g. for ranking).
+    
+    Scores (in tenths of a point), grade and all numeric measurements are
+    packed into one bytes value, the role is an interned string and missing
+    keywords are a bitmask over the role's built-in keyword list, so a
+    result takes about a tenth of the memory of ``to_dict()``. Feedback and
+    suggestions are generated on demand from the unpacked ATSResult.
+    """
+    
+    __slots__ = ('_packed', 'role', '_missing_keywords')
+    
+    # total and components, grade index, flags, missing-section mask, then the ATSSignals counts
+    LAYOUT = struct.Struct('<7hBBBBIHIHHIII')
+    
+    # Flag bits of the booleans
+    FLAGS = ('pass_ats', 'has_table', 'has_email', 'has_phone', 'mentions_linkedin', 'mentions_portfolio')
+    
+    def __init__(self, packed: bytes, role: str, missing_keywords: Union[int, Tuple[str, ...]]):
+        self._packed = packed
+        self.role = role
+        self._missing_keywords = missing_keywords
+    
+    @classmethod
+    def from_result(cls, result: ATSResult) -> 'CompactATSResult':
+        """Pack an ATSResult."""
+        signals = result.signals
+        values = {'pass_ats': result.pass_ats, **signals._asdict()}
+        flags = sum(1 << bit for bit, name in enumerate(cls.FLAGS) if values[name])
+        missing_sections = sum(1 << bit for bit, section in enumerate(_REQUIRED_SECTIONS)
+                               if section in signals.missing_required)
+        packed = cls.LAYOUT.pack(
+            *(round(getattr(result, name) * 10) for name in ('total',) + tuple(ATSScorer.COMPONENTS)),
+            _GRADES.index(result.grade), flags, missing_sections, signals.optional_found,
+            signals.special_chars, signals.bullet_types, signals.all_caps_words, signals.keywords_found,
+            signals.keywords_total, signals.word_count, signals.sentence_count, signals.passive_count
+        )
+        role = sys.intern(signals.role)
+        return cls(packed, role, _pack_keywords(role, signals.missing_keywords))
+    
+    def __repr__(self) -> str:
+        return f"CompactATSResult(total={self.total}, grade={self.grade!r}, role={self.role!r})"
+    
+    @property
+    def total(self) -> float:
+        return self.LAYOUT.unpack(self._packed)[0] / 10
+    
+    @property
+    def grade(self) -> str:
+        return _GRADES[self.LAYOUT.unpack(self._packed)[7]]
+    
+    @property
+    def pass_ats(self) -> bool:
+        return bool(self.LAYOUT.unpack(self._packed)[8] & 1)
+    
+    @property
+    def scores(self) -> Dict[str, float]:
+        """Rounded total and component scores."""
+        values = self.LAYOUT.unpack(self._packed)[:7]
+        return {name: value / 10 for name, value in zip(('total',) + tuple(ATSScorer.COMPONENTS), values)}
+    
+    @property
+    def feedback(self) -> List[str]:
+        return self.expand().feedback
+    
+    def improvement_suggestions(self) -> List[str]:
+        return ATSScorer.suggestions_from_scores(self.scores)
+    
+    def to_dict(self) -> Dict:
+        """Dictionary in the format returned by ``ATSScorer.calculate_score``."""
+        return self.expand().to_dict()
+    
+    def expand(self) -> ATSResult:
+        """The full ATSResult."""
+        (total, *components, grade, flags, missing_sections, optional_found, special_chars, bullet_types,
+         all_caps_words, keywords_found, keywords_total, word_count, sentence_count,
+         passive_count) = self.LAYOUT.unpack(self._packed)
+        flag = {name: bool(flags >> bit & 1) for bit, name in enumerate(self.FLAGS)}
+        signals = ATSSignals(
+            role=self.role,
+            missing_required=tuple(section for bit, section in enumerate(_REQUIRED_SECTIONS)
+                                   if missing_sections >> bit & 1),
+            optional_found=optional_found,
+            special_chars=special_chars,
+            bullet_types=bullet_types,
+            all_caps_words=all_caps_words,
+            has_table=flag['has_table'],
+            keywords_found=keywords_found,
+            keywords_total=keywords_total,
+            missing_keywords=_unpack_keywords(self.role, self._missing_keywords),
+            word_count=word_count,
+            sentence_count=sentence_count,
+            passive_count=passive_count,
+            has_email=flag['has_email'],
+            has_phone=flag['has_phone'],
+            mentions_linkedin=flag['mentions_linkedin'],
+            mentions_portfolio=flag['mentions_portfolio']
+        )
+        return ATSResult(
+            total=total / 10,
+            grade=_GRADES[grade],
+            pass_ats=flag['pass_ats'],
+            signals=signals,
+            **{name: value / 10 for name, value in zip(ATSScorer.COMPONENTS, components)}
+        )
+
 
 class ATSScorer:
     """
     Analyzes resume for ATS compatibility and provides scoring.
+    
+    Scoring is stateless: ``score`` only reads the class-level rule tables and
+    precompiled matchers, so one instance can be shared by many threads.
+    ``calculate_score`` additionally records the last result on the instance
+    for the legacy ``get_improvement_suggestions()`` call.
     """
     
     # Critical sections that ATS systems look for
@@ -29,6 +216,9 @@ class ATSScorer:
         'publications': ['publications', 'papers', 'research']
     }
     
+    # All section keywords compiled into one scan (shared, read-only)
+    _SECTION_SEGMENTER = SectionSegmenter({**REQUIRED_SECTIONS, **OPTIONAL_SECTIONS}, flexible_spaces=False)
+    
     # Common ATS-friendly keywords by role
     ROLE_KEYWORDS = {
         'data_scientist': [
@@ -64,261 +254,499 @@ class ATSScorer:
         ]
     }
     
-    def __init__(self):
+    # Component weights of the total score
+    WEIGHTS = {
+        'sections': 0.20,
+        'formatting': 0.15,
+        'keywords': 0.25,
+        'length': 0.10,
+        'readability': 0.15,
+        'contact': 0.15
+    }
+    
+    # Formatting penalties: (signal, allowed maximum, penalty, issue)
+    FORMATTING_RULES = [
+        ('special_chars', 50, 15, "Too many special characters"),
+        ('bullet_types', 3, 10, "Inconsistent bullet point styles"),
+        ('all_caps_words', 10, 10, "Excessive use of ALL CAPS"),
+        ('has_table', 0, 15, "Table-like formatting detected (may confuse ATS)")
+    ]
+    
+    # Word count bands: (minimum, maximum, score, feedback); optimal is 400-800 words (1-2 pages)
+    LENGTH_BANDS = [
+        (400, 800, 100, "✅ Resume length is optimal"),
+        (300, 399, 80, "⚠️ Resume length is acceptable but could be adjusted"),
+        (801, 1000, 80, "⚠️ Resume length is acceptable but could be adjusted"),
+        (200, 299, 60, "⚠️ Resume might be too short - add more details"),
+        (1001, float('inf'), 60, "⚠️ Resume might be too long - consider condensing")
+    ]
+    LENGTH_DEFAULT = (40, "❌ Resume length is problematic")
+    
+    # Contact points: (signal, points, feedback when missing)
+    CONTACT_RULES = [
+        ('has_email', 30, "❌ No email address found"),
+        ('has_phone', 25, "⚠️ No phone number found"),
+        ('mentions_linkedin', 25, "💡 Consider adding LinkedIn profile"),
+        ('mentions_portfolio', 20, "💡 Consider adding GitHub or portfolio link")
+    ]
+    
+    PASSIVE_INDICATORS = {'was', 'were', 'been', 'being', 'is', 'are'}
+    
+    # Lowest total score for each grade, best first ('F' below the last)
+    GRADE_THRESHOLDS = [
+        (90, 'A+'), (85, 'A'), (80, 'A-'), (75, 'B+'), (70, 'B'), (65, 'B-'),
+        (60, 'C+'), (55, 'C'), (50, 'C-'), (45, 'D')
+    ]
+    
+    # Role reported when keywords come from a job description
+    JOB_DESCRIPTION_ROLE = 'job_description'
+    
+    COMPONENTS = ['sections', 'formatting', 'keywords', 'length', 'readability', 'contact']
+    
+    # Improvement suggestions: (component, score below which it applies, suggestion)
+    SUGGESTION_RULES = [
+        ('contact', 70, "Add complete contact information (email, phone, LinkedIn)"),
+        ('sections', 70, "Include all required sections: Experience, Education, Skills"),
+        ('keywords', 60, "Add more role-relevant keywords and technical skills"),
+        ('formatting', 70, "Simplify formatting - avoid tables, graphics, and special characters"),
+        ('readability', 70, "Improve readability - use shorter sentences and active voice")
+    ]
+    
+    def __init__(self, role_keywords: Optional[Dict[str, List[str]]] = None):
+        """
+        Initialize the scorer.
+        
+        Args:
+            role_keywords: Keywords per role (defaults to ``ROLE_KEYWORDS``;
+                see ``load_role_keywords`` to add roles from a JSON file)
+        """
         self.scores = {}
         self.feedback = []
+        self.role_keywords = self.ROLE_KEYWORDS if role_keywords is None else role_keywords
+        if self.role_keywords is ATSScorer.ROLE_KEYWORDS:
+            self._role_matcher = _DEFAULT_ROLE_MATCHER
+        else:
+            self._role_matcher = KeywordSetMatcher(self.role_keywords)
     
-    def calculate_score(self, text: str, target_role: Optional[str] = None) -> Dict:
+    def calculate_score(self, text: str, target_role: Optional[str] = None,
+                        features: Optional[LexicalFeatures] = None,
+                        job_description: Union[None, str, JobDescription] = None,
+                        skills: Optional[SkillMentions] = None) -> Dict:
         """
         Calculate comprehensive ATS score.
         
         Args:
             text: Resume text content
             target_role: Target job role for keyword matching
+            features: Lexical features already scanned for this text
+                (e.g. ``ResumeParser.get_features()``)
+            job_description: Job posting text (or a compiled JobDescription)
+                whose key terms replace the role keywords
+            skills: Skill scan of this text (``NLPEngine.scan_skills``)
             
         Returns:
             Dictionary with scores and detailed feedback
         """
-        self.feedback = []
-        text_lower = text.lower()
-        
-        # Calculate individual scores
-        section_score = self._score_sections(text_lower)
-        format_score = self._score_formatting(text)
-        keyword_score = self._score_keywords(text_lower, target_role)
-        length_score = self._score_length(text)
-        readability_score = self._score_readability(text)
-        contact_score = self._score_contact_info(text)
-        
-        # Weight the scores
-        weights = {
-            'sections': 0.20,
-            'formatting': 0.15,
-            'keywords': 0.25,
-            'length': 0.10,
-            'readability': 0.15,
-            'contact': 0.15
-        }
+        result = self.score(text, target_role, features, job_description, skills).to_dict()
+        self.scores = result['scores']
+        self.feedback = result['feedback']
+        return result
+    
+    def score(self, text: str, target_role: Optional[str] = None,
+              features: Optional[LexicalFeatures] = None,
+              job_description: Union[None, str, JobDescription] = None,
+              skills: Optional[SkillMentions] = None) -> ATSResult:
+        """
+        Score a resume without touching instance state (thread-safe).
         
-        total_score = (
-            section_score * weights['sections'] +
-            format_score * weights['formatting'] +
-            keyword_score * weights['keywords'] +
-            length_score * weights['length'] +
-            readability_score * weights['readability'] +
-            contact_score * weights['contact']
-        )
+        Args:
+            text: Resume text content
+            target_role: Target job role for keyword matching
+            features: Lexical features already scanned for this text
+            job_description: Job posting text (or a compiled JobDescription)
+                whose key terms replace the role keywords
+            skills: Skill scan of this text (``NLPEngine.scan_skills``)
+            
+        Returns:
+            Immutable ATSResult
+        """
+        return self.score_signals(self.measure(text, target_role, features, job_description, skills))
+    
+    def score_signals(self, signals: ATSSignals) -> ATSResult:
+        """
+        Score a set of measurements (e.g. aggregated by a live editing session).
         
-        self.scores = {
-            'total': round(total_score, 1),
-            'sections': round(section_score, 1),
-            'formatting': round(format_score, 1),
-            'keywords': round(keyword_score, 1),
-            'length': round(length_score, 1),
-            'readability': round(readability_score, 1),
-            'contact': round(contact_score, 1)
-        }
+        Args:
+            signals: Measurements from ``measure``
+            
+        Returns:
+            Immutable ATSResult
+        """
+        components = self._component_scores(signals)
+        total_score = sum(components[name] * weight for name, weight in self.WEIGHTS.items())
+        
+        return ATSResult(
+            total=round(total_score, 1),
+            grade=self._get_grade(total_score),
+            pass_ats=total_score >= 60,
+            signals=signals,
+            **{name: round(score, 1) for name, score in components.items()}
+        )
+    
+    def measure(self, text: str, target_role: Optional[str] = None,
+                features: Optional[LexicalFeatures] = None,
+                job_description: Union[None, str, JobDescription] = None,
+                skills: Optional[SkillMentions] = None) -> ATSSignals:
+        """
+        Take all raw measurements needed for scoring in one go.
         
+        Args:
+            text: Resume text content
+            target_role: Target job role for keyword matching (auto-detected if omitted)
+            features: Lexical features already scanned for this text
+            job_description: Job posting text (or a compiled JobDescription);
+                its key terms are the keyword targets instead of the role's.
+                Postings are compiled once and cached by content hash.
+            skills: Skill scan of this text (``NLPEngine.scan_skills``);
+                keywords that are taxonomy skills (or their aliases) are
+                read from it instead of searching the text
+            
+        Returns:
+            ATSSignals record
+        """
+        if features is None:
+            features = scan_features(text)
+        
+        present = self._SECTION_SEGMENTER.present(text)
+        if job_description is not None:
+            job_description = get_job_description(job_description)
+        # One scan gives the role x keyword hit bitmap used for both role
+        # detection and keyword matching
+        keyword_hits = self.keyword_hits(text, self.keyword_matcher(job_description), skills)
+        role, found_keywords, missing_keywords = self.split_keywords(keyword_hits, target_role, job_description)
+        
+        words = split_words(text)
+        sentences = [s for s in re.split(r'[.!?]+', text) if s.strip()]
+        
+        return self.assemble_signals(
+            role, present, found_keywords, missing_keywords, features, len(words), len(sentences),
+            sum(1 for w in words if w.lower() in self.PASSIVE_INDICATORS)
+        )
+    
+    def assemble_signals(self, role: str, present: Set[str], found_keywords: List[str],
+                         missing_keywords: List[str], features: LexicalFeatures,
+                         word_count: int, sentence_count: int, passive_count: int) -> ATSSignals:
+        """Build the ATSSignals record from counts taken over the whole text."""
+        return ATSSignals(
+            role=role,
+            missing_required=tuple(s for s in self.REQUIRED_SECTIONS if s not in present),
+            optional_found=sum(1 for s in self.OPTIONAL_SECTIONS if s in present),
+            special_chars=features.special_chars,
+            bullet_types=features.bullet_types,
+            all_caps_words=features.all_caps_words,
+            has_table=features.has_table,
+            keywords_found=len(found_keywords),
+            keywords_total=len(found_keywords) + len(missing_keywords),
+            missing_keywords=tuple(missing_keywords),
+            word_count=word_count,
+            sentence_count=sentence_count,
+            passive_count=passive_count,
+            has_email=features.email is not None,
+            has_phone=features.phone is not None,
+            mentions_linkedin=features.mentions_linkedin,
+            mentions_portfolio=features.mentions_portfolio
+        )
+    
+    def _component_scores(self, signals: ATSSignals) -> Dict[str, float]:
+        """Score each component from the raw measurements."""
         return {
-            'scores': self.scores,
-            'feedback': self.feedback,
-            'grade': self._get_grade(total_score),
-            'pass_ats': total_score >= 60
+            'sections': self._score_sections(signals),
+            'formatting': self._score_formatting(signals),
+            'keywords': self._score_keywords(signals),
+            'length': self._score_length(signals),
+            'readability': self._score_readability(signals),
+            'contact': self._score_contact_info(signals)
         }
     
-    def _score_sections(self, text: str) -> float:
+    def _score_sections(self, signals: ATSSignals) -> float:
         """Score based on presence of required and optional sections."""
-        score = 0
-        max_score = 100
-        
-        # Required sections (60 points total)
-        required_found = 0
-        for section, keywords in self.REQUIRED_SECTIONS.items():
-            found = any(kw in text for kw in keywords)
-            if found:
-                required_found += 1
-            else:
-                self.feedback.append(f"⚠️ Missing required section: {section.title()}")
-        
-        score += (required_found / len(self.REQUIRED_SECTIONS)) * 60
-        
-        # Optional sections (40 points total)
-        optional_found = 0
-        for section, keywords in self.OPTIONAL_SECTIONS.items():
-            found = any(kw in text for kw in keywords)
-            if found:
-                optional_found += 1
-        
-        score += (optional_found / len(self.OPTIONAL_SECTIONS)) * 40
-        
-        if required_found == len(self.REQUIRED_SECTIONS):
-            self.feedback.append("✅ All required sections present")
-        
-        return min(score, max_score)
+        required_found = len(self.REQUIRED_SECTIONS) - len(signals.missing_required)
+        # Required sections (60 points total), optional sections (40 points total)
+        score = (required_found / len(self.REQUIRED_SECTIONS)) * 60
+        score += (signals.optional_found / len(self.OPTIONAL_SECTIONS)) * 40
+        return min(score, 100)
     
-    def _score_formatting(self, text: str) -> float:
+    def _score_formatting(self, signals: ATSSignals) -> float:
         """Score based on formatting quality."""
         score = 100
-        
-        # Check for problematic formatting
-        issues = []
-        
-        # Too many special characters
-        special_chars = len(re.findall(r'[^\w\s\.\,\;\:\-\+\@\#\(\)\/\&]', text))
-        if special_chars > 50:
-            score -= 15
-            issues.append("Too many special characters")
-        
-        # Check for consistent use of bullet points
-        bullet_patterns = [r'•', r'○', r'■', r'►', r'\*', r'-']
-        bullet_types = sum(1 for p in bullet_patterns if re.search(p, text))
-        if bullet_types > 3:
-            score -= 10
-            issues.append("Inconsistent bullet point styles")
-        
-        # Check for all caps abuse
-        all_caps_words = len(re.findall(r'\b[A-Z]{5,}\b', text))
-        if all_caps_words > 10:
-            score -= 10
-            issues.append("Excessive use of ALL CAPS")
-        
-        # Check for tables/graphics indicators (ATS struggle with these)
-        if re.search(r'\|.*\|.*\|', text):
-            score -= 15
-            issues.append("Table-like formatting detected (may confuse ATS)")
-        
-        if not issues:
-            self.feedback.append("✅ Good formatting for ATS compatibility")
-        else:
-            for issue in issues:
-                self.feedback.append(f"⚠️ {issue}")
-        
+        for signal, limit, penalty, _ in self.FORMATTING_RULES:
+            if getattr(signals, signal) > limit:
+                score -= penalty
         return max(score, 0)
     
-    def _score_keywords(self, text: str, target_role: Optional[str] = None) -> float:
+    def _score_keywords(self, signals: ATSSignals) -> float:
         """Score based on relevant keyword density."""
-        if not target_role:
-            # Auto-detect role
-            target_role = self._detect_role(text)
-        
-        target_role = target_role.lower().replace(' ', '_').replace('-', '_')
-        
-        if target_role not in self.ROLE_KEYWORDS:
-            # Default to data scientist if role not found
-            target_role = 'data_scientist'
-        
-        keywords = self.ROLE_KEYWORDS[target_role]
-        found_keywords = []
-        missing_keywords = []
-        
-        for keyword in keywords:
-            if keyword.lower() in text:
-                found_keywords.append(keyword)
-            else:
-                missing_keywords.append(keyword)
-        
-        score = (len(found_keywords) / len(keywords)) * 100
-        
-        if found_keywords:
-            self.feedback.append(f"✅ Found {len(found_keywords)}/{len(keywords)} role-relevant keywords")
-        
-        if missing_keywords[:5]:  # Show top 5 missing
-            self.feedback.append(f"💡 Consider adding keywords: {', '.join(missing_keywords[:5])}")
-        
-        return score
+        return (signals.keywords_found / max(signals.keywords_total, 1)) * 100
     
-    def _score_length(self, text: str) -> float:
+    def _score_length(self, signals: ATSSignals) -> float:
         """Score based on resume length."""
-        word_count = len(text.split())
-        
-        # Optimal range: 400-800 words (1-2 pages)
-        if 400 <= word_count <= 800:
-            score = 100
-            self.feedback.append("✅ Resume length is optimal")
-        elif 300 <= word_count < 400 or 800 < word_count <= 1000:
-            score = 80
-            self.feedback.append("⚠️ Resume length is acceptable but could be adjusted")
-        elif 200 <= word_count < 300:
-            score = 60
-            self.feedback.append("⚠️ Resume might be too short - add more details")
-        elif word_count > 1000:
-            score = 60
-            self.feedback.append("⚠️ Resume might be too long - consider condensing")
-        else:
-            score = 40
-            self.feedback.append("❌ Resume length is problematic")
-        
-        return score
+        for low, high, score, _ in self.LENGTH_BANDS:
+            if low <= signals.word_count <= high:
+                return score
+        return self.LENGTH_DEFAULT[0]
     
-    def _score_readability(self, text: str) -> float:
+    def _score_readability(self, signals: ATSSignals) -> float:
         """Score based on text readability."""
-        score = 100
-        
-        words = text.split()
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
-        if not sentences:
+        if not signals.sentence_count:
             return 50
         
-        avg_sentence_length = len(words) / len(sentences)
+        score = 100
+        avg_sentence_length = signals.word_count / signals.sentence_count
         
         # Optimal sentence length: 15-25 words
         if avg_sentence_length > 30:
             score -= 20
-            self.feedback.append("⚠️ Sentences are too long - break them up")
         elif avg_sentence_length < 10:
             score -= 10
-            self.feedback.append("⚠️ Sentences might be too short")
         
-        # Check for passive voice indicators
-        passive_indicators = ['was', 'were', 'been', 'being', 'is', 'are']
-        passive_count = sum(1 for w in words if w.lower() in passive_indicators)
-        passive_ratio = passive_count / max(len(words), 1)
-        
-        if passive_ratio > 0.05:
+        # Passive voice indicators
+        if signals.passive_count / max(signals.word_count, 1) > 0.05:
             score -= 10
-            self.feedback.append("💡 Consider using more active voice")
         
         return max(score, 0)
     
-    def _score_contact_info(self, text: str) -> float:
+    def _score_contact_info(self, signals: ATSSignals) -> float:
         """Score based on contact information completeness."""
-        score = 0
+        score = sum(points for signal, points, _ in self.CONTACT_RULES if getattr(signals, signal))
+        return min(score, 100)
+    
+    @classmethod
+    def feedback_from_signals(cls, signals: ATSSignals) -> List[str]:
+        """
+        Generate the feedback messages for a set of measurements.
         
-        # Email
-        if re.search(r'[\w\.-]+@[\w\.-]+\.\w+', text):
-            score += 30
-        else:
-            self.feedback.append("❌ No email address found")
+        Args:
+            signals: Measurements from ``measure`` (or a row of
+                ``calculate_score_batch`` output, which has the same fields)
+            
+        Returns:
+            Feedback strings in component order
+        """
+        feedback = []
         
-        # Phone
-        if re.search(r'[\+]?[(]?[0-9]{1,3}[)]?[-\s\.]?[0-9]{3,4}[-\s\.]?[0-9]{4,6}', text):
-            score += 25
-        else:
-            self.feedback.append("⚠️ No phone number found")
+        # Sections
+        for section in signals.missing_required:
+            feedback.append(f"⚠️ Missing required section: {section.title()}")
+        if not signals.missing_required:
+            feedback.append("✅ All required sections present")
         
-        # LinkedIn
-        if re.search(r'linkedin', text, re.IGNORECASE):
-            score += 25
+        # Formatting
+        issues = [issue for signal, limit, _, issue in cls.FORMATTING_RULES
+                  if getattr(signals, signal) > limit]
+        if not issues:
+            feedback.append("✅ Good formatting for ATS compatibility")
         else:
-            self.feedback.append("💡 Consider adding LinkedIn profile")
-        
-        # GitHub/Portfolio (bonus for tech roles)
-        if re.search(r'github|portfolio|website', text, re.IGNORECASE):
-            score += 20
+            feedback.extend(f"⚠️ {issue}" for issue in issues)
+        
+        # Keywords
+        if signals.keywords_found:
+            feedback.append(f"✅ Found {signals.keywords_found}/{signals.keywords_total} role-relevant keywords")
+        if signals.missing_keywords:  # Show top 5 missing
+            feedback.append(f"💡 Consider adding keywords: {', '.join(signals.missing_keywords[:5])}")
+        
+        # Length
+        for low, high, _, message in cls.LENGTH_BANDS:
+            if low <= signals.word_count <= high:
+                feedback.append(message)
+                break
         else:
-            self.feedback.append("💡 Consider adding GitHub or portfolio link")
+            feedback.append(cls.LENGTH_DEFAULT[1])
+        
+        # Readability
+        if signals.sentence_count:
+            avg_sentence_length = signals.word_count / signals.sentence_count
+            if avg_sentence_length > 30:
+                feedback.append("⚠️ Sentences are too long - break them up")
+            elif avg_sentence_length < 10:
+                feedback.append("⚠️ Sentences might be too short")
+            if signals.passive_count / max(signals.word_count, 1) > 0.05:
+                feedback.append("💡 Consider using more active voice")
+        
+        # Contact
+        feedback.extend(message for signal, _, message in cls.CONTACT_RULES
+                        if not getattr(signals, signal))
+        
+        return feedback
+    
+    def calculate_score_batch(self, texts: Sequence[str],
+                              roles: Union[None, str, Sequence[Optional[str]]] = None,
+                              job_description: Union[None, str, JobDescription] = None):
+        """
+        Score many resumes at once.
         
-        return min(score, 100)
+        Measurements are taken per document; the component scores, weighting,
+        grades and pass flags are then computed for all documents together
+        as NumPy array operations. Feedback is not generated here: pass a row
+        to ``feedback_from_signals`` when it is needed.
+        
+        Args:
+            texts: Resume texts
+            roles: One target role for all texts, or one per text (None
+                entries are auto-detected)
+            job_description: Job posting all texts are scored against
+                (compiled once; overrides roles)
+            
+        Returns:
+            pandas DataFrame with one row per text: the component scores,
+            total, grade and pass flag followed by the raw measurements
+            (a NumPy record array if pandas is not installed)
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("numpy is required for batch scoring. Install with: pip install numpy")
+        
+        if roles is None or isinstance(roles, str):
+            roles = [roles] * len(texts)
+        if len(roles) != len(texts):
+            raise ValueError("roles must be a single role or one role per text")
+        
+        if job_description is not None:
+            job_description = get_job_description(job_description)
+        signals = [self.measure(text, role, job_description=job_description)
+                   for text, role in zip(texts, roles)]
+        columns = {field: [getattr(s, field) for s in signals] for field in ATSSignals._fields}
+        
+        numeric = {field: np.asarray(values, dtype=np.float64) for field, values in columns.items()
+                   if field not in ('role', 'missing_required', 'missing_keywords')}
+        required_found = len(self.REQUIRED_SECTIONS) - np.fromiter(
+            (len(missing) for missing in columns['missing_required']), dtype=np.float64, count=len(signals))
+        
+        components = np.column_stack([
+            self._vector_sections(np, required_found, numeric),
+            self._vector_formatting(np, numeric),
+            self._vector_keywords(np, numeric),
+            self._vector_length(np, numeric),
+            self._vector_readability(np, numeric),
+            self._vector_contact(np, numeric)
+        ])
+        weights = np.array([self.WEIGHTS[name] for name in self.COMPONENTS])
+        total = components @ weights
+        
+        grade_floors = np.array([floor for floor, _ in self.GRADE_THRESHOLDS])
+        grade_labels = np.array([grade for _, grade in self.GRADE_THRESHOLDS] + ['F'])
+        # Thresholds are descending: count how many floors the total misses
+        grades = grade_labels[(total[:, None] < grade_floors[None, :]).sum(axis=1)]
+        
+        result = {'total': np.round(total, 1)}
+        for index, name in enumerate(self.COMPONENTS):
+            result[name] = np.round(components[:, index], 1)
+        result['grade'] = grades
+        result['pass_ats'] = total >= 60
+        result.update(columns)
+        return to_table(np, result, object_columns=('missing_required', 'missing_keywords'))
+    
+    def _vector_sections(self, np, required_found, columns):
+        score = required_found / len(self.REQUIRED_SECTIONS) * 60
+        score = score + columns['optional_found'] / len(self.OPTIONAL_SECTIONS) * 40
+        return np.minimum(score, 100)
+    
+    def _vector_formatting(self, np, columns):
+        score = np.full(len(columns['word_count']), 100.0)
+        for signal, limit, penalty, _ in self.FORMATTING_RULES:
+            score -= np.where(columns[signal] > limit, penalty, 0)
+        return np.maximum(score, 0)
+    
+    def _vector_keywords(self, np, columns):
+        return columns['keywords_found'] / np.maximum(columns['keywords_total'], 1) * 100
+    
+    def _vector_length(self, np, columns):
+        word_count = columns['word_count']
+        conditions = [(word_count >= low) & (word_count <= high) for low, high, _, _ in self.LENGTH_BANDS]
+        return np.select(conditions, [score for _, _, score, _ in self.LENGTH_BANDS],
+                         default=self.LENGTH_DEFAULT[0]).astype(np.float64)
+    
+    def _vector_readability(self, np, columns):
+        words = columns['word_count']
+        sentences = columns['sentence_count']
+        avg_sentence_length = words / np.maximum(sentences, 1)
+        score = 100 - np.select([avg_sentence_length > 30, avg_sentence_length < 10], [20, 10], default=0)
+        score = score - np.where(columns['passive_count'] / np.maximum(words, 1) > 0.05, 10, 0)
+        return np.where(sentences > 0, np.maximum(score, 0), 50).astype(np.float64)
+    
+    def _vector_contact(self, np, columns):
+        score = sum(columns[signal] * points for signal, points, _ in self.CONTACT_RULES)
+        return np.minimum(score, 100)
+    
+    def keyword_matcher(self, job_description: Optional[JobDescription] = None) -> KeywordSetMatcher:
+        """Matcher whose scan gives the keyword hits for ``split_keywords``."""
+        return job_description.matcher if job_description is not None else self._role_matcher
+    
+    def keyword_hits(self, text: str, matcher: KeywordSetMatcher,
+                     skills: Optional[SkillMentions] = None) -> int:
+        """
+        Vocabulary hit bitmask of a keyword matcher for the text.
+        
+        With a skill scan, keywords that resolve to taxonomy skills are hits
+        when the scan mentions them; the text is only searched for the
+        remaining keywords, if there are any.
+        """
+        if skills is None:
+            return matcher.scan(text)
+        hits = 0
+        unresolved = 0
+        for keyword, keyword_id in matcher.matcher.phrases.items():
+            skill_id = skills.taxonomy.resolve(keyword)
+            if skill_id is None:
+                unresolved |= 1 << keyword_id
+            elif skill_id in skills.ids:
+                hits |= 1 << keyword_id
+        if unresolved:
+            hits |= matcher.scan(text) & unresolved
+        return hits
+    
+    def split_keywords(self, keyword_hits: int, target_role: Optional[str] = None,
+                       job_description: Optional[JobDescription] = None) -> Tuple[str, List[str], List[str]]:
+        """
+        Resolve the role and split its keywords into found and missing.
+        
+        Args:
+            keyword_hits: Hit bitmask from ``keyword_matcher(job_description).scan``
+            target_role: Target job role (auto-detected from the hits if omitted)
+            job_description: Compiled job description whose terms are the targets
+            
+        Returns:
+            Tuple of (role, found keywords, missing keywords)
+        """
+        if job_description is not None:
+            return (self.JOB_DESCRIPTION_ROLE,) + job_description.matcher.split(keyword_hits, 'job')
+        role = self._resolve_role(keyword_hits, target_role)
+        return (role,) + self._role_matcher.split(keyword_hits, role)
+    
+    def _resolve_role(self, keyword_hits: int, target_role: Optional[str]) -> str:
+        """Normalize the target role, auto-detecting it from the keyword hits if omitted."""
+        if not target_role:
+            # Auto-detect role
+            target_role = self._role_from_hits(keyword_hits)
+        
+        target_role = target_role.lower().replace(' ', '_').replace('-', '_')
+        
+        if target_role not in self.role_keywords:
+            # Default to data scientist if role not found
+            target_role = 'data_scientist' if 'data_scientist' in self.role_keywords else next(iter(self.role_keywords))
+        return target_role
+    
+    def _match_keywords(self, text: str, role: str) -> Tuple[List[str], List[str]]:
+        """Split a role's keywords into found and missing."""
+        return self._role_matcher.split(self._role_matcher.scan(text), role)
     
     def _detect_role(self, text: str) -> str:
         """Auto-detect the target role from resume content."""
-        role_scores = {}
-        
-        for role, keywords in self.ROLE_KEYWORDS.items():
-            matches = sum(1 for kw in keywords if kw.lower() in text)
-            role_scores[role] = matches
+        return self._role_from_hits(self._role_matcher.scan(text))
+    
+    def _role_from_hits(self, keyword_hits: int) -> str:
+        """Role with the most keyword hits (first listed role on ties)."""
+        role_scores = self._role_matcher.hit_counts(keyword_hits)
         
         if role_scores:
             detected = max(role_scores, key=role_scores.get)
@@ -328,46 +756,81 @@ class ATSScorer:
     
     def _get_grade(self, score: float) -> str:
         """Convert score to letter grade."""
-        if score >= 90:
-            return 'A+'
-        elif score >= 85:
-            return 'A'
-        elif score >= 80:
-            return 'A-'
-        elif score >= 75:
-            return 'B+'
-        elif score >= 70:
-            return 'B'
-        elif score >= 65:
-            return 'B-'
-        elif score >= 60:
-            return 'C+'
-        elif score >= 55:
-            return 'C'
-        elif score >= 50:
-            return 'C-'
-        elif score >= 45:
-            return 'D'
-        else:
-            return 'F'
+        for floor, grade in self.GRADE_THRESHOLDS:
+            if score >= floor:
+                return grade
+        return 'F'
     
-    def get_improvement_suggestions(self) -> List[str]:
-        """Get prioritized list of improvements."""
-        suggestions = []
-        
-        if self.scores.get('contact', 0) < 70:
-            suggestions.append("Add complete contact information (email, phone, LinkedIn)")
-        
-        if self.scores.get('sections', 0) < 70:
-            suggestions.append("Include all required sections: Experience, Education, Skills")
-        
-        if self.scores.get('keywords', 0) < 60:
-            suggestions.append("Add more role-relevant keywords and technical skills")
-        
-        if self.scores.get('formatting', 0) < 70:
-            suggestions.append("Simplify formatting - avoid tables, graphics, and special characters")
+    def get_improvement_suggestions(self, result: Optional[ATSResult] = None) -> List[str]:
+        """
+        Get prioritized list of improvements.
         
-        if self.scores.get('readability', 0) < 70:
-            suggestions.append("Improve readability - use shorter sentences and active voice")
+        Args:
+            result: Result from ``score``; defaults to the last ``calculate_score`` call
+        """
+        scores = result.scores if result is not None else self.scores
+        return self.suggestions_from_scores(scores)
+    
+    @classmethod
+    def suggestions_from_scores(cls, scores: Dict[str, float]) -> List[str]:
+        """Improvement suggestions for a set of component scores."""
+        return [suggestion for component, floor, suggestion in cls.SUGGESTION_RULES
+                if scores.get(component, 0) < floor]
+
+
+# Matcher for the built-in role keywords, compiled once and shared (read-only)
+_DEFAULT_ROLE_MATCHER = KeywordSetMatcher(ATSScorer.ROLE_KEYWORDS)
+
+# Codes used by CompactATSResult
+_GRADES = tuple(grade for _, grade in ATSScorer.GRADE_THRESHOLDS) + ('F',)
+_REQUIRED_SECTIONS = tuple(ATSScorer.REQUIRED_SECTIONS)
+_ROLE_KEYWORD_BITS = {role: {keyword: 1 << bit for bit, keyword in enumerate(keywords)}
+                      for role, keywords in ATSScorer.ROLE_KEYWORDS.items()}
+
+
+def _pack_keywords(role: str, keywords: Tuple[str, ...]) -> Union[int, Tuple[str, ...]]:
+    """Bitmask over the role's built-in keywords, or interned strings for other keyword lists."""
+    bits = _ROLE_KEYWORD_BITS.get(role)
+    if bits is not None and all(keyword in bits for keyword in keywords):
+        mask = sum(bits[keyword] for keyword in keywords)
+        if _unpack_keywords(role, mask) == keywords:
+            return mask
+    return tuple(map(sys.intern, keywords))
+
+
+def _unpack_keywords(role: str, keywords: Union[int, Tuple[str, ...]]) -> Tuple[str, ...]:
+    if not isinstance(keywords, int):
+        return keywords
+    return tuple(keyword for keyword, bit in _ROLE_KEYWORD_BITS[role].items() if keywords & bit)
+
+
+def load_role_keywords(path: Union[str, Path, None] = None,
+                       base: Optional[Dict[str, List[str]]] = None) -> Dict[str, List[str]]:
+    """
+    Load role keyword lists from a JSON file and merge them into a base set.
+    
+    Roles missing from the base are added; keywords of existing roles are
+    appended (without duplicates).
+    
+    Args:
+        path: JSON file mapping role to keyword list (defaults to
+            ``data/job_keywords.json``)
+        base: Keyword lists to extend (defaults to ``ATSScorer.ROLE_KEYWORDS``)
         
-        return suggestions
+    Returns:
+        Merged mapping of role to keywords, for ``ATSScorer(role_keywords=...)``
+    """
+    path = Path(path) if path is not None else DATA_DIR / 'job_keywords.json'
+    with open(path, encoding='utf-8') as f:
+        extra = json.load(f)
+    
+    merged = {role: list(keywords) for role, keywords in (base or ATSScorer.ROLE_KEYWORDS).items()}
+    for role, keywords in extra.items():
+        role = role.lower().replace(' ', '_').replace('-', '_')
+        existing = merged.setdefault(role, [])
+        known = {keyword.lower() for keyword in existing}
+        for keyword in keywords:
+            if keyword.lower() not in known:
+                existing.append(keyword)
+                known.add(keyword.lower())
+    return merged
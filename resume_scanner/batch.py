@@ -0,0 +1,157 @@
+"""
+Batch Runner Module
+Analyzes many resumes and writes the results to the results store.
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+
+from .ai_detector import AIDetector
+from .ats_scorer import ATSScorer
+from .job_matcher import JobMatcher
+from .ngram_model import load_language_model
+from .nlp_engine import NLPEngine
+from .parser import ResumeParser
+from .store import DEFAULT_DB_PATH, AnalysisRecord, ResultStore
+from .text_buffer import split_words
+
+
+# Files picked up when a directory is given
+RESUME_SUFFIXES = ('.pdf', '.docx', '.txt')
+
+
+class BatchRunner:
+    """
+    Runs the full analysis over many resumes.
+
+    The analyzers are created once and reused for every document; each
+    resume is scanned for skills once and the scan is shared by keyword
+    scoring and job matching. Results go to a ResultStore, by default the
+    SQLite database ``DEFAULT_DB_PATH``.
+    """
+
+    def __init__(self, store: Optional[ResultStore] = None, target_role: Optional[str] = None,
+                 fuzzy: bool = False):
+        """
+        Create the analyzers.
+
+        Args:
+            store: Results sink (defaults to ``ResultStore(DEFAULT_DB_PATH)``)
+            target_role: Target role for ATS keyword scoring (auto-detected if omitted)
+            fuzzy: Also match misspelled skills
+        """
+        self.store = store if store is not None else ResultStore(DEFAULT_DB_PATH)
+        self.target_role = target_role
+        self.nlp_engine = NLPEngine(use_spacy=False, fuzzy=fuzzy)
+        self.ats_scorer = ATSScorer()
+        self.ai_detector = AIDetector(language_model=load_language_model())
+        self.job_matcher = JobMatcher()
+
+    def analyze(self, name: str, text: str) -> AnalysisRecord:
+        """Analyze one resume text into a storable record."""
+        mentions = self.nlp_engine.scan_skills(text)
+        ats = self.ats_scorer.score(text, self.target_role, skills=mentions)
+        ai = self.ai_detector.analyze(text)
+        matches = self.job_matcher.score(text, skills=mentions)
+        years, _ = self.nlp_engine.calculate_experience_years(text)
+        return AnalysisRecord(
+            name=name,
+            digest=hashlib.sha1(text.encode('utf-8')).hexdigest(),
+            word_count=len(split_words(text)),
+            experience_years=years,
+            ats_total=ats.total,
+            grade=ats.grade,
+            pass_ats=ats.pass_ats,
+            components={name: getattr(ats, name) for name in ATSScorer.COMPONENTS},
+            role=ats.signals.role,
+            ai_probability=ai['ai_probability'],
+            ai_verdict=ai['verdict'],
+            skills={mention.skill: mention.count for mention in mentions},
+            job_matches=matches.role_matches
+        )
+
+    def run_texts(self, documents: Iterable[Tuple[str, str]]) -> int:
+        """
+        Analyze (name, text) pairs and store the results.
+
+        Returns:
+            Number of documents stored
+        """
+        count = 0
+        for name, text in documents:
+            self.store.add(self.analyze(name, text))
+            count += 1
+        self.store.flush()
+        return count
+
+    def run(self, paths: Iterable[Union[str, Path]]) -> Tuple[int, List[Tuple[str, str]]]:
+        """
+        Parse, analyze and store resume files (directories are expanded).
+
+        Returns:
+            Tuple of (documents stored, list of (file, error) for files that failed to parse)
+        """
+        failed = []
+
+        files = resume_files(paths)
+
+        def documents():
+            parser = ResumeParser()
+            for name, path in files:
+                try:
+                    text = parser.parse(str(path))
+                except Exception as e:
+                    failed.append((str(path), str(e)))
+                    continue
+                yield name, text
+
+        return self.run_texts(documents()), failed
+
+
+def resume_files(paths: Iterable[Union[str, Path]]) -> List[Tuple[str, Path]]:
+    """
+    Resume files among the paths with the document names they are stored under.
+
+    Directories are searched recursively and their files named by the path
+    relative to the directory ("a/cv.pdf"); files given directly are named
+    by their file name.
+
+    Raises:
+        ValueError: If two different files would get the same name
+    """
+    files = {}
+    for path in map(Path, paths):
+        if path.is_dir():
+            found = sorted(p for p in path.rglob('*') if p.suffix.lower() in RESUME_SUFFIXES and p.is_file())
+            named = [(p.relative_to(path).as_posix(), p) for p in found]
+        else:
+            named = [(path.name, path)]
+        for name, file in named:
+            other = files.setdefault(name, file)
+            if other.resolve() != file.resolve():
+                raise ValueError(f"{other} and {file} would both be stored as '{name}'")
+    return [(name, file) for name, file in files.items()]
+
+
+def main(argv: Optional[List[str]] = None):
+    """Analyze resumes into a results database: python -m resume_scanner.batch PATH... [--db FILE]"""
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description="Analyze resumes and store the results in SQLite")
+    arg_parser.add_argument('paths', nargs='+', help="Resume files or directories (PDF, DOCX, TXT)")
+    arg_parser.add_argument('--db', default=DEFAULT_DB_PATH, help="Results database")
+    arg_parser.add_argument('--role', default=None, help="Target role for ATS scoring")
+    arg_parser.add_argument('--fuzzy', action='store_true', help="Also match misspelled skills")
+    args = arg_parser.parse_args(argv)
+
+    with ResultStore(args.db) as store:
+        stored, failed = BatchRunner(store, target_role=args.role, fuzzy=args.fuzzy).run(args.paths)
+        total = len(store)
+    for path, error in failed:
+        print(f"Warning: could not parse {path}: {error}")
+    print(f"Stored {stored} resumes in {args.db} ({total} in total)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Calibration Module
+Streaming percentile estimates of detector features across an applicant population.
+"""
+
+from pathlib import Path
+from typing import Dict, Sequence, Tuple, Union
+
+
+def _require_numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("numpy is required for calibration. Install with: pip install numpy")
+    return np
+
+
+class StreamingHistogram:
+    """
+    Fixed-bin histogram of a feature, updated batch by batch.
+
+    Memory is constant (one counter per bin) however many documents are
+    seen, and two histograms with the same bins can be merged by adding
+    counts. Values outside the range are counted in the edge bins.
+    """
+
+    def __init__(self, low: float, high: float, bins: int):
+        np = _require_numpy()
+        self.low = low
+        self.high = high
+        self.counts = np.zeros(bins, dtype=np.float64)
+        self.width = (high - low) / bins
+
+    @property
+    def total(self) -> float:
+        return float(self.counts.sum())
+
+    def _bin(self, values):
+        np = _require_numpy()
+        index = np.floor((values - self.low) / self.width).astype(np.int64)
+        return np.clip(index, 0, len(self.counts) - 1)
+
+    def update(self, values):
+        """Count a batch of values (NaNs are ignored)."""
+        np = _require_numpy()
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        self.counts += np.bincount(self._bin(values), minlength=len(self.counts))
+
+    def percentile(self, values):
+        """
+        Percentile rank (0-100) of each value in the population seen so far.
+
+        Values are placed linearly within their bin; NaNs, and any value
+        before anything has been counted, get 50.
+        """
+        np = _require_numpy()
+        values = np.asarray(values, dtype=np.float64)
+        total = self.total
+        if not total:
+            return np.full(values.shape, 50.0)
+
+        cumulative = np.concatenate([[0.0], np.cumsum(self.counts)])
+        index = self._bin(np.nan_to_num(values, nan=self.low))
+        position = (values - self.low) / self.width - index
+        fraction = np.clip(position, 0, 1)
+        rank = (cumulative[index] + fraction * self.counts[index]) / total * 100
+        return np.where(np.isnan(values), 50.0, rank)
+
+    def quantile(self, q: float) -> float:
+        """Value below which a fraction ``q`` of the population lies."""
+        np = _require_numpy()
+        total = self.total
+        if not total:
+            return float('nan')
+        cumulative = np.cumsum(self.counts)
+        target = q * total
+        index = int(np.searchsorted(cumulative, target, side='left'))
+        index = min(index, len(self.counts) - 1)
+        before = cumulative[index] - self.counts[index]
+        fraction = (target - before) / self.counts[index] if self.counts[index] else 0.0
+        return self.low + (index + fraction) * self.width
+
+
+class FeatureCalibrator:
+    """
+    Calibrates AI-detector features against the applicant population.
+
+    Keeps one streaming histogram per raw feature (see
+    ``AIDetector.FEATURES``) and turns feature values into percentile ranks,
+    so scores reflect how unusual a resume is among the resumes actually
+    received instead of fixed step thresholds.
+    """
+
+    # Feature -> (low, high, bins); counts use unit bins centred on integers
+    FEATURE_RANGES = {
+        'phrase_count': (-0.5, 63.5, 64),
+        'verb_count': (-0.5, 63.5, 64),
+        'ttr': (0.0, 1.0, 200),
+        'max_start_ratio': (0.0, 1.0, 200),
+    }
+
+    # Weight of each feature's percentile in the calibrated probability, and
+    # whether a high value points to AI (True) or to a human writer (False)
+    WEIGHTS = {
+        'phrase_count': (0.3, True),
+        'verb_count': (0.2, True),
+        'ttr': (0.25, False),
+        'max_start_ratio': (0.25, True),
+    }
+
+    def __init__(self):
+        self.histograms = {name: StreamingHistogram(*bounds) for name, bounds in self.FEATURE_RANGES.items()}
+
+    def _columns(self, features, columns: Sequence[str]):
+        np = _require_numpy()
+        features = np.atleast_2d(np.asarray(features, dtype=np.float64))
+        return {name: features[:, columns.index(name)] for name in self.histograms}
+
+    def update(self, features, columns: Sequence[str]):
+        """
+        Add a batch of documents to the population.
+
+        Args:
+            features: Array of shape (documents, len(columns))
+            columns: Feature name of each column (e.g. ``AIDetector.FEATURES``)
+        """
+        for name, values in self._columns(features, columns).items():
+            self.histograms[name].update(values)
+
+    def percentiles(self, features, columns: Sequence[str]) -> Dict:
+        """Percentile rank of every feature value (feature name -> array)."""
+        return {name: self.histograms[name].percentile(values)
+                for name, values in self._columns(features, columns).items()}
+
+    def calibrated_probability(self, features, columns: Sequence[str]):
+        """AI probability (0-100) of each document from its feature percentiles."""
+        probability = 0
+        for name, rank in self.percentiles(features, columns).items():
+            weight, higher_is_ai = self.WEIGHTS[name]
+            probability = probability + weight * (rank if higher_is_ai else 100 - rank)
+        return probability
+
+    def quantiles(self, q: Sequence[float] = (0.5, 0.9, 0.99)) -> Dict[str, Tuple[float, ...]]:
+        """Estimated population quantiles of every feature."""
+        return {name: tuple(histogram.quantile(value) for value in q)
+                for name, histogram in self.histograms.items()}
+
+    @property
+    def documents(self) -> int:
+        """Number of documents seen (counted on the always-defined phrase count)."""
+        return int(self.histograms['phrase_count'].total)
+
+    def save(self, path: Union[str, Path]):
+        """Write the histogram counts to a ``.npz`` file."""
+        np = _require_numpy()
+        with open(path, 'wb') as f:
+            np.savez(f, **{name: histogram.counts for name, histogram in self.histograms.items()})
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'FeatureCalibrator':
+        """Read a calibrator written by ``save``."""
+        np = _require_numpy()
+        calibrator = cls()
+        with np.load(path) as data:
+            for name, histogram in calibrator.histograms.items():
+                histogram.counts = data[name].astype(np.float64)
+        return calibrator
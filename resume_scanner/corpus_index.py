@@ -0,0 +1,257 @@
+"""
+Corpus Index Module
+MinHash LSH index for finding near-duplicate and template resumes across a corpus.
+"""
+
+import re
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+
+_WORD_PATTERN = re.compile(r'\w+')
+
+# Signature values are 32-bit; an empty document gets all-max values
+_MAX_HASH = 0xFFFFFFFF
+
+
+def _require_numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("numpy is required for the corpus index. Install with: pip install numpy")
+    return np
+
+
+def shingles(text: str, size: int = 5) -> List[str]:
+    """Overlapping word n-grams (shingles) of the lowercase text."""
+    words = _WORD_PATTERN.findall(text.lower())
+    if len(words) <= size:
+        return [' '.join(words)] if words else []
+    return [' '.join(words[i:i + size]) for i in range(len(words) - size + 1)]
+
+
+def choose_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    Pick (bands, rows per band) so the LSH S-curve rises at the threshold.
+
+    Two documents with Jaccard similarity s share at least one band with
+    probability 1 - (1 - s^rows)^bands, which is 1/2 roughly at
+    (1 / bands)^(1 / rows). The layout whose midpoint is closest to the
+    threshold is chosen, preferring lower midpoints (better recall).
+    """
+    best = None
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        midpoint = (1 / bands) ** (1 / rows)
+        error = abs(midpoint - threshold) + (0.01 if midpoint > threshold else 0)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+class CorpusIndex:
+    """
+    Finds resumes in a corpus that are at least X% similar to a given one.
+
+    Each resume is reduced to a MinHash signature of its word shingles; the
+    signature is cut into LSH bands and every band is hashed to a 64-bit key.
+    Band keys are kept in sorted arrays (one per band) and looked up with a
+    binary search, so a query costs O(bands * log n) plus the candidates it
+    verifies, instead of a pairwise scan. New resumes go to a small buffer
+    that is merged into the sorted arrays in batches.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 128, shingle_size: int = 5,
+                 seed: int = 1, merge_every: int = 4096):
+        """
+        Create an empty index.
+
+        Args:
+            threshold: Default Jaccard similarity for ``query``
+            num_perm: Number of MinHash permutations (signature length)
+            shingle_size: Words per shingle
+            seed: Seed of the hash permutations (stored with the index)
+            merge_every: Buffered inserts before they are merged into the
+                sorted band arrays
+        """
+        np = _require_numpy()
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.seed = seed
+        self.merge_every = merge_every
+        self.bands, self.rows = choose_bands(threshold, num_perm)
+
+        rng = np.random.RandomState(seed)
+        # Multiply-shift hashing: h(x) = ((a * x + b) mod 2^64) >> 32, a odd
+        self._a = rng.randint(0, 2 ** 63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._b = rng.randint(0, 2 ** 63, size=num_perm, dtype=np.uint64)
+        self._band_mix = rng.randint(0, 2 ** 63, size=self.rows, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+
+        self.keys: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._signatures = np.empty((0, num_perm), dtype=np.uint32)
+        self._count = 0
+        # Sorted band keys with the matching document positions, per band
+        self._band_keys = [np.empty(0, dtype=np.uint64) for _ in range(self.bands)]
+        self._band_docs = [np.empty(0, dtype=np.int64) for _ in range(self.bands)]
+        # Inserts not yet merged: band -> key -> positions
+        self._pending: List[Dict[int, List[int]]] = [{} for _ in range(self.bands)]
+        self._pending_count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._positions
+
+    def signature(self, text: str):
+        """MinHash signature of a text (uint32 array of length ``num_perm``)."""
+        np = _require_numpy()
+        hashes = np.fromiter((zlib.crc32(s.encode('utf-8')) for s in shingles(text, self.shingle_size)),
+                             dtype=np.uint64)
+        if not len(hashes):
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint32)
+        hashes = np.unique(hashes)
+        permuted = (hashes[:, None] * self._a[None, :] + self._b[None, :]) >> np.uint64(32)
+        return permuted.min(axis=0).astype(np.uint32)
+
+    def _band_hashes(self, signature):
+        """One 64-bit key per band."""
+        np = _require_numpy()
+        rows = signature[:self.bands * self.rows].astype(np.uint64).reshape(self.bands, self.rows)
+        return (rows * self._band_mix[None, :]).sum(axis=1, dtype=np.uint64)
+
+    def add(self, key: str, text: Optional[str] = None, signature=None) -> int:
+        """
+        Insert a resume.
+
+        Args:
+            key: Unique document identifier
+            text: Resume text (or pass a precomputed ``signature``)
+            signature: MinHash signature from ``signature``
+
+        Returns:
+            Internal position of the document
+        """
+        np = _require_numpy()
+        if key in self._positions:
+            raise ValueError(f"Document already indexed: {key}")
+        if signature is None:
+            if text is None:
+                raise ValueError("Either text or signature must be provided")
+            signature = self.signature(text)
+
+        position = self._count
+        if position == len(self._signatures):
+            grown = np.empty((max(16, 2 * position), self.num_perm), dtype=np.uint32)
+            grown[:position] = self._signatures[:position]
+            self._signatures = grown
+        self._signatures[position] = signature
+        self._count += 1
+        self.keys.append(key)
+        self._positions[key] = position
+
+        for band, band_key in enumerate(self._band_hashes(signature).tolist()):
+            self._pending[band].setdefault(band_key, []).append(position)
+        self._pending_count += 1
+        if self._pending_count >= self.merge_every:
+            self._merge()
+        return position
+
+    def add_many(self, documents: Iterable[Tuple[str, str]]):
+        """Insert (key, text) pairs."""
+        for key, text in documents:
+            self.add(key, text)
+
+    def _merge(self):
+        """Merge buffered inserts into the sorted band arrays."""
+        np = _require_numpy()
+        if not self._pending_count:
+            return
+        for band, pending in enumerate(self._pending):
+            new_keys = np.fromiter((k for k, docs in pending.items() for _ in docs), dtype=np.uint64)
+            new_docs = np.fromiter((d for docs in pending.values() for d in docs), dtype=np.int64)
+            keys = np.concatenate([self._band_keys[band], new_keys])
+            docs = np.concatenate([self._band_docs[band], new_docs])
+            order = np.argsort(keys, kind='stable')
+            self._band_keys[band] = keys[order]
+            self._band_docs[band] = docs[order]
+            pending.clear()
+        self._pending_count = 0
+
+    def candidates(self, signature) -> List[int]:
+        """Positions of documents sharing at least one band with the signature."""
+        found = set()
+        # Search with uint64 scalars: Python ints would make numpy cast the array
+        for band, band_key in enumerate(self._band_hashes(signature)):
+            keys = self._band_keys[band]
+            left = keys.searchsorted(band_key, side='left')
+            right = keys.searchsorted(band_key, side='right')
+            if right > left:
+                found.update(self._band_docs[band][left:right].tolist())
+            found.update(self._pending[band].get(int(band_key), ()))
+        return sorted(found)
+
+    def query(self, text: Optional[str] = None, threshold: Optional[float] = None,
+              signature=None, exclude: Optional[str] = None) -> List[Tuple[str, float]]:
+        """
+        Find indexed resumes similar to a text.
+
+        Args:
+            text: Resume text (or pass a precomputed ``signature``)
+            threshold: Minimum estimated Jaccard similarity (defaults to the
+                index threshold; the bands are tuned for that value)
+            signature: MinHash signature from ``signature``
+            exclude: Key to leave out (e.g. the document itself)
+
+        Returns:
+            (key, estimated similarity) pairs, most similar first
+        """
+        np = _require_numpy()
+        if signature is None:
+            signature = self.signature(text)
+        threshold = self.threshold if threshold is None else threshold
+
+        positions = self.candidates(signature)
+        if not positions:
+            return []
+        similarity = (self._signatures[positions] == signature[None, :]).mean(axis=1)
+
+        matches = [(self.keys[p], round(float(s), 3)) for p, s in zip(positions, similarity)
+                   if s >= threshold and self.keys[p] != exclude]
+        matches.sort(key=lambda match: -match[1])
+        return matches
+
+    def save(self, path: Union[str, Path]):
+        """Write the index to a ``.npz`` file."""
+        np = _require_numpy()
+        self._merge()
+        arrays = {
+            'params': np.array([self.num_perm, self.shingle_size, self.seed, self.merge_every], dtype=np.int64),
+            'threshold': np.array([self.threshold]),
+            'keys': np.array(self.keys, dtype=str),
+            'signatures': self._signatures[:self._count],
+        }
+        for band in range(self.bands):
+            arrays[f'band_keys_{band}'] = self._band_keys[band]
+            arrays[f'band_docs_{band}'] = self._band_docs[band]
+        with open(path, 'wb') as f:
+            np.savez(f, **arrays)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'CorpusIndex':
+        """Read an index written by ``save``."""
+        np = _require_numpy()
+        with np.load(path) as data:
+            num_perm, shingle_size, seed, merge_every = (int(v) for v in data['params'])
+            index = cls(float(data['threshold'][0]), num_perm, shingle_size, seed, merge_every)
+            index.keys = data['keys'].tolist()
+            index._positions = {key: position for position, key in enumerate(index.keys)}
+            index._signatures = data['signatures'].copy()
+            index._count = len(index.keys)
+            for band in range(index.bands):
+                index._band_keys[band] = data[f'band_keys_{band}']
+                index._band_docs[band] = data[f'band_docs_{band}']
+        return index
@@ -0,0 +1,264 @@
+"""
+Experience Timeline Module
+Parses employment date ranges and merges them into tenure, one resume or many at a time.
+"""
+
+import re
+from datetime import date
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Union
+
+from .sections import RESUME_SEGMENTER, section_text
+
+
+_MONTH = (r'\b(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?'
+          r'|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\b\.?')
+
+# "2019 - 2021", "Jun 2020 – Dec 2021", "03/2018 to present", "Jan. 2022 - Present"
+RANGE_PATTERN = re.compile(
+    r'(?<!\d)(?:' + _MONTH + r'\s*|(\d{1,2})\s*/\s*)?((?:19|20)\d{2})(?!\d)'
+    r'\s*(?:[-–—]+|to|until)\s*'
+    r'(?:(present|current|now|today)|(?:' + _MONTH + r'\s*|(\d{1,2})\s*/\s*)?((?:19|20)\d{2})(?!\d))',
+    re.IGNORECASE
+)
+
+_MONTHS = {name: index for index, name in enumerate(
+    ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'])}
+
+
+def _require_numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("numpy is required for batch experience extraction. Install with: pip install numpy")
+    return np
+
+
+def month_index(year: int, month: int = 1) -> int:
+    """Months since year 0 of the first day of a month (1-12)."""
+    return year * 12 + month - 1
+
+
+class DateRange(NamedTuple):
+    """One employment range, in months (``end`` exclusive), with the end year as written."""
+    start: int
+    end: int
+    text: str
+    end_year: int
+
+    @property
+    def months(self) -> int:
+        return self.end - self.start
+
+    @property
+    def years(self) -> float:
+        return self.months / 12
+
+    def to_dict(self) -> dict:
+        """Start and end year with the length in years (as ``NLPEngine.calculate_experience_years``)."""
+        return {'start': self.start // 12, 'end': self.end_year, 'years': round(self.years, 1),
+                'text': self.text}
+
+
+# Earliest start year accepted as a job (older years are usually not employment)
+EARLIEST_YEAR = 1990
+
+
+def parse_ranges(text: str, today: Optional[date] = None) -> List[DateRange]:
+    """
+    Find the date ranges of a text.
+
+    Year-only ranges run from January of the first year to January of the
+    second ("2018 - 2020" is two years); month ranges include both months
+    ("Jun 2020 - Dec 2021" is 19 months); open ranges ("present") run
+    through the current month. A year range within one year ("2019 -
+    2019") is kept with zero length. Ranges starting before
+    ``EARLIEST_YEAR``, ending before they start or lying in the future are
+    ignored.
+
+    Args:
+        text: Resume text (or one section of it)
+        today: Reference date for open ranges (defaults to today)
+
+    Returns:
+        DateRanges in text order
+    """
+    today = today or date.today()
+    now = month_index(today.year, today.month) + 1
+    ranges = []
+    for match in RANGE_PATTERN.finditer(text):
+        start_name, start_number, start_year, current, end_name, end_number, end_year = match.groups()
+        start_month = _month(start_name, start_number)
+        start = month_index(int(start_year), start_month or 1)
+        if current:
+            end = now
+            end_year = today.year
+        else:
+            end_year = int(end_year)
+            end_month = _month(end_name, end_number)
+            # A month range includes its last month; a year range ends at that year's start
+            end = month_index(end_year, end_month) + 1 if end_month else month_index(end_year)
+        if int(start_year) >= EARLIEST_YEAR and start <= end <= now:
+            ranges.append(DateRange(start, end, match.group(0), end_year))
+    return ranges
+
+
+def _month(name: Optional[str], number: Optional[str]) -> Optional[int]:
+    if name:
+        return _MONTHS[name[:3].lower()] + 1
+    if number and 1 <= int(number) <= 12:
+        return int(number)
+    return None
+
+
+def merged_months(ranges: Iterable[DateRange]) -> int:
+    """Months covered by the ranges, counting overlapping stretches once."""
+    total = 0
+    covered_until = None
+    for start, end, *_ in sorted(ranges):
+        if covered_until is None or start > covered_until:
+            total += end - start
+            covered_until = end
+        elif end > covered_until:
+            total += end - covered_until
+            covered_until = end
+    return total
+
+
+def experience_text(text: str, sections: Optional[Sequence[str]] = ('experience',)) -> str:
+    """
+    The part of a resume searched for employment ranges.
+
+    Only sections that start at a real heading are used (see
+    ``SectionSegmenter.segment``; a keyword in running text never scopes
+    the search), and the whole text is searched when none is found.
+    """
+    if not sections:
+        return text
+    found = [s for s in RESUME_SEGMENTER.segment(text) if s.name in sections]
+    return section_text(text, found, sections) if found else text
+
+
+class ExperienceTable:
+    """
+    Tenure of many resumes as flat arrays.
+
+    ``total_years[i]`` is resume ``i``'s merged tenure (overlapping roles
+    counted once). Roles are stored back to back: resume ``i``'s roles are
+    ``role_start[role_offsets[i]:role_offsets[i + 1]]`` (and likewise for
+    ``role_end`` and ``role_years``), so seniority filters are vectorized
+    comparisons over precomputed values.
+    """
+
+    def __init__(self, total_years, role_start, role_end, role_offsets):
+        np = _require_numpy()
+        self.total_years = np.asarray(total_years, dtype=np.float64)
+        self.role_start = np.asarray(role_start, dtype=np.int32)
+        self.role_end = np.asarray(role_end, dtype=np.int32)
+        self.role_offsets = np.asarray(role_offsets, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.total_years)
+
+    @property
+    def role_years(self):
+        """Length of every role in years (float64 array)."""
+        return (self.role_end - self.role_start) / 12
+
+    @property
+    def role_counts(self):
+        """Number of roles per resume."""
+        np = _require_numpy()
+        return np.diff(self.role_offsets)
+
+    @property
+    def longest_role_years(self):
+        """Longest single role per resume in years (0 without roles)."""
+        np = _require_numpy()
+        longest = np.zeros(len(self))
+        has_roles = self.role_counts > 0
+        if has_roles.any():
+            longest[has_roles] = np.maximum.reduceat(self.role_years, self.role_offsets[:-1][has_roles])
+        return longest
+
+    def roles(self, index: int):
+        """(start month, end month, years) arrays of one resume's roles."""
+        window = slice(self.role_offsets[index], self.role_offsets[index + 1])
+        return self.role_start[window], self.role_end[window], self.role_years[window]
+
+    def at_least(self, years: float):
+        """Indices of the resumes with at least ``years`` of merged tenure."""
+        np = _require_numpy()
+        return np.flatnonzero(self.total_years >= years)
+
+    def save(self, path: Union[str, Path]):
+        """Write the arrays to a ``.npz`` file."""
+        np = _require_numpy()
+        with open(path, 'wb') as f:
+            np.savez(f, total_years=self.total_years, role_start=self.role_start,
+                     role_end=self.role_end, role_offsets=self.role_offsets)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'ExperienceTable':
+        """Read a table written by ``save``."""
+        np = _require_numpy()
+        with np.load(path) as data:
+            return cls(data['total_years'], data['role_start'], data['role_end'], data['role_offsets'])
+
+
+def merge_intervals(np, starts, ends, owners, count: int):
+    """
+    Merged length of every owner's intervals, for all owners at once.
+
+    Intervals are sorted by (owner, start); shifting each owner's months by
+    a per-owner offset keeps a single running maximum of the end from
+    leaking across owners, so every merged block is found in one pass.
+
+    Returns:
+        float64 array of covered months per owner
+    """
+    if not len(starts):
+        return np.zeros(count)
+    order = np.lexsort((starts, owners))
+    span = int(max(ends.max(), starts.max())) + 1
+    shift = owners[order].astype(np.int64) * span
+    starts = starts[order] + shift
+    ends = ends[order] + shift
+    reach = np.maximum.accumulate(ends)
+    new_block = np.ones(len(starts), dtype=bool)
+    new_block[1:] = starts[1:] > reach[:-1]
+    first = np.flatnonzero(new_block)
+    lengths = np.maximum.reduceat(ends, first) - starts[first]
+    return np.bincount(owners[order][first], weights=lengths, minlength=count)
+
+
+def extract_experience_batch(texts: Sequence[str], today: Optional[date] = None,
+                             sections: Optional[Sequence[str]] = ('experience',)) -> ExperienceTable:
+    """
+    Parse the employment ranges of many resumes.
+
+    Args:
+        texts: Resume texts
+        today: Reference date for open-ended ranges (defaults to today)
+        sections: Sections searched for ranges, so education dates are not
+            counted as jobs (the whole text when a resume has none of them;
+            ``None`` always searches the whole text)
+
+    Returns:
+        ExperienceTable with merged and per-role tenure
+    """
+    np = _require_numpy()
+    today = today or date.today()
+    starts, ends, offsets = [], [], [0]
+    for text in texts:
+        for start, end, *_ in parse_ranges(experience_text(text, sections), today):
+            starts.append(start)
+            ends.append(end)
+        offsets.append(len(starts))
+
+    offsets = np.array(offsets, dtype=np.int64)
+    starts = np.array(starts, dtype=np.int64)
+    ends = np.array(ends, dtype=np.int64)
+    owners = np.repeat(np.arange(len(texts)), np.diff(offsets))
+    total_months = merge_intervals(np, starts, ends, owners, len(texts))
+    return ExperienceTable(total_months / 12, starts, ends, offsets)
@@ -0,0 +1,292 @@
+"""
+Columnar Export Module
+Streams analysis records into typed columns, written as Parquet row groups or NumPy .npz.
+"""
+
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from .job_matcher import JobMatcher
+from .store import ATS_COMPONENTS, AnalysisRecord
+
+
+# float32 score columns, in export order
+SCORE_COLUMNS = ('ats_total',) + ATS_COMPONENTS + ('ai_probability', 'experience_years')
+
+# Low-cardinality text columns, stored as int32 codes into a vocabulary (-1 for missing)
+CATEGORY_COLUMNS = ('grade', 'role', 'ai_verdict', 'best_role')
+
+
+def _require_numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("numpy is required for columnar export. Install with: pip install numpy")
+    return np
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("pyarrow is required for Parquet export. Install with: pip install pyarrow")
+    return pa, pq
+
+
+class ColumnarExporter:
+    """
+    Writes analysis records as typed columns, one row group at a time.
+
+    Scores become float32 columns, ``pass_ats`` an int8 column (1, 0, or
+    -1 when the record has no ATS result; null in Parquet), grades, roles
+    and verdicts dictionary codes, skills a dictionary-encoded list column
+    (flat codes and mention counts plus per-row offsets), and job matches a
+    fixed-width float32 matrix with one column per role. Records are buffered up to
+    ``row_group_size`` and then written, so memory stays bounded however
+    many resumes are exported.
+
+    ``.parquet`` files are written with pyarrow (one Parquet row group per
+    batch). ``.npz`` files are written with NumPy only: every row group
+    adds its arrays to the zip archive as it is written (``g00000/ats_total``
+    and so on), and the vocabularies are added on ``close``; see
+    ``read_columns``. The exporter has the same ``add``/``flush``/``close``
+    interface as ``ResultStore``, so it can be the sink of a BatchRunner.
+    """
+
+    def __init__(self, path: Union[str, Path], roles: Optional[Sequence[str]] = None,
+                 row_group_size: int = 1000):
+        """
+        Open the output file.
+
+        Args:
+            path: Output file; ``.parquet`` for Parquet, anything else is ``.npz``
+            roles: Job-match columns (defaults to ``JobMatcher.JOB_DESCRIPTIONS``);
+                matches for other roles are dropped, missing ones are NaN
+            row_group_size: Records per row group
+        """
+        np = _require_numpy()
+        self.path = Path(path)
+        self.format = 'parquet' if self.path.suffix.lower() == '.parquet' else 'npz'
+        self.roles = list(roles) if roles is not None else list(JobMatcher.JOB_DESCRIPTIONS)
+        self.row_group_size = row_group_size
+        self.rows = 0
+        self.row_groups = 0
+        self.skills: Dict[str, int] = {}
+        self.categories: Dict[str, Dict[str, int]] = {name: {} for name in CATEGORY_COLUMNS}
+        self._role_index = {role: i for i, role in enumerate(self.roles)}
+        self._pending: List[AnalysisRecord] = []
+        self._np = np
+
+        if self.format == 'parquet':
+            self._pa, self._pq = _require_pyarrow()
+            self._writer = None
+        else:
+            self._zip = zipfile.ZipFile(self.path, 'w', compression=zipfile.ZIP_DEFLATED, allowZip64=True)
+
+    def __enter__(self) -> 'ColumnarExporter':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.rows + len(self._pending)
+
+    def add(self, record: AnalysisRecord):
+        """Buffer a record (a row group is written every ``row_group_size`` records)."""
+        self._pending.append(record)
+        if len(self._pending) >= self.row_group_size:
+            self.flush()
+
+    def add_many(self, records: Iterable[AnalysisRecord]):
+        for record in records:
+            self.add(record)
+
+    def _code(self, column: str, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        return self.categories[column].setdefault(value, len(self.categories[column]))
+
+    def columns(self, records: Sequence[AnalysisRecord]) -> Dict:
+        """Typed columns of a batch of records (codes refer to this exporter's vocabularies)."""
+        np = self._np
+        count = len(records)
+        columns = {
+            'name': np.array([r.name for r in records], dtype=str),
+            'digest': np.array([r.digest for r in records], dtype=str),
+            'word_count': np.fromiter((r.word_count for r in records), dtype=np.int32, count=count),
+            'pass_ats': np.fromiter((-1 if r.pass_ats is None else int(bool(r.pass_ats)) for r in records),
+                                    dtype=np.int8, count=count),
+        }
+        for name in SCORE_COLUMNS:
+            if name in ATS_COMPONENTS:
+                values = (r.components.get(name) for r in records)
+            else:
+                values = (getattr(r, name) for r in records)
+            columns[name] = np.fromiter((np.nan if v is None else v for v in values), dtype=np.float32, count=count)
+
+        matches = np.full((count, len(self.roles)), np.nan, dtype=np.float32)
+        best_roles = []
+        for row, record in enumerate(records):
+            for role, match in record.job_matches.items():
+                column = self._role_index.get(role)
+                if column is not None:
+                    matches[row, column] = match
+            best_roles.append(max(record.job_matches, key=record.job_matches.get) if record.job_matches else None)
+        columns['job_matches'] = matches
+
+        for name in CATEGORY_COLUMNS:
+            values = best_roles if name == 'best_role' else [getattr(r, name) for r in records]
+            columns[name] = np.fromiter((self._code(name, v) for v in values), dtype=np.int32, count=count)
+
+        codes, mentions, offsets = [], [], [0]
+        for record in records:
+            for skill, mention_count in record.skills.items():
+                codes.append(self.skills.setdefault(skill, len(self.skills)))
+                mentions.append(mention_count)
+            offsets.append(len(codes))
+        columns['skill_codes'] = np.array(codes, dtype=np.int32)
+        columns['skill_mentions'] = np.array(mentions, dtype=np.int32)
+        columns['skill_offsets'] = np.array(offsets, dtype=np.int64)
+        return columns
+
+    def flush(self):
+        """Write the buffered records as one row group."""
+        if not self._pending:
+            return
+        records, self._pending = self._pending, []
+        columns = self.columns(records)
+        if self.format == 'parquet':
+            self._write_parquet(columns)
+        else:
+            prefix = f"g{self.row_groups:05d}/"
+            for name, array in columns.items():
+                self._write_array(prefix + name, array)
+        self.rows += len(records)
+        self.row_groups += 1
+
+    def _write_array(self, name: str, array):
+        with self._zip.open(name + '.npy', 'w', force_zip64=True) as f:
+            self._np.lib.format.write_array(f, self._np.ascontiguousarray(array), allow_pickle=False)
+
+    def _write_parquet(self, columns: Dict):
+        pa = self._pa
+        np = self._np
+        arrays = {name: pa.array(columns[name]) for name in ('name', 'digest', 'word_count')}
+        passed = columns['pass_ats']
+        arrays['pass_ats'] = pa.array(passed == 1, mask=passed < 0)
+        for name in SCORE_COLUMNS:
+            arrays[name] = pa.array(columns[name], from_pandas=True)
+        for name in CATEGORY_COLUMNS:
+            codes = columns[name]
+            vocabulary = pa.array(list(self.categories[name]), type=pa.string())
+            arrays[name] = pa.DictionaryArray.from_arrays(pa.array(codes, mask=codes < 0), vocabulary)
+        offsets = pa.array(columns['skill_offsets'].astype(np.int32))
+        skill_names = pa.array(list(self.skills), type=pa.string())
+        arrays['skills'] = pa.ListArray.from_arrays(
+            offsets, pa.DictionaryArray.from_arrays(pa.array(columns['skill_codes']), skill_names))
+        arrays['skill_mentions'] = pa.ListArray.from_arrays(offsets, pa.array(columns['skill_mentions']))
+        matches = columns['job_matches']
+        arrays['job_matches'] = pa.FixedSizeListArray.from_arrays(
+            pa.array(matches.reshape(-1), from_pandas=True), len(self.roles))
+
+        table = pa.table(arrays)
+        if self._writer is None:
+            metadata = {b'roles': '\n'.join(self.roles).encode('utf-8')}
+            self._writer = self._pq.ParquetWriter(str(self.path), table.schema.with_metadata(metadata))
+        self._writer.write_table(table)
+
+    def close(self):
+        """Write the last row group and finish the file."""
+        self.flush()
+        if self.format == 'parquet':
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        elif self._zip is not None:
+            np = self._np
+            self._write_array('roles', np.array(self.roles, dtype=str))
+            self._write_array('skills', np.array(list(self.skills), dtype=str))
+            for name, vocabulary in self.categories.items():
+                self._write_array(f'{name}_values', np.array(list(vocabulary), dtype=str))
+            self._write_array('row_groups', np.array([self.row_groups], dtype=np.int64))
+            self._zip.close()
+            self._zip = None
+
+
+def export_records(records: Iterable[AnalysisRecord], path: Union[str, Path],
+                   roles: Optional[Sequence[str]] = None, row_group_size: int = 1000) -> int:
+    """
+    Export analysis records to a columnar file.
+
+    Returns:
+        Number of rows written
+    """
+    with ColumnarExporter(path, roles, row_group_size) as exporter:
+        exporter.add_many(records)
+    return exporter.rows
+
+
+def iter_row_groups(path: Union[str, Path]) -> Iterator[Dict]:
+    """Columns of each row group of an exported ``.npz`` file, one group at a time."""
+    np = _require_numpy()
+    with np.load(path) as data:
+        for group in range(int(data['row_groups'][0])):
+            prefix = f"g{group:05d}/"
+            yield {key[len(prefix):]: data[key] for key in data.files if key.startswith(prefix)}
+
+
+def read_columns(path: Union[str, Path]) -> Dict:
+    """
+    Read an exported ``.npz`` file back into whole columns.
+
+    Returns:
+        Column name -> array (skill offsets rebased across row groups),
+        plus the ``roles``, ``skills`` and ``<column>_values`` vocabularies
+    """
+    np = _require_numpy()
+    groups = list(iter_row_groups(path))
+    with np.load(path) as data:
+        columns = {key: data[key] for key in data.files if '/' not in key and key != 'row_groups'}
+    if not groups:
+        return columns
+    for name in groups[0]:
+        if name == 'skill_offsets':
+            parts, base = [np.zeros(1, dtype=np.int64)], 0
+            for group in groups:
+                parts.append(group[name][1:] + base)
+                base += int(group[name][-1])
+            columns[name] = np.concatenate(parts)
+        else:
+            columns[name] = np.concatenate([group[name] for group in groups])
+    return columns
+
+
+def to_dataframe(path: Union[str, Path]):
+    """
+    Load an export into a pandas DataFrame.
+
+    ``pass_ats`` becomes a nullable boolean column, category columns
+    pandas categoricals, ``skills`` a list of
+    skill names per row and each role's match its own ``match_<role>``
+    column. Parquet files are read by pandas directly.
+    """
+    import pandas as pd
+
+    if Path(path).suffix.lower() == '.parquet':
+        return pd.read_parquet(path)
+    np = _require_numpy()
+    columns = read_columns(path)
+    frame = {name: columns[name] for name in ('name', 'digest', 'word_count') + SCORE_COLUMNS}
+    passed = columns['pass_ats']
+    frame['pass_ats'] = pd.arrays.BooleanArray(passed == 1, passed < 0)
+    for name in CATEGORY_COLUMNS:
+        frame[name] = pd.Categorical.from_codes(columns[name], categories=columns[f'{name}_values'])
+    skill_names = columns['skills'][columns['skill_codes']] if len(columns['skill_codes']) else np.array([], dtype=str)
+    offsets = columns['skill_offsets']
+    frame['skills'] = [list(skill_names[offsets[i]:offsets[i + 1]]) for i in range(len(offsets) - 1)]
+    for column, role in enumerate(columns['roles']):
+        frame[f'match_{role}'] = columns['job_matches'][:, column]
+    return pd.DataFrame(frame)
@@ -0,0 +1,121 @@
+"""
+Lexical Features Module
+Collects contact details and ATS formatting signals in one compiled scan.
+"""
+
+import re
+from typing import NamedTuple, Optional
+
+
+EMAIL_PATTERN = r'[\w\.-]+@[\w\.-]+\.\w+'
+PHONE_PATTERN = r'[\+]?[(]?[0-9]{1,3}[)]?[-\s\.]?[0-9]{3,4}[-\s\.]?[0-9]{4,6}'
+SPECIAL_CHAR_PATTERN = r'[^\w\s\.\,\;\:\-\+\@\#\(\)\/\&]'
+
+# Bullet styles recognised by the formatting check ('-' is an allowed
+# character and is checked separately)
+BULLET_CHARS = '•○■►*'
+
+# Groups are tried left to right at each position, so longer / more specific
+# tokens (emails, profile URLs) win over the bare mentions they contain
+_CONTACT_SCANNER = re.compile(
+    r'(?P<email>' + EMAIL_PATTERN + r')'
+    r'|(?P<linkedin_url>(?i:linkedin\.com/in/[\w\-]+))'
+    r'|(?P<github_url>(?i:github\.com/[\w\-]+))'
+    r'|(?P<linkedin>(?i:linkedin))'
+    r'|(?P<portfolio>(?i:github|portfolio|website))'
+)
+
+# Phone numbers, capital runs and special characters never share a
+# character, so one pass counts each as a separate search would; they are
+# kept out of the contact scan so that emails and URLs do not hide them
+# (an "ACME" inside an address, a "LINKEDIN" heading)
+_FORMAT_SCANNER = re.compile(
+    r'(?P<phone>' + PHONE_PATTERN + r')'
+    r'|(?P<caps>\b[A-Z]{5,}\b)'
+    r'|(?P<special>' + SPECIAL_CHAR_PATTERN + r'+)'
+)
+
+_TABLE_PATTERN = re.compile(r'\|.*\|.*\|')
+
+
+class LexicalFeatures(NamedTuple):
+    """Lexical features of one document, shared by the parser and the ATS scorer."""
+    email: Optional[str]
+    phone: Optional[str]
+    linkedin: Optional[str]
+    github: Optional[str]
+    mentions_linkedin: bool
+    mentions_portfolio: bool
+    special_chars: int
+    bullet_types: int
+    all_caps_words: int
+    has_table: bool
+
+
+def scan_features(text: str) -> LexicalFeatures:
+    """
+    Collect all lexical features in two compiled scans (contact tokens, formatting tokens).
+
+    Args:
+        text: Resume text (raw or cleaned)
+
+    Returns:
+        LexicalFeatures record
+    """
+    found = {'email': None, 'phone': None, 'linkedin_url': None, 'github_url': None}
+    mentions_linkedin = False
+    mentions_portfolio = False
+    special_chars = 0
+    pipes = 0
+    all_caps_words = 0
+    bullets = set()
+
+    for match in _FORMAT_SCANNER.finditer(text):
+        kind = match.lastgroup
+        token = match.group()
+        if kind == 'special':
+            special_chars += len(token)
+            pipes += token.count('|')
+            bullets.update(ch for ch in token if ch in BULLET_CHARS)
+        elif kind == 'caps':
+            all_caps_words += 1
+        elif found['phone'] is None:
+            found['phone'] = token
+
+    for match in _CONTACT_SCANNER.finditer(text):
+        kind = match.lastgroup
+        token = match.group()
+        if kind == 'linkedin':
+            mentions_linkedin = True
+        elif kind == 'portfolio':
+            mentions_portfolio = True
+        else:
+            if found[kind] is None:
+                found[kind] = token
+            if kind == 'linkedin_url':
+                mentions_linkedin = True
+            elif kind == 'github_url':
+                mentions_portfolio = True
+            elif kind == 'email':
+                # Mentions inside an address are consumed with it
+                lowered = token.lower()
+                mentions_linkedin = mentions_linkedin or 'linkedin' in lowered
+                mentions_portfolio = mentions_portfolio or any(
+                    word in lowered for word in ('github', 'portfolio', 'website'))
+
+    if '-' in text:
+        bullets.add('-')
+
+    return LexicalFeatures(
+        email=found['email'],
+        phone=found['phone'],
+        linkedin=found['linkedin_url'],
+        github=found['github_url'],
+        mentions_linkedin=mentions_linkedin,
+        mentions_portfolio=mentions_portfolio,
+        special_chars=special_chars,
+        bullet_types=len(bullets),
+        all_caps_words=all_caps_words,
+        # Only worth a second pass when there are enough pipes for a table row
+        has_table=pipes >= 3 and _TABLE_PATTERN.search(text) is not None
+    )
@@ -0,0 +1,268 @@
+"""
+Fuzzy Matching Module
+Typo-tolerant phrase matching with a character-trigram candidate index.
+"""
+
+import json
+from functools import lru_cache
+from typing import AbstractSet, Dict, Iterator, List, Mapping, Optional, Set, Tuple
+
+from .matching import DATA_DIR, PhraseMatcher, span_tokens, tokenize
+
+
+def compact(phrase: str) -> str:
+    """Lowercase phrase with all whitespace removed ("Py thon" -> "python")."""
+    return ''.join(phrase.lower().split())
+
+
+def trigrams(word: str) -> Set[str]:
+    """Distinct character trigrams of a word padded with boundary markers."""
+    padded = '\x02' + word + '\x03'
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def bounded_distance(a: str, b: str, limit: int) -> Optional[int]:
+    """
+    Edit distance between two strings if it is at most ``limit``.
+
+    Counts insertions, deletions, substitutions and transpositions of
+    adjacent characters ("pyhton"). Only a band of ``2 * limit + 1``
+    diagonals is computed and the computation stops as soon as every entry
+    of a row exceeds the limit.
+
+    Returns:
+        The distance, or None if it is larger than ``limit``
+    """
+    if abs(len(a) - len(b)) > limit:
+        return None
+    too_far = limit + 1
+    previous = None
+    row = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [too_far] * (len(b) + 1)
+        if i <= limit:
+            current[0] = i
+        for j in range(max(1, i - limit), min(len(b), i + limit) + 1):
+            cost = a[i - 1] != b[j - 1]
+            value = min(row[j] + 1, current[j - 1] + 1, row[j - 1] + cost)
+            if (previous is not None and j > 1 and a[i - 1] == b[j - 2]
+                    and a[i - 2] == b[j - 1]):
+                value = min(value, previous[j - 2] + 1)
+            current[j] = min(value, too_far)
+        if min(current) > limit:
+            return None
+        previous, row = row, current
+    return row[len(b)] if row[len(b)] <= limit else None
+
+
+@lru_cache(maxsize=1)
+def common_words() -> frozenset:
+    """Common English words that are never read as misspelled phrases (``data/common_words.json``)."""
+    with open(DATA_DIR / 'common_words.json', 'r', encoding='utf-8') as f:
+        return frozenset(json.load(f)['words'])
+
+
+class FuzzyPhraseMatcher:
+    """
+    Phrase matcher that also finds misspelled and broken-up phrases.
+
+    Text is read in windows of one or more adjacent tokens, compacted so
+    that "Py thon" and "Java Script" read as "python" and "javascript".
+    A window whose compacted form is a phrase matches outright (taking
+    precedence over shorter exact matches inside it); the exact
+    PhraseMatcher covers the rest, and the windows still uncovered are
+    looked up in a trigram index of the compacted phrases, bucketed by
+    length and word count. Only phrases sharing enough trigrams to be
+    within the allowed edit distance are shortlisted and verified with a
+    bounded edit distance. Lookups touch a few posting lists and are
+    memoized, so the cost is linear in document length and independent of
+    the vocabulary size.
+
+    Short words are too close to each other for typo tolerance ("string"
+    is one edit from "Spring"), so only windows and phrases of at least
+    eight characters are matched approximately, and only when they start
+    with the same character. Common English words ("solidify") never match
+    approximately, and split tokens are not joined when every piece is a
+    lowercase common word ("roll up" is not "Rollup", "Java Script" is
+    "JavaScript").
+    """
+
+    # (minimum length of both window and phrase, allowed edit distance),
+    # longest first; shorter phrases only match exactly (e.g. when joined
+    # from split tokens)
+    MAX_DISTANCE = ((10, 2), (8, 1), (4, 0))
+
+    # Most windows remembered between documents
+    CACHE_SIZE = 50000
+
+    def __init__(self, phrases: Mapping[str, int], exact: Optional[PhraseMatcher] = None,
+                 stop_words: Optional[AbstractSet[str]] = None):
+        """
+        Compile the matcher.
+
+        Args:
+            phrases: Mapping of phrase to id (aliases may share an id)
+            exact: Exact matcher over the same phrases (compiled if omitted)
+            stop_words: Lowercase words never matched approximately
+                (defaults to ``common_words()``)
+        """
+        self.exact = exact if exact is not None else PhraseMatcher(phrases)
+        self.stop_words = common_words() if stop_words is None else stop_words
+        self._phrases: Dict[str, int] = {}
+        self._words: Dict[str, int] = {}
+        self._index: Dict[Tuple[str, int, int], List[str]] = {}
+        self._grams: Dict[str, Set[str]] = {}
+        self._shapes: Set[Tuple[int, int]] = set()
+        self._cache: Dict[Tuple[str, int], Optional[Tuple[int, int]]] = {}
+        self.max_tokens = 1
+
+        for phrase, phrase_id in phrases.items():
+            key = compact(phrase)
+            if len(key) < self.MAX_DISTANCE[-1][0]:
+                continue
+            # Most words any spelling of the phrase has; windows with more are split phrases
+            self._words[key] = max(self._words.get(key, 0), len(phrase.split()))
+            if key in self._phrases:
+                continue
+            self._phrases[key] = phrase_id
+            self._grams[key] = trigrams(key)
+            self._shapes.add((len(key), len(phrase.split())))
+            for gram in self._grams[key]:
+                self._index.setdefault((gram, len(key), len(phrase.split())), []).append(key)
+            self.max_tokens = max(self.max_tokens, len(tokenize(phrase.lower())) + 1)
+        self.max_length = max(map(len, self._phrases), default=0) + self.MAX_DISTANCE[0][1]
+
+    def __len__(self) -> int:
+        return len(self.exact)
+
+    def _allowed(self, length: int) -> int:
+        for min_length, distance in self.MAX_DISTANCE:
+            if length >= min_length:
+                return distance
+        return -1
+
+    def lookup(self, word: str, words: int = 1) -> Optional[Tuple[int, int]]:
+        """
+        Closest phrase to a compacted window.
+
+        Args:
+            word: Compacted window text
+            words: Number of words the window spans (only phrases with as
+                many words are matched approximately)
+
+        Returns:
+            (phrase id, edit distance), or None if no phrase is close enough
+        """
+        if word in self._phrases:
+            return self._phrases[word], 0
+        if self._allowed(len(word)) <= 0 or word in self.stop_words:
+            return None
+        cache_key = (word, words)
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+        if len(self._cache) >= self.CACHE_SIZE:
+            self._cache.clear()
+
+        best = None
+        grams = trigrams(word)
+        max_distance = self.MAX_DISTANCE[0][1]
+        for length in range(len(word) - max_distance, len(word) + max_distance + 1):
+            limit = min(self._allowed(length), self._allowed(len(word)))
+            if limit <= 0 or abs(length - len(word)) > limit or (length, words) not in self._shapes:
+                continue
+            shared = {}
+            for gram in grams:
+                for key in self._index.get((gram, length, words), ()):
+                    shared[key] = shared.get(key, 0) + 1
+            for key, count in shared.items():
+                # An edit changes at most three trigrams (four for a transposition)
+                if key[0] != word[0] or count < max(len(grams), len(self._grams[key])) - 4 * limit:
+                    continue
+                if best is not None:
+                    limit = min(limit, best[1] - 1)
+                distance = bounded_distance(word, key, limit)
+                if distance is not None:
+                    best = (self._phrases[key], distance)
+        self._cache[cache_key] = best
+        return best
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """
+        Yield (phrase id, start, end) character spans of exact and fuzzy matches.
+
+        Matches found by joining or approximating windows never overlap
+        each other; at each position the longest matching window wins.
+        """
+        tokens, starts, ends = span_tokens(text)
+        words = [token.lstrip(' ') for token in tokens]
+        covered = [False] * len(tokens)
+        matches = []
+
+        def windows(i):
+            """Compacted windows starting at token i with their word counts, shortest first."""
+            size = 0
+            spaces = 0
+            for j in range(i, min(i + self.max_tokens, len(tokens))):
+                if covered[j]:
+                    return
+                size += len(words[j])
+                if size > self.max_length:
+                    return
+                spaces += j > i and tokens[j][0] == ' '
+                yield j + 1 - i, ''.join(words[i:j + 1]), spaces + 1
+
+        def scan(find):
+            i = 0
+            while i < len(tokens):
+                found = None
+                if not covered[i] and words[i][0].isalnum():
+                    for length, word, count in reversed(list(windows(i))):
+                        phrase_id = find(i, length, word, count)
+                        if phrase_id is not None:
+                            found = (phrase_id, length)
+                            break
+                if found is None:
+                    i += 1
+                    continue
+                phrase_id, length = found
+                matches.append((starts[i], ends[i + length - 1], phrase_id))
+                covered[i:i + length] = [True] * length
+                i += length
+
+        def ordinary_words(i, length):
+            """Whether a window reads as ordinary words rather than a split phrase."""
+            pieces = [w for w in words[i:i + length] if w[0].isalnum()]
+            return (all(w.lower() in self.stop_words for w in pieces)
+                    and not any(w[0].isupper() for w in pieces[1:]))
+
+        def joined(i, length, word, count):
+            if length == 1 or word not in self._phrases:
+                return None
+            if count > self._words[word] and ordinary_words(i, length):
+                return None
+            return self._phrases[word]
+
+        # Phrases split across tokens ("Py thon", "Java Script")
+        scan(joined)
+
+        exact = [(phrase_id, i, length) for phrase_id, i, length in self.exact._scan(tokens)
+                 if not any(covered[i:i + length])]
+        for phrase_id, i, length in exact:
+            matches.append((starts[i], ends[i + length - 1], phrase_id))
+            covered[i:i + length] = [True] * length
+
+        def approximate(i, length, word, count):
+            if length > 1 and word in self._phrases:
+                # Joined windows were decided above
+                return None
+            match = self.lookup(word, count)
+            return match[0] if match is not None else None
+
+        scan(approximate)
+
+        for start, end, phrase_id in sorted(matches):
+            yield phrase_id, start, end
+
+    def ids(self, text: str) -> Set[int]:
+        """Ids of all phrases found in the text, exactly or approximately."""
+        return {phrase_id for phrase_id, _, _ in self.finditer(text)}
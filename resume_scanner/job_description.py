@@ -0,0 +1,189 @@
+"""
+Job Description Module
+Extracts key terms from a job posting and caches its compiled keyword matcher.
+"""
+
+import hashlib
+import re
+from collections import Counter, OrderedDict
+from threading import Lock
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+from .matching import KeywordSetMatcher
+from .taxonomy import get_taxonomy
+
+
+# Words that carry no signal in a posting (generic English and job-ad boilerplate)
+STOP_WORDS = {
+    'the', 'and', 'for', 'with', 'you', 'your', 'our', 'are', 'will', 'can', 'who', 'this',
+    'that', 'from', 'have', 'has', 'all', 'any', 'not', 'but', 'its', 'into', 'such', 'their',
+    'they', 'them', 'what', 'when', 'where', 'which', 'while', 'about', 'also', 'other', 'more',
+    'most', 'well', 'both', 'each', 'able', 'ability', 'including', 'using', 'use', 'work',
+    'working', 'team', 'teams', 'role', 'job', 'position', 'candidate', 'candidates', 'company',
+    'experience', 'experienced', 'years', 'year', 'plus', 'strong', 'excellent', 'good', 'great',
+    'knowledge', 'understanding', 'skills', 'skill', 'required', 'requirements', 'preferred',
+    'responsibilities', 'qualifications', 'must', 'should', 'would', 'like', 'looking', 'join',
+    'help', 'new', 'etc', 'across', 'within', 'least', 'one', 'two', 'three', 'based', 'related',
+    'equivalent', 'degree', 'bachelor', 'master', 'field', 'opportunity', 'benefits', 'apply'
+}
+
+_WORD_PATTERN = re.compile(r'\b[a-z][a-z0-9\+#]{2,}')
+
+# Taxonomy categories that are not job requirements in themselves
+NON_TECHNICAL_CATEGORIES = {'soft_skills'}
+
+
+def extract_terms(text: str, max_terms: int = 30) -> List[str]:
+    """
+    Extract the key terms of a job description.
+
+    Known technical skills come first (most mentioned first), followed by
+    other words the posting repeats.
+
+    Args:
+        text: Job description text
+        max_terms: Maximum number of terms returned
+
+    Returns:
+        Lowercase terms in order of importance
+    """
+    taxonomy = get_taxonomy()
+    counts = Counter(skill_id for skill_id, _, _ in taxonomy.finditer(text)
+                     if not NON_TECHNICAL_CATEGORIES.issuperset(taxonomy.skill_categories[skill_id]))
+    # Most mentioned first; ties keep the order of first mention
+    terms = [taxonomy.skills[skill_id] for skill_id, _ in counts.most_common()]
+
+    covered = set(terms)
+    for term in terms:
+        covered.update(term.split())
+    word_counts = Counter(word for word in _WORD_PATTERN.findall(text.lower())
+                          if word not in STOP_WORDS and word not in covered)
+    terms.extend(word for word, count in word_counts.most_common() if count >= 2)
+
+    return terms[:max_terms]
+
+
+def job_description_digest(text: str) -> str:
+    """Cache key of a job description (whitespace and case insensitive)."""
+    normalized = ' '.join(text.lower().split())
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+
+class JobDescription(NamedTuple):
+    """A job description compiled for keyword scoring."""
+    digest: str
+    terms: Tuple[str, ...]
+    matcher: KeywordSetMatcher
+
+    def split(self, text: str) -> Tuple[List[str], List[str]]:
+        """The posting's terms split into (found, missing) for a resume."""
+        return self.matcher.split(self.matcher.scan(text), 'job')
+
+
+def compile_job_description(text: str, max_terms: int = 30) -> JobDescription:
+    """
+    Extract a job description's terms and compile them into a matcher.
+
+    Args:
+        text: Job description text
+        max_terms: Maximum number of terms used as keyword targets
+
+    Returns:
+        JobDescription (uncached; see ``JobDescriptionCache``)
+    """
+    terms = extract_terms(text, max_terms)
+    return JobDescription(
+        digest=job_description_digest(text),
+        terms=tuple(terms),
+        matcher=KeywordSetMatcher({'job': terms})
+    )
+
+
+class JobDescriptionCache:
+    """
+    Thread-safe LRU cache of compiled job descriptions keyed by content hash.
+
+    Scoring many applicants against one posting compiles it once; the least
+    recently used postings are evicted beyond ``maxsize``.
+    """
+
+    def __init__(self, maxsize: int = 64, max_terms: int = 30):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Number of compiled job descriptions kept
+            max_terms: Maximum number of terms per job description
+        """
+        self.maxsize = maxsize
+        self.max_terms = max_terms
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, text: str) -> JobDescription:
+        """Return the compiled job description, compiling it on a cache miss."""
+        digest = job_description_digest(text)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None:
+                self._entries.move_to_end(digest)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        # Compile outside the lock; a concurrent miss for the same posting
+        # just compiles it twice
+        entry = compile_job_description(text, self.max_terms)
+        with self._lock:
+            self._entries[digest] = entry
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self):
+        """Drop all cached job descriptions and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        """Cache statistics."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'size': len(self._entries), 'maxsize': self.maxsize}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Process-wide cache used by the ATS scorer
+JOB_DESCRIPTION_CACHE = JobDescriptionCache()
+
+
+def get_job_description(job_description: Union[str, JobDescription]) -> JobDescription:
+    """Compiled job description for text (cached) or an already compiled one."""
+    if isinstance(job_description, JobDescription):
+        return job_description
+    return JOB_DESCRIPTION_CACHE.get(job_description)
+
+
+def load_job_description(file_path: Optional[str] = None, file_content: Optional[bytes] = None,
+                         file_type: Optional[str] = None) -> JobDescription:
+    """
+    Parse a job description file (PDF, DOCX, TXT) and compile it.
+
+    Args:
+        file_path: Path to the job description file
+        file_content: Raw file bytes (for uploaded files)
+        file_type: File extension (required if using file_content)
+
+    Returns:
+        Cached JobDescription
+    """
+    from .parser import ResumeParser
+    text = ResumeParser().parse(file_path, file_content, file_type)
+    return get_job_description(text)
@@ -4,9 +4,96 @@ Matches resumes to job roles using TF-IDF and cosine similarity.
 """
 
 import re
-from typing import Dict, List, Tuple
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
 from collections import Counter
 import math
+from weakref import WeakKeyDictionary
+
+from .skill_mentions import SkillMentions
+from .skill_profile import SkillProfile
+
+
+class JobMatchResult:
+    """
+    Role similarities of one resume, compact enough to hold many in memory.
+
+    Matches are packed as tenths of a percent in the matcher's role order
+    (the ``roles`` tuple is shared by all results of a matcher) and the best
+    role's missing skills are a taxonomy bitset. The sorted match list and
+    recommendation text are built only when asked for; ``to_dict`` gives
+    the ``JobMatcher.match`` format.
+    """
+
+    __slots__ = ('roles', '_matches', '_missing', 'taxonomy')
+
+    def __init__(self, roles: Tuple[str, ...], matches: Sequence[float],
+                 missing: Optional[SkillProfile] = None, taxonomy=None):
+        """
+        Pack match percentages.
+
+        Args:
+            roles: Role names, shared by the results of one matcher
+            matches: Match percentage per role (one decimal), in role order
+            missing: Skills of the best role the resume lacks (None when no skill scan was given)
+            taxonomy: Taxonomy the missing skill ids refer to
+        """
+        self.roles = roles
+        self._matches = array('h', [round(match * 10) for match in matches]).tobytes()
+        self._missing = None if missing is None else missing.bits
+        self.taxonomy = taxonomy
+
+    def __repr__(self) -> str:
+        return f"JobMatchResult({self.role_matches})"
+
+    @property
+    def role_matches(self) -> Dict[str, float]:
+        """Match percentage per role, in role order."""
+        values = array('h')
+        values.frombytes(self._matches)
+        return {role: value / 10 for role, value in zip(self.roles, values)}
+
+    @property
+    def all_matches(self) -> List[Dict]:
+        """Matches as ``{'role', 'match'}`` dicts, best first (ties in role order)."""
+        matches = [{'role': role, 'match': match} for role, match in self.role_matches.items()]
+        matches.sort(key=lambda x: x['match'], reverse=True)
+        return matches
+
+    @property
+    def best_match(self) -> Optional[Dict]:
+        matches = self.role_matches
+        if not matches:
+            return None
+        role = max(matches, key=matches.get)
+        return {'role': role, 'match': matches[role]}
+
+    @property
+    def missing_skills(self) -> Optional[List[str]]:
+        """Best role's skills the resume does not mention (None without a skill scan)."""
+        if self._missing is None:
+            return None
+        return self.taxonomy.names_of(SkillProfile(self._missing))
+
+    @property
+    def recommendations(self) -> List[str]:
+        recs = JobMatcher.recommendations_from_matches(self.all_matches)
+        missing = self.missing_skills
+        if missing:
+            recs.append(f"Skills often expected for {self.best_match['role']}: {', '.join(missing[:5])}")
+        return recs
+
+    def to_dict(self) -> Dict:
+        """Dictionary in the format returned by ``JobMatcher.match``."""
+        matches = self.all_matches
+        result = {
+            'best_match': matches[0] if matches else None,
+            'all_matches': matches,
+            'recommendations': self.recommendations
+        }
+        if self._missing is not None:
+            result['missing_skills'] = self.missing_skills
+        return result
 
 
 class JobMatcher:
@@ -50,6 +137,9 @@ class JobMatcher:
     def __init__(self):
         self.vocabulary = set()
         self.idf_scores = {}
+        # taxonomy -> role -> skill ids; entries go away with their taxonomy
+        self._role_skills = WeakKeyDictionary()
+        self._roles = tuple(self.JOB_DESCRIPTIONS)
         self._build_vocabulary()
     
     def _build_vocabulary(self):
@@ -107,34 +197,63 @@ class JobMatcher:
             return 0.0
         return dot_product / (mag1 * mag2)
     
-    def match(self, resume_text: str) -> Dict:
+    def role_skills(self, role: str, skills: SkillMentions) -> List[int]:
+        """Taxonomy skill ids named in a role's description (cached per taxonomy)."""
+        taxonomy = skills.taxonomy
+        cached = self._role_skills.get(taxonomy)
+        if cached is None:
+            cached = self._role_skills[taxonomy] = {}
+        if role not in cached:
+            cached[role] = taxonomy.skill_ids(self.JOB_DESCRIPTIONS[role])
+        return cached[role]
+    
+    def match(self, resume_text: str, skills: Optional[SkillMentions] = None) -> Dict:
         """
         Match resume to job roles.
         
+        Args:
+            resume_text: Resume text content
+            skills: Skill scan of the resume (``NLPEngine.scan_skills``); adds
+                the best role's skills the resume does not mention
+        
         Returns:
             Dictionary with matches and recommendations
         """
+        return self.score(resume_text, skills).to_dict()
+    
+    def score(self, resume_text: str, skills: Optional[SkillMentions] = None) -> JobMatchResult:
+        """
+        Match resume to job roles, keeping the result compact.
+        
+        Args:
+            resume_text: Resume text content
+            skills: Skill scan of the resume (``NLPEngine.scan_skills``)
+        
+        Returns:
+            JobMatchResult (``to_dict()`` gives the ``match`` format)
+        """
         resume_tfidf = self._calculate_tfidf(resume_text)
         
         matches = []
         for role, description in self.JOB_DESCRIPTIONS.items():
             job_tfidf = self._calculate_tfidf(description)
             similarity = self._cosine_similarity(resume_tfidf, job_tfidf)
-            match_pct = round(similarity * 100, 1)
-            matches.append({'role': role, 'match': match_pct})
-        
-        matches.sort(key=lambda x: x['match'], reverse=True)
+            matches.append(round(similarity * 100, 1))
         
-        best_match = matches[0] if matches else None
-        
-        return {
-            'best_match': best_match,
-            'all_matches': matches,
-            'recommendations': self._get_recommendations(matches, resume_text)
-        }
+        missing = None
+        if skills is not None and matches:
+            best_role = self._roles[matches.index(max(matches))]
+            missing = SkillProfile.from_ids(skill_id for skill_id in self.role_skills(best_role, skills)
+                                            if skill_id not in skills.ids)
+        return JobMatchResult(self._roles, matches, missing, skills.taxonomy if skills is not None else None)
     
     def _get_recommendations(self, matches: List, resume_text: str) -> List[str]:
         """Get recommendations based on matches."""
+        return self.recommendations_from_matches(matches)
+    
+    @staticmethod
+    def recommendations_from_matches(matches: List[Dict]) -> List[str]:
+        """Recommendations for matches sorted best first."""
         recs = []
         if matches:
             top = matches[0]
@@ -0,0 +1,469 @@
+"""
+Live Session Module
+Incremental re-analysis of a resume while it is being edited.
+"""
+
+import re
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple, Union
+
+from .ai_detector import AIDetector
+from .ats_scorer import ATSResult, ATSScorer
+from .features import BULLET_CHARS, LexicalFeatures, scan_features
+from .job_description import JobDescription, get_job_description
+from .nlp_engine import NLPEngine
+
+
+# A unit ends after a run of sentence terminators and the whitespace after
+# it, or after a line break (which also starts every bullet). A line break
+# between digits is kept inside its unit, since a phone number may span it.
+# Sentences and skill/keyword phrases that run on across a line break are
+# carried over by the session (see ``LiveSession``).
+_UNIT_BOUNDARY = re.compile(r'[.!?]+\s+|(?<![0-9)])\n\s*|\n(?![0-9])\s*')
+_TERMINATORS = re.compile(r'[.!?]+')
+_WORD = re.compile(r'\S+')
+
+
+def split_units(text: str) -> Tuple[List[str], bool]:
+    """
+    Split text into sentence and line units.
+
+    Returns:
+        Tuple of (units, whether the last unit ends at a boundary)
+    """
+    units = []
+    start = 0
+    for match in _UNIT_BOUNDARY.finditer(text):
+        units.append(text[start:match.end()])
+        start = match.end()
+    if start < len(text):
+        units.append(text[start:])
+        return units, False
+    return units, True
+
+
+def _bits(mask: int) -> Tuple[int, ...]:
+    """Indices of the set bits of a mask."""
+    bits = []
+    while mask:
+        low = mask & -mask
+        bits.append(low.bit_length() - 1)
+        mask ^= low
+    return tuple(bits)
+
+
+def _add(counter: Counter, keys, sign: int):
+    """Add (sign=1) or remove (sign=-1) one count of each key."""
+    for key in keys:
+        counter[key] += sign
+        if not counter[key]:
+            del counter[key]
+
+
+def _line_pipes(text: str) -> Tuple[int, int, bool, int]:
+    """Pipes on the first line, on the last line, whether there is a line break, max on inner lines."""
+    lines = text.split('\n')
+    counts = [line.count('|') for line in lines]
+    return counts[0], counts[-1], len(lines) > 1, max(counts[1:-1], default=0)
+
+
+class SeamStats(NamedTuple):
+    """Phrase hits that start in one unit and end in the next."""
+    keyword_ids: Tuple[int, ...] = ()
+    skills: FrozenSet[Tuple[str, str]] = frozenset()
+    ai_phrase_ids: Tuple[int, ...] = ()
+    ai_verb_ids: Tuple[int, ...] = ()
+
+
+class UnitStats(NamedTuple):
+    """Measurements of one unit."""
+    text: str
+    word_count: int
+    # Sentences strictly inside the unit; the text before its first and
+    # after its last terminator continues the neighbouring units' sentences
+    sentence_count: int
+    sentence_starts: Tuple[str, ...]
+    head: str
+    tail: str
+    terminated: bool
+    passive_count: int
+    keyword_ids: Tuple[int, ...]
+    sections: FrozenSet[str]
+    features: LexicalFeatures
+    bullets: FrozenSet[str]
+    line_pipes: Tuple[int, int, bool, int]
+    skills: FrozenSet[Tuple[str, str]]
+    ai_phrase_ids: Tuple[int, ...]
+    ai_verb_ids: Tuple[int, ...]
+    ai_words: Counter
+    # Hits across the boundary with the previous unit
+    seam: SeamStats = SeamStats()
+
+
+class LiveSession:
+    """
+    Keeps ATS, skill and AI-detection results up to date under text edits.
+
+    The text is held as a list of units (sentences, and lines, so each
+    bullet is its own unit) with their measurements, plus running
+    aggregates (word counts, keyword, section, skill and phrase hits, word
+    type counts). An edit re-measures only the units it touches and
+    adjusts the aggregates, so its cost depends on the size of the edit,
+    not of the document.
+
+    Two things run on across units. A phrase split by a line break
+    ("machine\nlearning") is found in the seam between two units: the last
+    and first few words around the boundary, as many as the longest
+    phrase has tokens; seams next to an edit are re-measured with it. A
+    sentence without a terminator spans units (bullet lists rarely have
+    periods), so each unit keeps the open text before its first and after
+    its last terminator, and sentences are joined across units when
+    results are read. Results equal those of analyzing the whole text
+    (with exact skill matching; fuzzy matching may differ at seams).
+    """
+
+    def __init__(self, text: str = '', target_role: Optional[str] = None,
+                 job_description: Union[None, str, JobDescription] = None,
+                 ats_scorer: Optional[ATSScorer] = None, nlp_engine: Optional[NLPEngine] = None,
+                 ai_detector: Optional[AIDetector] = None):
+        """
+        Start a session.
+
+        Args:
+            text: Initial resume text
+            target_role: Target job role for keyword matching (auto-detected if omitted)
+            job_description: Job posting whose key terms are the keyword targets
+            ats_scorer: Scorer to use (defaults to a new ATSScorer)
+            nlp_engine: Skill extractor to use (defaults to pattern matching only)
+            ai_detector: AI detector to use (defaults to a new AIDetector)
+        """
+        self.target_role = target_role
+        self.ats_scorer = ats_scorer or ATSScorer()
+        self.nlp_engine = nlp_engine or NLPEngine(use_spacy=False)
+        self.ai_detector = ai_detector or AIDetector()
+        self.job_description = get_job_description(job_description) if job_description is not None else None
+        self._keyword_matcher = self.ats_scorer.keyword_matcher(self.job_description)
+        self._skill_categories = list(self.nlp_engine.extract_skills(''))
+        taxonomy = self.nlp_engine.taxonomy
+        skill_matcher = taxonomy.fuzzy_matcher if self.nlp_engine.fuzzy else taxonomy.matcher
+        # Words on each side of a boundary that a phrase across it can reach
+        self._seam_words = max(self._keyword_matcher.matcher.max_tokens, skill_matcher.max_tokens,
+                               self.ai_detector._matcher.max_tokens)
+        self._sentences = None
+
+        self.text = ''
+        self._units: List[UnitStats] = []
+        self._totals = Counter()
+        self._keyword_hits = Counter()
+        self._sections = Counter()
+        self._bullets = Counter()
+        self._skills = Counter()
+        self._ai_phrases = Counter()
+        self._ai_verbs = Counter()
+        self._ai_words = Counter()
+        if text:
+            self.replace(0, 0, text)
+
+    def update(self, text: str) -> Tuple[int, int, str]:
+        """
+        Replace the whole text, applying only the changed region.
+
+        Returns:
+            The edit applied, as (start, end, replacement) on the old text
+        """
+        old = self.text
+        limit = min(len(old), len(text))
+
+        # Common prefix and suffix by binary search on slice equality
+        low, high = 0, limit
+        while low < high:
+            mid = (low + high + 1) // 2
+            if old[:mid] == text[:mid]:
+                low = mid
+            else:
+                high = mid - 1
+        prefix = low
+
+        low, high = 0, limit - prefix
+        while low < high:
+            mid = (low + high + 1) // 2
+            if old[len(old) - mid:] == text[len(text) - mid:]:
+                low = mid
+            else:
+                high = mid - 1
+        suffix = low
+
+        edit = (prefix, len(old) - suffix, text[prefix:len(text) - suffix])
+        if edit[0] != edit[1] or edit[2]:
+            self.replace(*edit)
+        return edit
+
+    def replace(self, start: int, end: int, replacement: str):
+        """
+        Apply an edit: replace ``text[start:end]`` with ``replacement``.
+
+        Args:
+            start: Start offset of the replaced range
+            end: End offset of the replaced range
+            replacement: Inserted text
+        """
+        if not 0 <= start <= end <= len(self.text):
+            raise ValueError("edit range is outside the text")
+
+        units = self._units
+        starts = list(accumulate([0] + [len(unit.text) for unit in units]))
+
+        # Re-measure from the unit holding the character before the edit (its
+        # trailing whitespace may grow) through the unit holding its end
+        first = max(bisect_right(starts, max(start - 1, 0)) - 1, 0)
+        last = min(bisect_right(starts, end) - 1, len(units) - 1)
+        region_start = starts[first]
+        region_end = starts[last + 1] if units else 0
+
+        region = self.text[region_start:start] + replacement + self.text[end:region_end]
+        pieces, complete = split_units(region)
+        # An edit that removed a boundary merges the region with the next unit
+        while not complete and last + 1 < len(units):
+            last += 1
+            region += units[last].text
+            pieces, complete = split_units(region)
+
+        # Seams reaching into the region: those of the units before it whose
+        # following words up to the region are fewer than a seam spans, and
+        # likewise after it
+        before = first
+        words = 0
+        while before > 1 and words + units[before - 1].word_count < self._seam_words:
+            before -= 1
+            words += units[before].word_count
+        after = last + 1
+        words = 0
+        while after + 1 < len(units) and words + units[after].word_count < self._seam_words:
+            words += units[after].word_count
+            after += 1
+
+        for unit in units[first:last + 1]:
+            self._count(unit, -1)
+        refreshed = [i for i in range(before, after + 1) if i < len(units) and not first <= i <= last]
+        for i in refreshed:
+            self._count_seam(units[i].seam, -1)
+
+        new_units = [self._measure(piece) for piece in pieces]
+        for unit in new_units:
+            self._count(unit, 1)
+        units[first:last + 1] = new_units
+        self.text = self.text[:start] + replacement + self.text[end:]
+        self._sentences = None
+
+        shift = len(new_units) - (last + 1 - first)
+        starts = list(accumulate([0] + [len(unit.text) for unit in units]))
+        seams = [i if i < first else i + shift for i in refreshed]
+        seams += range(first, first + len(new_units))
+        for i in seams:
+            if 0 < i < len(units):
+                units[i] = units[i]._replace(seam=self._measure_seam(i, starts))
+                self._count_seam(units[i].seam, 1)
+
+    def _measure_seam(self, index: int, starts: List[int]) -> SeamStats:
+        """Hits across the boundary before unit ``index``."""
+        reach = self._seam_words
+        if reach < 2:
+            return SeamStats()
+        units = self._units
+        boundary = starts[index]
+
+        low, words = index, 0
+        while low > 0 and words < reach:
+            low -= 1
+            words += units[low].word_count
+        left = self.text[starts[low]:boundary]
+        left_words = list(_WORD.finditer(left))
+        if len(left_words) > reach:
+            left = left[left_words[-reach].start():]
+
+        high, words = index, 0
+        while high < len(units) and words < reach:
+            words += units[high].word_count
+            high += 1
+        right = self.text[boundary:starts[high]]
+        right_words = list(_WORD.finditer(right))
+        if len(right_words) > reach:
+            right = right[:right_words[reach - 1].end()]
+
+        seam = left + right
+        split = len(left)
+
+        def crossing(spans):
+            return {span_id for span_id, span_start, span_end in spans if span_start < split < span_end}
+
+        keyword_ids = crossing(self._keyword_matcher.matcher.finditer(seam))
+        skill_ids = crossing(self.nlp_engine.taxonomy.finditer(seam, self.nlp_engine.fuzzy))
+        term_ids = crossing(self.ai_detector._matcher.finditer(seam))
+        if not (keyword_ids or skill_ids or term_ids):
+            return SeamStats()
+        phrase_count = len(self.ai_detector.phrases)
+        skills = self.nlp_engine.taxonomy.by_category(skill_ids)
+        return SeamStats(
+            keyword_ids=tuple(sorted(keyword_ids)),
+            skills=frozenset((category, skill) for category, found in skills.items() for skill in found),
+            ai_phrase_ids=tuple(sorted(i for i in term_ids if i < phrase_count)),
+            ai_verb_ids=tuple(sorted(i - phrase_count for i in term_ids if i >= phrase_count))
+        )
+
+    def _measure(self, text: str) -> UnitStats:
+        """Measure one unit."""
+        text_lower = text.lower()
+        words = text.split()
+        detector = self.ai_detector
+        skills = self.nlp_engine.extract_skills(text)
+        ai_phrase_ids, ai_verb_ids = detector.hit_ids(text)
+        pieces = _TERMINATORS.split(text)
+        inner = [piece.strip() for piece in pieces[1:-1]]
+
+        return UnitStats(
+            text=text,
+            word_count=len(words),
+            sentence_count=sum(1 for piece in inner if piece),
+            sentence_starts=tuple(piece.split(None, 1)[0].lower() for piece in inner if len(piece) > 20),
+            head=pieces[0],
+            tail=pieces[-1],
+            terminated=len(pieces) > 1,
+            passive_count=sum(1 for w in words if w.lower() in ATSScorer.PASSIVE_INDICATORS),
+            keyword_ids=_bits(self._keyword_matcher.scan(text)),
+            sections=frozenset(ATSScorer._SECTION_SEGMENTER.present(text)),
+            features=scan_features(text),
+            bullets=frozenset(ch for ch in BULLET_CHARS + '-' if ch in text),
+            line_pipes=_line_pipes(text),
+            skills=frozenset((category, skill) for category, found in skills.items() for skill in found),
+            ai_phrase_ids=ai_phrase_ids,
+            ai_verb_ids=ai_verb_ids,
+            ai_words=Counter(detector._words(text_lower))
+        )
+
+    def _count(self, unit: UnitStats, sign: int):
+        """Add (sign=1) or remove (sign=-1) a unit's measurements from the aggregates."""
+        totals = self._totals
+        totals['word_count'] += sign * unit.word_count
+        totals['passive_count'] += sign * unit.passive_count
+        totals['special_chars'] += sign * unit.features.special_chars
+        totals['all_caps_words'] += sign * unit.features.all_caps_words
+        totals['mentions_linkedin'] += sign * unit.features.mentions_linkedin
+        totals['mentions_portfolio'] += sign * unit.features.mentions_portfolio
+
+        for counter, keys in ((self._keyword_hits, unit.keyword_ids), (self._sections, unit.sections),
+                              (self._bullets, unit.bullets), (self._skills, unit.skills),
+                              (self._ai_phrases, unit.ai_phrase_ids), (self._ai_verbs, unit.ai_verb_ids)):
+            _add(counter, keys, sign)
+        self._count_seam(unit.seam, sign)
+
+        words = self._ai_words
+        for word, count in unit.ai_words.items():
+            words[word] += sign * count
+            if not words[word]:
+                del words[word]
+        totals['ai_word_count'] += sign * sum(unit.ai_words.values())
+
+    def _count_seam(self, seam: SeamStats, sign: int):
+        """Add or remove the hits across a unit boundary."""
+        for counter, keys in ((self._keyword_hits, seam.keyword_ids), (self._skills, seam.skills),
+                              (self._ai_phrases, seam.ai_phrase_ids), (self._ai_verbs, seam.ai_verb_ids)):
+            _add(counter, keys, sign)
+
+    def _sentence_totals(self) -> Tuple[int, Counter]:
+        """Sentence count and first-word counts, joining sentences that run across units."""
+        if self._sentences is None:
+            count = 0
+            starts = Counter()
+            carried = []
+
+            def close(sentence):
+                nonlocal count
+                sentence = sentence.strip()
+                if sentence:
+                    count += 1
+                if len(sentence) > 20:
+                    starts[sentence.split(None, 1)[0].lower()] += 1
+
+            for unit in self._units:
+                carried.append(unit.head)
+                if unit.terminated:
+                    close(''.join(carried))
+                    count += unit.sentence_count
+                    starts.update(unit.sentence_starts)
+                    carried = [unit.tail]
+            close(''.join(carried))
+            self._sentences = (count, starts)
+        return self._sentences
+
+    def _features(self) -> LexicalFeatures:
+        """Lexical features of the whole text from the per-unit features."""
+        first = {}
+        for field in ('email', 'phone', 'linkedin', 'github'):
+            first[field] = next((getattr(u.features, field) for u in self._units
+                                 if getattr(u.features, field) is not None), None)
+
+        # A table row is a line with three pipes; lines may span units
+        has_table = False
+        line = 0
+        for unit in self._units:
+            head, tail, broken, inner = unit.line_pipes
+            if line + head >= 3 or inner >= 3:
+                has_table = True
+                break
+            line = tail if broken else line + head
+        has_table = has_table or line >= 3
+
+        return LexicalFeatures(
+            mentions_linkedin=self._totals['mentions_linkedin'] > 0,
+            mentions_portfolio=self._totals['mentions_portfolio'] > 0,
+            special_chars=self._totals['special_chars'],
+            bullet_types=len(self._bullets),
+            all_caps_words=self._totals['all_caps_words'],
+            has_table=has_table,
+            **first
+        )
+
+    def ats(self) -> ATSResult:
+        """ATS score of the current text."""
+        scorer = self.ats_scorer
+        keyword_hits = sum(1 << keyword_id for keyword_id in self._keyword_hits)
+        role, found, missing = scorer.split_keywords(keyword_hits, self.target_role, self.job_description)
+        signals = scorer.assemble_signals(
+            role, set(self._sections), found, missing, self._features(),
+            self._totals['word_count'], self._sentence_totals()[0], self._totals['passive_count']
+        )
+        return scorer.score_signals(signals)
+
+    def skills(self) -> Dict[str, List[str]]:
+        """Categorized skills of the current text (as ``NLPEngine.extract_skills``)."""
+        skills = {category: [] for category in self._skill_categories}
+        for category, skill in self._skills:
+            skills[category].append(skill)
+        return {category: sorted(found, key=str.lower) for category, found in skills.items()}
+
+    def ai(self) -> Dict:
+        """AI-detection result of the current text (as ``AIDetector.analyze``)."""
+        detector = self.ai_detector
+        starts = self._sentence_totals()[1]
+        return detector.result_from_counts(
+            [p for i, p in enumerate(detector.phrases) if i in self._ai_phrases],
+            [v for i, v in enumerate(detector.verbs) if i in self._ai_verbs],
+            self._totals['ai_word_count'], len(self._ai_words),
+            sum(starts.values()), max(starts.values(), default=0),
+            detector.language_model_score(self.text)
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """Running aggregates of the current text."""
+        return {
+            'units': len(self._units),
+            'word_count': self._totals['word_count'],
+            'sentence_count': self._sentence_totals()[0],
+            'tokens': self._totals['ai_word_count'],
+            'types': len(self._ai_words),
+            'keyword_hits': len(self._keyword_hits),
+            'skills': len(self._skills),
+            'ai_phrase_hits': len(self._ai_phrases) + len(self._ai_verbs)
+        }
@@ -0,0 +1,256 @@
+"""
+Phrase Matching Module
+Token-based multi-phrase matchers shared by the analyzers.
+"""
+
+import re
+from pathlib import Path
+from typing import AbstractSet, Dict, Iterable, Iterator, List, Mapping, Set, Tuple, Union
+
+from .text_buffer import NormalizedText
+
+
+DATA_DIR = Path(__file__).resolve().parent.parent / 'data'
+
+# A token is a word or a single punctuation character, optionally preceded by
+# one space (whitespace is collapsed first) so phrases only match where the
+# text has the same spacing: '.net' does not match "project. Net revenue"
+_TOKEN_PATTERN = re.compile(r' ?(?:\w+|[^\w\s])')
+_SPAN_PATTERN = re.compile(r'(\s*)(\w+|[^\w\s])')
+_LETTERS = re.compile(r'[a-z]+')
+
+
+def tokenize(text: str) -> List[str]:
+    """Split lowercase text into matcher tokens."""
+    return _TOKEN_PATTERN.findall(' '.join(text.split()))
+
+
+def text_tokens(text: str) -> List[str]:
+    """Tokens of a text, cached on a NormalizedText so all matchers share them."""
+    if isinstance(text, NormalizedText):
+        if text._tokens is None:
+            text._tokens = tokenize(text.lower())
+        return text._tokens
+    return tokenize(text.lower())
+
+
+def span_tokens(text: str) -> Tuple[List[str], List[int], List[int]]:
+    """Matcher tokens of a text with the start and end offset of each token."""
+    tokens = []
+    starts = []
+    ends = []
+    for match in _SPAN_PATTERN.finditer(text.lower()):
+        token = match.group(2)
+        tokens.append(' ' + token if match.group(1) and tokens else token)
+        starts.append(match.start(2))
+        ends.append(match.end(2))
+    return tokens, starts, ends
+
+
+def popcount(mask: int) -> int:
+    """Number of set bits in a bitmask."""
+    return bin(mask).count('1')
+
+
+class PhraseMatcher:
+    """
+    Matches any number of phrases against text in a single token scan.
+
+    Phrases are compiled into a dictionary keyed by token tuples, so a scan
+    costs one dictionary lookup per token (plus one per candidate phrase
+    length) however many phrases there are. Matches are whole-token, i.e.
+    boundary-aware ('r' does not match inside "react"), and every phrase
+    occurrence is found, including phrases nested in longer ones.
+    """
+
+    def __init__(self, phrases: Union[Iterable[str], Mapping[str, int]]):
+        """
+        Compile the matcher.
+
+        Args:
+            phrases: Phrases to match; ids are their positions, or the values
+                when a mapping of phrase to id is given (several phrases may
+                share an id, e.g. aliases)
+        """
+        if not isinstance(phrases, Mapping):
+            phrases = {phrase: index for index, phrase in enumerate(phrases)}
+
+        self.phrases = dict(phrases)
+        self._table: Dict[Tuple[str, ...], Tuple[int, ...]] = {}
+        self._lengths: Dict[str, Tuple[int, ...]] = {}
+        self._first_words = None
+        self._max_chars = 0
+
+        lengths = {}
+        for phrase, phrase_id in self.phrases.items():
+            tokens = tuple(tokenize(phrase.lower()))
+            if not tokens:
+                continue
+            ids = self._table.get(tokens, ())
+            if phrase_id not in ids:
+                self._table[tokens] = ids + (phrase_id,)
+            lengths.setdefault(tokens[0], set()).add(len(tokens))
+
+        for first, token_lengths in lengths.items():
+            ordered = tuple(sorted(token_lengths, reverse=True))
+            # The first token of a match may or may not follow a space
+            self._lengths[first] = ordered
+            self._lengths[' ' + first] = ordered
+
+    def __len__(self) -> int:
+        return len(self.phrases)
+
+    @property
+    def max_tokens(self) -> int:
+        """Most tokens in any phrase (a match never spans more)."""
+        return max(map(len, self._table), default=0)
+
+    def to_state(self) -> Dict:
+        """Compiled tables as plain JSON-serializable data (see ``from_state``)."""
+        return {
+            'phrases': self.phrases,
+            'table': [[list(tokens), list(ids)] for tokens, ids in self._table.items()],
+            'lengths': {token: list(lengths) for token, lengths in self._lengths.items()},
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict) -> 'PhraseMatcher':
+        """Rebuild a matcher from ``to_state`` data without recompiling."""
+        matcher = cls.__new__(cls)
+        matcher.phrases = dict(state['phrases'])
+        matcher._table = {tuple(tokens): tuple(ids) for tokens, ids in state['table']}
+        matcher._lengths = {token: tuple(lengths) for token, lengths in state['lengths'].items()}
+        matcher._first_words = None
+        matcher._max_chars = 0
+        return matcher
+
+    def _scan(self, tokens: List[str]) -> Iterator[Tuple[int, int, int]]:
+        """Yield (phrase id, first token index, token count) for every match."""
+        table = self._table
+        get_lengths = self._lengths.get
+        count = len(tokens)
+        for i, token in enumerate(tokens):
+            lengths = get_lengths(token)
+            if lengths is None:
+                continue
+            first = token.lstrip(' ')
+            for length in lengths:
+                if i + length > count:
+                    continue
+                ids = table.get((first,) + tuple(tokens[i + 1:i + length]))
+                if ids:
+                    for phrase_id in ids:
+                        yield phrase_id, i, length
+
+    def hits(self, text: str) -> int:
+        """Bitmask of the ids of all phrases present in the text."""
+        return self.token_hits(text_tokens(text))
+
+    def token_hits(self, tokens: List[str]) -> int:
+        """Bitmask of the ids of all phrases present in already tokenized text."""
+        mask = 0
+        for phrase_id, _, _ in self._scan(tokens):
+            mask |= 1 << phrase_id
+        return mask
+
+    def sparse_hits(self, text: str, words: AbstractSet[str]) -> int:
+        """
+        Bitmask of the ids of all phrases present in the text, like ``hits``.
+
+        Instead of tokenizing the whole text, only the phrases whose first
+        word is among the text's words are looked for: one regular
+        expression search finds where they start and only the few
+        characters after each start are tokenized, which is much faster on
+        texts where phrases are rare.
+
+        Args:
+            text: Text to search
+            words: Lowercase all-letter words of the text (``\\b[a-z]+\\b``)
+        """
+        if self._first_words is None:
+            firsts = {tokens[0] for tokens in self._table}
+            self._first_words = frozenset(firsts) if all(_LETTERS.fullmatch(f) for f in firsts) else ()
+            self._max_chars = max((len(''.join(tokens)) for tokens in self._table), default=0)
+        if self._first_words == ():
+            return self.hits(text)
+        candidates = self._first_words.intersection(words)
+        if not candidates:
+            return 0
+
+        lower = text.lower()
+        pattern = re.compile(r'\b(?:%s)\b' % '|'.join(sorted(candidates, key=len, reverse=True)))
+        # One character more than the longest phrase, so a longer word
+        # ("drivenness") is not cut down to a phrase word ("driven")
+        size = self._max_chars + 1
+        mask = 0
+        for match in pattern.finditer(lower):
+            start = match.start()
+            piece = ' '.join(lower[start:start + 2 * size].split())
+            if len(piece) < size:
+                # Wide whitespace: normalize the rest of the text instead
+                piece = ' '.join(lower[start:].split())
+            tokens = _TOKEN_PATTERN.findall(piece, 0, size)
+            for phrase_id, i, _ in self._scan(tokens):
+                if i == 0:
+                    mask |= 1 << phrase_id
+        return mask
+
+    def ids(self, text: str) -> Set[int]:
+        """Ids of all phrases present in the text (cheaper than ``hits`` for large vocabularies)."""
+        return {phrase_id for phrase_id, _, _ in self._scan(text_tokens(text))}
+
+    def counts(self, text: str) -> Dict[int, int]:
+        """Number of occurrences of each phrase id found in the text."""
+        counts = {}
+        for phrase_id, _, _ in self._scan(text_tokens(text)):
+            counts[phrase_id] = counts.get(phrase_id, 0) + 1
+        return counts
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """
+        Yield (phrase id, start, end) character spans of every match.
+
+        Spans index into ``text`` itself (lowercasing must not change its
+        length, which holds for the cleaned resume text).
+        """
+        tokens, starts, ends = span_tokens(text)
+        for phrase_id, i, length in self._scan(tokens):
+            yield phrase_id, starts[i], ends[i + length - 1]
+
+
+class KeywordSetMatcher:
+    """
+    Matches several named keyword lists (e.g. one per role) in one scan.
+
+    All keywords share one PhraseMatcher over their combined vocabulary; a
+    scan yields a vocabulary hit bitmask, and ANDing it with each list's mask
+    gives the list x keyword hit bitmap. Scan cost does not grow with the
+    number of lists.
+    """
+
+    def __init__(self, keyword_sets: Dict[str, List[str]]):
+        vocabulary = {}
+        for keywords in keyword_sets.values():
+            for keyword in keywords:
+                vocabulary.setdefault(keyword.lower(), len(vocabulary))
+
+        self.keyword_sets = keyword_sets
+        self.matcher = PhraseMatcher(vocabulary)
+        self._ids = {name: [vocabulary[k.lower()] for k in keywords]
+                     for name, keywords in keyword_sets.items()}
+        self.masks = {name: sum(1 << i for i in set(ids)) for name, ids in self._ids.items()}
+
+    def scan(self, text: str) -> int:
+        """Vocabulary hit bitmask for the text."""
+        return self.matcher.hits(text)
+
+    def hit_counts(self, mask: int) -> Dict[str, int]:
+        """Number of keywords of each list present in a scanned text."""
+        return {name: popcount(mask & set_mask) for name, set_mask in self.masks.items()}
+
+    def split(self, mask: int, name: str) -> Tuple[List[str], List[str]]:
+        """A list's keywords split into (found, missing), in list order."""
+        found, missing = [], []
+        for keyword, keyword_id in zip(self.keyword_sets[name], self._ids[name]):
+            (found if mask >> keyword_id & 1 else missing).append(keyword)
+        return found, missing
@@ -0,0 +1,208 @@
+"""
+N-gram Language Model Module
+Hashed character n-gram model separating human-written from AI-generated resumes.
+"""
+
+import json
+import math
+from pathlib import Path
+from typing import List, Optional, Sequence, Union
+
+from .matching import DATA_DIR
+
+
+# Odd 64-bit multiplier of the multiply-shift n-gram hash
+_HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+
+
+def _require_numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("numpy is required for the n-gram model. Install with: pip install numpy")
+    return np
+
+
+class NGramModel:
+    """
+    Character n-gram model scored by table lookup.
+
+    Every byte n-gram of the lowercased, whitespace-normalized text is
+    hashed into one of ``2 ** bits`` buckets. Training counts the buckets
+    of known-human and known-AI resumes and stores one float32 table of
+    log-likelihood ratios, log P(n-gram | AI) - log P(n-gram | human).
+    Scoring a text is a vectorized hash, gather and mean over its n-grams,
+    mapped to a probability with a logistic curve fitted on the training
+    documents. The table is saved as ``.npy`` and memory-mapped on load.
+    """
+
+    def __init__(self, table, order: int = 4, slope: float = 1.0, intercept: float = 0.0):
+        """
+        Wrap a trained table (see ``train`` and ``load``).
+
+        Args:
+            table: float32 log-likelihood ratio per bucket (length a power of two)
+            order: Characters (bytes) per n-gram, at most 8
+            slope: Logistic slope applied to the mean ratio
+            intercept: Logistic intercept
+        """
+        if not 1 <= order <= 8:
+            raise ValueError("order must be between 1 and 8")
+        self.table = table
+        self.order = order
+        self.bits = int(len(table)).bit_length() - 1
+        if len(table) != 1 << self.bits:
+            raise ValueError("table length must be a power of two")
+        self.slope = slope
+        self.intercept = intercept
+
+    def ngram_buckets(self, text: str):
+        """Bucket index of every n-gram of the text (uint64 array)."""
+        np = _require_numpy()
+        data = np.frombuffer((' ' + ' '.join(text.lower().split()) + ' ').encode('utf-8'), dtype=np.uint8)
+        count = len(data) - self.order + 1
+        if count <= 0:
+            return np.empty(0, dtype=np.uint64)
+        keys = np.zeros(count, dtype=np.uint64)
+        for offset in range(self.order):
+            keys = (keys << np.uint64(8)) | data[offset:offset + count]
+        return (keys * np.uint64(_HASH_MULTIPLIER)) >> np.uint64(64 - self.bits)
+
+    def mean_ratio(self, text: str) -> float:
+        """Mean log-likelihood ratio of the text's n-grams (positive leans AI)."""
+        buckets = self.ngram_buckets(text)
+        if not len(buckets):
+            return 0.0
+        return float(self.table[buckets].mean(dtype='float64'))
+
+    def probability(self, text: str) -> float:
+        """Probability (0-100) that the text is AI-generated."""
+        return self._logistic(self.mean_ratio(text))
+
+    def probabilities(self, texts: Sequence[str]):
+        """``probability`` of many texts (float64 array)."""
+        np = _require_numpy()
+        return np.fromiter((self.probability(text) for text in texts), dtype=np.float64, count=len(texts))
+
+    def _logistic(self, ratio: float) -> float:
+        z = self.slope * ratio + self.intercept
+        if z < -700:
+            return 0.0
+        return 100 / (1 + math.exp(-z))
+
+    @classmethod
+    def train(cls, human_texts: Sequence[str], ai_texts: Sequence[str], order: int = 4,
+              bits: int = 18, alpha: float = 0.5) -> 'NGramModel':
+        """
+        Train a model on labelled resumes.
+
+        Args:
+            human_texts: Known human-written resumes
+            ai_texts: Known AI-generated resumes
+            order: Characters per n-gram
+            bits: log2 of the number of hash buckets
+            alpha: Additive smoothing of the bucket counts
+
+        Returns:
+            Trained NGramModel
+        """
+        np = _require_numpy()
+        if not human_texts or not ai_texts:
+            raise ValueError("training needs both human and AI examples")
+        model = cls(np.zeros(1 << bits, dtype=np.float32), order)
+
+        log_probs = []
+        for texts in (human_texts, ai_texts):
+            counts = np.full(1 << bits, alpha, dtype=np.float64)
+            for text in texts:
+                counts += np.bincount(model.ngram_buckets(text).astype(np.int64), minlength=1 << bits)
+            log_probs.append(np.log(counts / counts.sum()))
+        model.table = (log_probs[1] - log_probs[0]).astype(np.float32)
+
+        ratios = np.array([model.mean_ratio(text) for text in list(human_texts) + list(ai_texts)])
+        labels = np.concatenate([np.zeros(len(human_texts)), np.ones(len(ai_texts))])
+        model.slope, model.intercept = _fit_logistic(np, ratios, labels)
+        return model
+
+    def save(self, path: Union[str, Path]):
+        """Write the table to ``path`` (.npy) and the parameters next to it (.json)."""
+        np = _require_numpy()
+        path = Path(path)
+        np.save(path, np.ascontiguousarray(self.table, dtype=np.float32))
+        with open(path.with_suffix('.json'), 'w', encoding='utf-8') as f:
+            json.dump({'order': self.order, 'slope': self.slope, 'intercept': self.intercept}, f, indent=2)
+
+    @classmethod
+    def load(cls, path: Union[str, Path], mmap: bool = True) -> 'NGramModel':
+        """Read a model written by ``save`` (the table is memory-mapped by default)."""
+        np = _require_numpy()
+        path = Path(path)
+        with open(path.with_suffix('.json'), encoding='utf-8') as f:
+            params = json.load(f)
+        table = np.load(path, mmap_mode='r' if mmap else None)
+        return cls(table, params['order'], params['slope'], params['intercept'])
+
+
+def load_language_model(path: Union[str, Path, None] = None) -> Optional[NGramModel]:
+    """
+    Load the trained model if one has been installed.
+
+    Args:
+        path: Model table (defaults to ``data/ngram_model.npy``)
+
+    Returns:
+        NGramModel, or None if there is no model file
+    """
+    path = Path(path) if path is not None else DATA_DIR / 'ngram_model.npy'
+    if not path.exists():
+        return None
+    return NGramModel.load(path)
+
+
+def _fit_logistic(np, x, y, l2: float = 1e-3, iterations: int = 50):
+    """One-feature logistic regression by Newton's method, returns (slope, intercept)."""
+    scale = x.std() or 1.0
+    features = np.column_stack([(x - x.mean()) / scale, np.ones(len(x))])
+    weights = np.zeros(2)
+    for _ in range(iterations):
+        p = 1 / (1 + np.exp(-features @ weights))
+        gradient = features.T @ (p - y) + l2 * weights
+        hessian = (features * (p * (1 - p))[:, None]).T @ features + l2 * np.eye(2)
+        step = np.linalg.solve(hessian, gradient)
+        weights -= step
+        if np.abs(step).max() < 1e-8:
+            break
+    slope = weights[0] / scale
+    return float(slope), float(weights[1] - slope * x.mean())
+
+
+def _read_texts(directory: Union[str, Path]) -> List[str]:
+    from .parser import ResumeParser
+    parser = ResumeParser()
+    texts = []
+    for path in sorted(Path(directory).iterdir()):
+        if path.suffix.lower() in ('.pdf', '.docx', '.txt'):
+            texts.append(parser.parse(str(path)))
+    return texts
+
+
+def main(argv: Optional[List[str]] = None):
+    """Train a model: python -m resume_scanner.ngram_model HUMAN_DIR AI_DIR -o MODEL.npy"""
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description="Train the AI-detection n-gram model")
+    arg_parser.add_argument('human_dir', help="Directory of human-written resumes (PDF, DOCX, TXT)")
+    arg_parser.add_argument('ai_dir', help="Directory of AI-generated resumes")
+    arg_parser.add_argument('-o', '--output', default='data/ngram_model.npy', help="Output table (.npy)")
+    arg_parser.add_argument('--order', type=int, default=4, help="Characters per n-gram")
+    arg_parser.add_argument('--bits', type=int, default=18, help="log2 of the number of hash buckets")
+    args = arg_parser.parse_args(argv)
+
+    human, ai = _read_texts(args.human_dir), _read_texts(args.ai_dir)
+    model = NGramModel.train(human, ai, order=args.order, bits=args.bits)
+    model.save(args.output)
+    print(f"Trained on {len(human)} human and {len(ai)} AI resumes -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
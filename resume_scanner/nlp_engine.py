@@ -4,8 +4,55 @@ Handles skill extraction, entity recognition, and text analysis using NLP.
 """
 
 import re
-from typing import List, Dict, Set, Tuple
+from typing import Any, List, Dict, Tuple, Optional, Iterable, Sequence, Union
 from collections import Counter
+from datetime import date
+from threading import Lock
+
+from .experience import ExperienceTable, experience_text, extract_experience_batch, merged_months, parse_ranges
+from .sections import RESUME_SEGMENTER
+from .skill_mentions import SkillMentions, scan_mentions
+from .skill_profile import SkillProfile
+from .taxonomy import DEFAULT_TAXONOMY, SkillTaxonomy, TaxonomyLoader
+from .text_buffer import split_words
+
+
+# Pipeline components entity extraction never reads; excluding them skips
+# loading their weights and running them on every document
+SPACY_UNUSED_COMPONENTS = ['tagger', 'parser', 'attribute_ruler', 'lemmatizer', 'senter']
+
+# Longest text passed to spaCy (characters)
+SPACY_MAX_CHARS = 100000
+
+_SPACY_MODELS = {}
+_SPACY_LOCK = Lock()
+
+
+def load_spacy_model(name: str = "en_core_web_sm") -> Optional[Any]:
+    """
+    Load a spaCy pipeline for entity extraction, once per process.
+    
+    Args:
+        name: spaCy model package name
+        
+    Returns:
+        The shared pipeline, or None if spaCy or the model is not installed
+        (also remembered, so the warning is printed once)
+    """
+    with _SPACY_LOCK:
+        if name not in _SPACY_MODELS:
+            try:
+                import spacy
+            except ImportError:
+                print("Warning: spaCy not installed. Using pattern matching only.")
+                _SPACY_MODELS[name] = None
+            else:
+                try:
+                    _SPACY_MODELS[name] = spacy.load(name, exclude=SPACY_UNUSED_COMPONENTS)
+                except OSError:
+                    print(f"Warning: spaCy model '{name}' not found. Using pattern matching only.")
+                    _SPACY_MODELS[name] = None
+        return _SPACY_MODELS[name]
 
 
 class NLPEngine:
@@ -13,153 +60,128 @@ class NLPEngine:
     NLP-powered engine for extracting skills, entities, and analyzing resume content.
     """
     
-    # Comprehensive skill databases
-    PROGRAMMING_LANGUAGES = {
-        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'c', 'ruby', 'go', 'golang',
-        'rust', 'kotlin', 'swift', 'scala', 'php', 'perl', 'r', 'matlab', 'julia', 'dart',
-        'objective-c', 'assembly', 'bash', 'shell', 'powershell', 'sql', 'html', 'css', 'sass',
-        'less', 'lua', 'haskell', 'clojure', 'elixir', 'erlang', 'fortran', 'cobol', 'vba',
-        'groovy', 'f#', 'ocaml', 'scheme', 'lisp', 'prolog', 'solidity'
-    }
-    
-    FRAMEWORKS_LIBRARIES = {
-        # Python
-        'django', 'flask', 'fastapi', 'streamlit', 'pandas', 'numpy', 'scipy', 'matplotlib',
-        'seaborn', 'plotly', 'bokeh', 'scikit-learn', 'sklearn', 'tensorflow', 'keras', 'pytorch',
-        'torch', 'xgboost', 'lightgbm', 'catboost', 'nltk', 'spacy', 'gensim', 'transformers',
-        'huggingface', 'opencv', 'pillow', 'beautifulsoup', 'scrapy', 'selenium', 'requests',
-        'asyncio', 'celery', 'airflow', 'prefect', 'dask', 'pyspark', 'polars',
-        # JavaScript
-        'react', 'reactjs', 'angular', 'vue', 'vuejs', 'svelte', 'next.js', 'nextjs', 'nuxt',
-        'express', 'expressjs', 'node', 'nodejs', 'nest', 'nestjs', 'gatsby', 'remix',
-        'jquery', 'redux', 'mobx', 'webpack', 'vite', 'rollup', 'babel', 'eslint',
-        # Java
-        'spring', 'spring boot', 'springboot', 'hibernate', 'maven', 'gradle', 'junit',
-        # Other
-        'rails', 'ruby on rails', '.net', 'asp.net', 'entity framework', 'blazor',
-        'flutter', 'react native', 'ionic', 'electron', 'qt', 'gtk'
-    }
-    
-    DATA_SCIENCE_TOOLS = {
-        'jupyter', 'jupyter notebook', 'anaconda', 'colab', 'google colab', 'kaggle',
-        'databricks', 'mlflow', 'wandb', 'weights and biases', 'tensorboard', 'optuna',
-        'hyperopt', 'ray', 'dvc', 'great expectations', 'evidently', 'whylabs',
-        'feature store', 'feast', 'sagemaker', 'vertex ai', 'azure ml', 'datarobot',
-        'h2o', 'dataiku', 'rapidminer', 'knime', 'alteryx', 'tableau', 'power bi',
-        'looker', 'metabase', 'superset', 'grafana', 'kibana', 'splunk', 'excel',
-        'google sheets', 'stata', 'spss', 'sas', 'minitab', 'eviews'
+    # spaCy entity label -> entity category
+    ENTITY_LABELS = {
+        'ORG': 'organizations',
+        'GPE': 'locations',
+        'LOC': 'locations',
+        'DATE': 'dates',
+        'PERSON': 'persons'
     }
     
-    DATABASES = {
-        'mysql', 'postgresql', 'postgres', 'mongodb', 'redis', 'elasticsearch', 'cassandra',
-        'sqlite', 'oracle', 'sql server', 'mssql', 'mariadb', 'dynamodb', 'firestore',
-        'firebase', 'couchdb', 'neo4j', 'graphql', 'influxdb', 'timescaledb', 'clickhouse',
-        'snowflake', 'redshift', 'bigquery', 'hive', 'presto', 'trino', 'dremio',
-        'cockroachdb', 'supabase', 'planetscale', 'fauna', 'airtable'
-    }
-    
-    CLOUD_DEVOPS = {
-        'aws', 'amazon web services', 'ec2', 's3', 'lambda', 'rds', 'ecs', 'eks', 'fargate',
-        'azure', 'microsoft azure', 'gcp', 'google cloud', 'google cloud platform',
-        'docker', 'kubernetes', 'k8s', 'helm', 'terraform', 'ansible', 'puppet', 'chef',
-        'jenkins', 'github actions', 'gitlab ci', 'circleci', 'travis ci', 'argocd',
-        'prometheus', 'grafana', 'datadog', 'new relic', 'pagerduty', 'opsgenie',
-        'nginx', 'apache', 'caddy', 'traefik', 'kong', 'istio', 'envoy', 'linkerd',
-        'vagrant', 'virtualbox', 'vmware', 'openstack', 'cloudflare', 'vercel', 'netlify',
-        'heroku', 'digitalocean', 'linode', 'vultr', 'render', 'railway', 'fly.io'
-    }
+    EDUCATION_PATTERNS = [
+        re.compile(r'\b(B\.?S\.?|B\.?A\.?|M\.?S\.?|M\.?A\.?|Ph\.?D\.?|MBA|Bachelor|Master|Doctorate)\b', re.IGNORECASE),
+        re.compile(r'\b(University|College|Institute|School)\s+of\s+\w+', re.IGNORECASE),
+        re.compile(r'\b(Computer Science|Data Science|Mathematics|Statistics|Engineering|Physics|Chemistry|Biology)\b',
+                   re.IGNORECASE)
+    ]
     
-    SOFT_SKILLS = {
-        'leadership', 'communication', 'teamwork', 'collaboration', 'problem solving',
-        'problem-solving', 'critical thinking', 'analytical', 'creativity', 'innovation',
-        'time management', 'project management', 'agile', 'scrum', 'kanban', 'waterfall',
-        'stakeholder management', 'negotiation', 'presentation', 'public speaking',
-        'mentoring', 'coaching', 'conflict resolution', 'decision making', 'adaptability',
-        'flexibility', 'attention to detail', 'organization', 'planning', 'prioritization',
-        'multitasking', 'self-motivated', 'proactive', 'initiative', 'work ethic',
-        'interpersonal', 'customer service', 'client relations', 'cross-functional'
-    }
-    
-    ML_AI_CONCEPTS = {
-        'machine learning', 'deep learning', 'neural network', 'neural networks',
-        'natural language processing', 'nlp', 'computer vision', 'cv', 'reinforcement learning',
-        'supervised learning', 'unsupervised learning', 'semi-supervised', 'transfer learning',
-        'fine-tuning', 'feature engineering', 'feature selection', 'dimensionality reduction',
-        'clustering', 'classification', 'regression', 'time series', 'forecasting',
-        'anomaly detection', 'recommendation system', 'recommender system', 'collaborative filtering',
-        'cnn', 'rnn', 'lstm', 'gru', 'transformer', 'bert', 'gpt', 'attention mechanism',
-        'generative ai', 'gan', 'vae', 'diffusion', 'llm', 'large language model',
-        'rag', 'retrieval augmented', 'langchain', 'llamaindex', 'vector database',
-        'embedding', 'word2vec', 'glove', 'fasttext', 'sentiment analysis', 'ner',
-        'named entity recognition', 'pos tagging', 'topic modeling', 'text classification',
-        'object detection', 'image segmentation', 'image classification', 'ocr',
-        'speech recognition', 'speech synthesis', 'tts', 'asr'
-    }
-    
-    def __init__(self, use_spacy: bool = True):
+    def __init__(self, use_spacy: bool = True, spacy_model: str = "en_core_web_sm",
+                 taxonomy: Union[None, SkillTaxonomy, TaxonomyLoader] = None, fuzzy: bool = False):
         """
         Initialize NLP Engine.
         
         Args:
             use_spacy: Whether to use spaCy for advanced NLP (requires spacy to be installed)
+            spacy_model: spaCy model package, loaded on first use and shared
+                by all engines in the process
+            taxonomy: Skill taxonomy, or a loader that keeps one current
+                (defaults to ``data/skills_database.json``, hot-reloaded)
+            fuzzy: Also match misspelled skills ("Kubernates") and skills
+                split by PDF extraction ("Py thon")
         """
         self.use_spacy = use_spacy
-        self.nlp = None
-        
-        if use_spacy:
-            try:
-                import spacy
-                try:
-                    self.nlp = spacy.load("en_core_web_sm")
-                except OSError:
-                    print("Warning: spaCy model 'en_core_web_sm' not found. Using pattern matching only.")
-                    self.use_spacy = False
-            except ImportError:
-                print("Warning: spaCy not installed. Using pattern matching only.")
-                self.use_spacy = False
+        self.spacy_model = spacy_model
+        self._taxonomy = taxonomy if taxonomy is not None else DEFAULT_TAXONOMY
+        self.fuzzy = fuzzy
     
-    def extract_skills(self, text: str) -> Dict[str, List[str]]:
+    @property
+    def taxonomy(self) -> SkillTaxonomy:
+        """The current compiled skill taxonomy."""
+        if isinstance(self._taxonomy, TaxonomyLoader):
+            return self._taxonomy.get()
+        return self._taxonomy
+    
+    @property
+    def nlp(self) -> Optional[Any]:
+        """The shared spaCy pipeline (loaded on first access), or None."""
+        if not self.use_spacy:
+            return None
+        nlp = load_spacy_model(self.spacy_model)
+        if nlp is None:
+            self.use_spacy = False
+        return nlp
+    
+    def extract_skills(self, text: str, sections: Optional[Iterable[str]] = None) -> Dict[str, List[str]]:
         """
         Extract categorized skills from resume text.
         
         Args:
             text: Resume text content
+            sections: Only search these sections (e.g. ['skills', 'experience']);
+                the whole text is searched when omitted, and the rest of the
+                text is not scanned at all when given
             
         Returns:
             Dictionary with skill categories and found skills
         """
-        text_lower = text.lower()
-        
-        skills = {
-            'programming_languages': [],
-            'frameworks_libraries': [],
-            'data_science_tools': [],
-            'databases': [],
-            'cloud_devops': [],
-            'ml_ai_concepts': [],
-            'soft_skills': []
-        }
+        if sections is None:
+            return self.taxonomy.extract(text, self.fuzzy)
+        wanted = set(sections)
+        results = [self.taxonomy.extract(text[s.start:s.end], self.fuzzy)
+                   for s in RESUME_SEGMENTER.segment(text) if s.name in wanted]
+        if not results:
+            return self.taxonomy.extract('', self.fuzzy)
+        return self._merge(results)[None]
+    
+    def scan_skills(self, text: str) -> SkillMentions:
+        """
+        Scan the resume once for skill counts, positions and sections.
         
-        # Extract skills by category
-        skills['programming_languages'] = self._find_skills(text_lower, self.PROGRAMMING_LANGUAGES)
-        skills['frameworks_libraries'] = self._find_skills(text_lower, self.FRAMEWORKS_LIBRARIES)
-        skills['data_science_tools'] = self._find_skills(text_lower, self.DATA_SCIENCE_TOOLS)
-        skills['databases'] = self._find_skills(text_lower, self.DATABASES)
-        skills['cloud_devops'] = self._find_skills(text_lower, self.CLOUD_DEVOPS)
-        skills['ml_ai_concepts'] = self._find_skills(text_lower, self.ML_AI_CONCEPTS)
-        skills['soft_skills'] = self._find_skills(text_lower, self.SOFT_SKILLS)
+        Args:
+            text: Resume text content
+            
+        Returns:
+            SkillMentions record (categorized names, per-skill counts, first
+            and last offsets, the sections each skill appears in, and every
+            occurrence for highlighting)
+        """
+        return scan_mentions(self.taxonomy, text, RESUME_SEGMENTER.segment(text), self.fuzzy)
+    
+    def extract_skills_by_section(self, text: str) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Extract skills separately for every section of the resume.
         
-        return skills
+        Args:
+            text: Resume text content
+            
+        Returns:
+            Dictionary mapping section name to its categorized skills
+        """
+        sections = RESUME_SEGMENTER.segment(text)
+        return self._merge([self.taxonomy.extract(text[s.start:s.end], self.fuzzy) for s in sections],
+                           [s.name for s in sections])
+    
+    @staticmethod
+    def _merge(results: List[Dict[str, List[str]]],
+               keys: Optional[List[str]] = None) -> Dict[Optional[str], Dict[str, List[str]]]:
+        """Union categorized skills of text chunks, per key (all under None without keys)."""
+        merged_by_key = {}
+        for key, skills in zip(keys or [None] * len(results), results):
+            merged = merged_by_key.setdefault(key, {category: [] for category in skills})
+            for category, found in skills.items():
+                merged[category] = sorted(set(merged[category]) | set(found), key=str.lower)
+        return merged_by_key
     
-    def _find_skills(self, text: str, skill_set: Set[str]) -> List[str]:
-        """Find skills from a skill set in text."""
-        found = []
-        for skill in skill_set:
-            # Use word boundary matching
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, text, re.IGNORECASE):
-                found.append(skill.title())
-        return sorted(list(set(found)))
+    def skill_profile(self, text: str) -> SkillProfile:
+        """
+        Canonical skills of the text as a compact bitset profile.
+        
+        Aliases resolve to one skill id, so profiles of different resumes
+        (and of job requirements, via ``taxonomy.profile_of``) compare with
+        bitwise overlap and Jaccard similarity.
+        """
+        return self.taxonomy.profile(text, self.fuzzy)
     
     def get_all_skills_flat(self, text: str) -> List[str]:
         """Get all extracted skills as a flat list."""
@@ -167,7 +189,20 @@ class NLPEngine:
         all_skills = []
         for category in skills.values():
             all_skills.extend(category)
-        return sorted(list(set(all_skills)))
+        return sorted(set(all_skills), key=str.lower)
+    
+    def find_skill_spans(self, text: str) -> List[Dict]:
+        """
+        Locate every skill occurrence for in-context highlighting.
+        
+        Args:
+            text: Resume text content (a NormalizedText with offsets maps
+                spans back to the raw extracted text)
+            
+        Returns:
+            List of hits with skill, category, section and original start/end offsets
+        """
+        return self.scan_skills(text).hits()
     
     def extract_entities(self, text: str) -> Dict[str, List[str]]:
         """
@@ -179,6 +214,34 @@ class NLPEngine:
         Returns:
             Dictionary with entity types and found entities
         """
+        nlp = self.nlp
+        doc = nlp(text[:SPACY_MAX_CHARS]) if nlp is not None else None
+        return self._entities(text, doc)
+    
+    def extract_entities_batch(self, texts: Sequence[str], batch_size: int = 32,
+                               n_process: int = 1) -> List[Dict[str, List[str]]]:
+        """
+        Extract named entities from many documents.
+        
+        Documents are streamed through ``nlp.pipe``, which batches them
+        through the pipeline instead of running it once per document.
+        
+        Args:
+            texts: Resume texts
+            batch_size: Documents per pipeline batch
+            n_process: Worker processes (spaCy multiprocessing; 1 runs in-process)
+            
+        Returns:
+            One ``extract_entities`` result per text, in order
+        """
+        nlp = self.nlp
+        if nlp is None:
+            return [self._entities(text, None) for text in texts]
+        docs = nlp.pipe((text[:SPACY_MAX_CHARS] for text in texts), batch_size=batch_size, n_process=n_process)
+        return [self._entities(text, doc) for text, doc in zip(texts, docs)]
+    
+    def _entities(self, text: str, doc) -> Dict[str, List[str]]:
+        """Entity categories from a spaCy doc (or None) plus pattern-based education."""
         entities = {
             'organizations': [],
             'locations': [],
@@ -187,79 +250,54 @@ class NLPEngine:
             'persons': []
         }
         
-        if self.nlp:
-            doc = self.nlp(text[:100000])  # Limit text length for performance
-            
+        if doc is not None:
             for ent in doc.ents:
-                if ent.label_ == 'ORG':
-                    entities['organizations'].append(ent.text)
-                elif ent.label_ in ['GPE', 'LOC']:
-                    entities['locations'].append(ent.text)
-                elif ent.label_ == 'DATE':
-                    entities['dates'].append(ent.text)
-                elif ent.label_ == 'PERSON':
-                    entities['persons'].append(ent.text)
+                category = self.ENTITY_LABELS.get(ent.label_)
+                if category is not None:
+                    entities[category].append(ent.text)
             
             # Deduplicate
             for key in entities:
                 entities[key] = list(set(entities[key]))
         
         # Pattern-based extraction for education
-        education_patterns = [
-            r'\b(B\.?S\.?|B\.?A\.?|M\.?S\.?|M\.?A\.?|Ph\.?D\.?|MBA|Bachelor|Master|Doctorate)\b',
-            r'\b(University|College|Institute|School)\s+of\s+\w+',
-            r'\b(Computer Science|Data Science|Mathematics|Statistics|Engineering|Physics|Chemistry|Biology)\b'
-        ]
-        
-        for pattern in education_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            entities['education'].extend(matches)
+        for pattern in self.EDUCATION_PATTERNS:
+            entities['education'].extend(pattern.findall(text))
         
         entities['education'] = list(set(entities['education']))
         
         return entities
     
-    def calculate_experience_years(self, text: str) -> Tuple[float, List[Dict]]:
+    def calculate_experience_years(self, text: str, today: Optional[date] = None) -> Tuple[float, List[Dict]]:
         """
         Estimate years of experience from resume.
         
+        Year ("2019 - 2021") and month ("Jun 2020 - Dec 2021") ranges of
+        the experience section (or of the whole text, if there is none) are
+        merged, so overlapping roles are counted once.
+        
         Args:
             text: Resume text content
+            today: Reference date for ranges ending "present" (defaults to today)
             
         Returns:
             Tuple of (estimated years, list of date ranges found)
         """
-        # Find date patterns
-        date_patterns = [
-            r'(\d{4})\s*[-–—]\s*(present|current|\d{4})',
-            r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s*(\d{4})\s*[-–—]\s*(present|current|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s*\d{4})',
-        ]
-        
-        experiences = []
-        current_year = 2026  # Current year
-        
-        # Simple year-to-year pattern
-        year_pattern = r'(\d{4})\s*[-–—]\s*(present|current|\d{4})'
-        matches = re.findall(year_pattern, text, re.IGNORECASE)
+        ranges = parse_ranges(experience_text(text), today)
+        return round(merged_months(ranges) / 12, 1), [r.to_dict() for r in ranges]
+    
+    def experience_batch(self, texts: Sequence[str], today: Optional[date] = None) -> ExperienceTable:
+        """
+        Merged and per-role tenure of many resumes as arrays.
         
-        total_years = 0
-        for start, end in matches:
-            start_year = int(start)
-            if end.lower() in ['present', 'current']:
-                end_year = current_year
-            else:
-                end_year = int(end)
+        Args:
+            texts: Resume texts
+            today: Reference date for open-ended ranges (defaults to today)
             
-            if 1990 <= start_year <= current_year and start_year <= end_year <= current_year:
-                years = end_year - start_year
-                total_years += years
-                experiences.append({
-                    'start': start_year,
-                    'end': end_year,
-                    'years': years
-                })
-        
-        return total_years, experiences
+        Returns:
+            ExperienceTable (e.g. ``table.at_least(5)`` for the "5+ years" filter)
+        """
+        return extract_experience_batch(texts, today)
     
     def analyze_text_quality(self, text: str) -> Dict[str, float]:
         """
@@ -271,7 +309,7 @@ class NLPEngine:
         Returns:
             Dictionary with quality metrics
         """
-        words = text.split()
+        words = split_words(text)
         sentences = re.split(r'[.!?]+', text)
         sentences = [s.strip() for s in sentences if s.strip()]
         
@@ -318,7 +356,8 @@ class NLPEngine:
         Returns:
             Summary with skill counts and top skills
         """
-        skills = self.extract_skills(text)
+        mentions = self.scan_skills(text)
+        skills = mentions.by_category()
         
         total_skills = sum(len(v) for v in skills.values())
         
@@ -333,5 +372,6 @@ class NLPEngine:
             'total_skills': total_skills,
             'category_counts': category_counts,
             'skills_by_category': skills,
-            'top_by_category': top_by_category
+            'top_by_category': top_by_category,
+            'mention_counts': mentions.counts()
         }
@@ -5,9 +5,22 @@ Handles PDF and DOCX file parsing and text extraction.
 
 import re
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 import io
 
+from .features import LexicalFeatures, scan_features
+from .sections import RESUME_SECTIONS, RESUME_SEGMENTER, Section
+from .text_buffer import NormalizedText, OffsetMap
+
+
+# Single-pass cleaner: whitespace that is not already a single space collapses
+# to ' ', characters outside the kept punctuation set are dropped
+_CLEAN_PATTERN = re.compile(r'(\s{2,}|[^\S ])|[^\w\s\.\,\;\:\-\+\@\#\(\)\/\&]+')
+
+
+def _clean_replacement(match) -> str:
+    return ' ' if match.group(1) else ''
+
 
 class ResumeParser:
     """
@@ -16,9 +29,23 @@ class ResumeParser:
     
     SUPPORTED_FORMATS = ['.pdf', '.docx', '.doc', '.txt']
     
-    def __init__(self):
+    def __init__(self, lean: bool = False, track_offsets: bool = False):
+        """
+        Initialize the parser.
+        
+        Args:
+            lean: Return a NormalizedText whose lowercase buffer and word split
+                are shared by all analyzers instead of recomputed by each one
+            track_offsets: Also record an offset map from cleaned to raw text
+                (implies lean) and keep the raw text for highlighting
+        """
+        self.lean = lean or track_offsets
+        self.track_offsets = track_offsets
         self.text = ""
+        self.raw_text = ""
         self.metadata = {}
+        self._features = None
+        self._features_text = None
     
     def parse(self, file_path: Optional[str] = None, file_content: Optional[bytes] = None, 
               file_type: Optional[str] = None) -> str:
@@ -55,21 +82,30 @@ class ResumeParser:
     
     def _parse_from_bytes(self, content: bytes, file_type: str) -> str:
         """Parse resume from raw bytes."""
+        raw = self._extract_text(content, file_type)
+        if self.track_offsets:
+            text, offsets, line_starts = self._clean_text_with_offsets(raw)
+            self.raw_text = raw
+            self.text = NormalizedText(text, offsets=offsets, line_starts=line_starts)
+        else:
+            text = self._clean_text(raw)
+            self.text = NormalizedText(text) if self.lean else text
+        return self.text
+    
+    def _extract_text(self, content: bytes, file_type: str) -> str:
+        """Extract raw (uncleaned) text from file bytes."""
         file_type = file_type.lower()
         if not file_type.startswith('.'):
             file_type = '.' + file_type
             
         if file_type == '.pdf':
-            self.text = self._parse_pdf(content)
+            return self._parse_pdf(content)
         elif file_type in ['.docx', '.doc']:
-            self.text = self._parse_docx(content)
+            return self._parse_docx(content)
         elif file_type == '.txt':
-            self.text = content.decode('utf-8', errors='ignore')
+            return content.decode('utf-8', errors='ignore')
         else:
             raise ValueError(f"Unsupported file format: {file_type}")
-        
-        self.text = self._clean_text(self.text)
-        return self.text
     
     def _parse_pdf(self, content: bytes) -> str:
         """Extract text from PDF using PyMuPDF."""
@@ -117,43 +153,60 @@ class ResumeParser:
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize extracted text."""
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        # Remove special characters but keep basic punctuation
-        text = re.sub(r'[^\w\s\.\,\;\:\-\+\@\#\(\)\/\&]', '', text)
-        # Remove excessive newlines
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        return text.strip()
+        # Collapse whitespace and remove special characters (keeping basic
+        # punctuation) in one pass, so only one cleaned copy is made
+        return _CLEAN_PATTERN.sub(_clean_replacement, text).strip()
     
-    def get_sections(self) -> Dict[str, str]:
+    def _clean_text_with_offsets(self, text: str) -> Tuple[str, OffsetMap, List[int]]:
         """
-        Identify and extract common resume sections.
+        Clean text like _clean_text, recording an offset map in the same pass.
         
         Returns:
-            Dictionary mapping section names to their content
+            Tuple of (cleaned text, offset map, offsets in the cleaned text
+            at which the raw text's lines start)
         """
-        sections = {}
-        
-        section_patterns = {
-            'education': r'(?i)(education|academic|qualification|degree)',
-            'experience': r'(?i)(experience|employment|work\s*history|career)',
-            'skills': r'(?i)(skills|technical\s*skills|expertise|competencies)',
-            'projects': r'(?i)(projects|portfolio|work\s*samples)',
-            'certifications': r'(?i)(certification|certificate|license)',
-            'summary': r'(?i)(summary|objective|profile|about)',
-            'contact': r'(?i)(contact|email|phone|address)'
-        }
-        
-        text_lower = self.text.lower()
+        offsets = OffsetMap()
+        line_starts = [0]
+        removed = 0
+        
+        def replace(match):
+            nonlocal removed
+            start, end = match.span()
+            replacement = ' ' if match.group(1) else ''
+            clean_end = start - removed + len(replacement)
+            removed += end - start - len(replacement)
+            if end - start != len(replacement):
+                offsets.add_anchor(clean_end, end)
+            if replacement and '\n' in match.group(1):
+                line_starts.append(clean_end)
+            return replacement
+        
+        cleaned = _CLEAN_PATTERN.sub(replace, text)
+        stripped = cleaned.strip()
+        offsets.shift = len(cleaned) - len(cleaned.lstrip())
+        line_starts = [0] + [start - offsets.shift for start in line_starts
+                             if 0 < start - offsets.shift < len(stripped)]
+        return stripped, offsets, line_starts
+    
+    def get_sections(self) -> Dict[str, bool]:
+        """
+        Identify which common resume sections are present.
         
-        for section_name, pattern in section_patterns.items():
-            match = re.search(pattern, text_lower)
-            if match:
-                sections[section_name] = True
-            else:
-                sections[section_name] = False
+        Returns:
+            Dictionary mapping section names to whether they were found
+        """
+        found = RESUME_SEGMENTER.present(self.text)
+        return {section: section in found for section in RESUME_SECTIONS}
+    
+    def get_section_spans(self) -> List[Section]:
+        """
+        Split the resume into section spans.
         
-        return sections
+        Returns:
+            Sections (name, start, end, heading) ordered by position;
+            ``self.text[section.start:section.end]`` is the section text
+        """
+        return RESUME_SEGMENTER.segment(self.text)
     
     def extract_contact_info(self) -> Dict[str, Optional[str]]:
         """
@@ -162,31 +215,21 @@ class ResumeParser:
         Returns:
             Dictionary with email, phone, and LinkedIn URL
         """
-        contact = {
-            'email': None,
-            'phone': None,
-            'linkedin': None,
-            'github': None
+        features = self.get_features()
+        return {
+            'email': features.email,
+            'phone': features.phone,
+            'linkedin': features.linkedin,
+            'github': features.github
         }
-        
-        # Email pattern
-        email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', self.text)
-        if email_match:
-            contact['email'] = email_match.group()
-        
-        # Phone pattern (various formats)
-        phone_match = re.search(r'[\+]?[(]?[0-9]{1,3}[)]?[-\s\.]?[0-9]{3,4}[-\s\.]?[0-9]{4,6}', self.text)
-        if phone_match:
-            contact['phone'] = phone_match.group()
-        
-        # LinkedIn URL
-        linkedin_match = re.search(r'linkedin\.com/in/[\w\-]+', self.text, re.IGNORECASE)
-        if linkedin_match:
-            contact['linkedin'] = linkedin_match.group()
-        
-        # GitHub URL
-        github_match = re.search(r'github\.com/[\w\-]+', self.text, re.IGNORECASE)
-        if github_match:
-            contact['github'] = github_match.group()
-        
-        return contact
+    
+    def get_features(self) -> LexicalFeatures:
+        """
+        Lexical features (contact details and formatting signals) of the
+        parsed text, scanned once and reused; pass them to
+        ``ATSScorer.calculate_score(..., features=...)`` to avoid rescanning.
+        """
+        if self._features is None or self._features_text is not self.text:
+            self._features = scan_features(self.text)
+            self._features_text = self.text
+        return self._features
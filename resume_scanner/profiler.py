@@ -0,0 +1,269 @@
+"""
+Memory Profiler Module
+Opt-in per-stage memory tracking for the resume analysis pipeline.
+"""
+
+import sys
+import tracemalloc
+from contextlib import contextmanager
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# Frames that belong to the profiler or the import machinery, not the pipeline
+_IGNORED_FRAMES = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+def _peak_rss_kb() -> Optional[int]:
+    """Process high-water resident set size in KiB (None if unavailable)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and KiB on Linux
+    if sys.platform == 'darwin':
+        peak //= 1024
+    return peak
+
+
+class MemoryProfiler:
+    """
+    Records tracemalloc deltas and peaks per pipeline stage and document.
+
+    A stage's peak is measured from its own starting point: the tracemalloc
+    peak is reset on entry, and RSS growth is the rise of the process
+    high-water mark above its value before the stage (zero when the stage
+    stays below an earlier peak).
+
+    Profiling is opt-in: nothing is traced until a stage is entered, and
+    tracemalloc is stopped again by ``stop()`` if the profiler started it.
+    """
+
+    def __init__(self, top_n: int = 10, frames: int = 1):
+        """
+        Initialize the profiler.
+
+        Args:
+            top_n: Number of call sites kept in the aggregated report
+            frames: Traceback depth stored by tracemalloc per allocation
+        """
+        self.top_n = top_n
+        self.frames = frames
+        self.records = []
+        self.call_sites = defaultdict(lambda: {'size': 0, 'count': 0})
+        self._started_tracing = False
+        self._document = None
+        self._pipelines = {}
+
+    def start(self):
+        """Start tracemalloc if it is not already running."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+
+    def stop(self):
+        """Stop tracemalloc if this profiler started it."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @contextmanager
+    def document(self, doc_id: str):
+        """Attribute all stages entered within the block to ``doc_id``."""
+        previous = self._document
+        self._document = doc_id
+        try:
+            yield self
+        finally:
+            self._document = previous
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Measure memory used by the enclosed block.
+
+        Args:
+            name: Stage name (e.g. 'extract', 'clean', 'ats')
+        """
+        self.start()
+        before = tracemalloc.take_snapshot().filter_traces(_IGNORED_FRAMES)
+        current_before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        rss_before = _peak_rss_kb()
+        try:
+            yield
+        finally:
+            current_after, peak = tracemalloc.get_traced_memory()
+            rss_after = _peak_rss_kb()
+            after = tracemalloc.take_snapshot().filter_traces(_IGNORED_FRAMES)
+
+            self.records.append({
+                'document': self._document,
+                'stage': name,
+                'allocated_bytes': current_after - current_before,
+                'peak_bytes': max(peak - current_before, 0),
+                'rss_growth_kb': (rss_after - rss_before) if rss_after is not None else None,
+            })
+
+            for stat in after.compare_to(before, 'lineno'):
+                if stat.size_diff <= 0:
+                    continue
+                frame = stat.traceback[0]
+                site = self.call_sites[(name, f"{frame.filename}:{frame.lineno}")]
+                site['size'] += stat.size_diff
+                site['count'] += stat.count_diff
+
+    def _pipeline(self, lean: bool) -> Dict:
+        """Pipeline components, built once per mode outside any measured stage."""
+        if lean not in self._pipelines:
+            from .parser import ResumeParser
+            from .nlp_engine import NLPEngine
+            from .ats_scorer import ATSScorer
+            from .ai_detector import AIDetector
+            from .job_matcher import JobMatcher
+
+            self._pipelines[lean] = {
+                'parser': ResumeParser(lean=lean),
+                'nlp': NLPEngine(use_spacy=False),
+                'ats': ATSScorer(),
+                'ai': AIDetector(),
+                'job_match': JobMatcher(),
+            }
+        return self._pipelines[lean]
+
+    def profile_document(self, content: bytes, file_type: str, doc_id: Optional[str] = None,
+                         target_role: Optional[str] = None, lean: bool = False) -> Dict:
+        """
+        Run the full analysis pipeline on one document, stage by stage.
+
+        The parser, NLP engine (with its skill taxonomy) and scorers are
+        constructed before the first stage and reused across documents, so
+        the stages measure only the per-document work.
+
+        Args:
+            content: Raw file bytes
+            file_type: File extension ('pdf', 'docx', 'txt')
+            doc_id: Identifier used in the report (defaults to a counter)
+            target_role: Target role passed to the ATS scorer
+            lean: Profile the lean pipeline (shared NormalizedText buffers)
+
+        Returns:
+            Per-stage records for this document
+        """
+        from .text_buffer import NormalizedText
+
+        if doc_id is None:
+            doc_id = f"doc-{len({r['document'] for r in self.records})}"
+
+        first_record = len(self.records)
+        pipeline = self._pipeline(lean)
+        parser = pipeline['parser']
+
+        with self.document(doc_id):
+            with self.stage('extract'):
+                raw = parser._extract_text(content, file_type)
+            with self.stage('clean'):
+                text = parser._clean_text(raw)
+                del raw
+                if lean:
+                    text = NormalizedText(text)
+            with self.stage('skills'):
+                pipeline['nlp'].extract_skills(text)
+            with self.stage('ats'):
+                pipeline['ats'].calculate_score(text, target_role)
+            with self.stage('ai'):
+                pipeline['ai'].analyze(text)
+            with self.stage('job_match'):
+                pipeline['job_match'].match(text)
+
+        return self.records[first_record:]
+
+    def report(self) -> Dict:
+        """
+        Aggregate recorded stages into a summary report.
+
+        Returns:
+            Dictionary with per-stage totals/maxima, worst documents and
+            the top allocating call sites
+        """
+        stages = {}
+        for record in self.records:
+            stage = stages.setdefault(record['stage'], {
+                'documents': 0,
+                'total_allocated_bytes': 0,
+                'max_peak_bytes': 0,
+                'max_rss_growth_kb': None,
+                'worst_document': None
+            })
+            stage['documents'] += 1
+            stage['total_allocated_bytes'] += record['allocated_bytes']
+            if record['peak_bytes'] >= stage['max_peak_bytes']:
+                stage['max_peak_bytes'] = record['peak_bytes']
+                stage['worst_document'] = record['document']
+            if record['rss_growth_kb'] is not None:
+                stage['max_rss_growth_kb'] = max(stage['max_rss_growth_kb'] or 0, record['rss_growth_kb'])
+
+        top_sites = sorted(self.call_sites.items(), key=lambda item: item[1]['size'], reverse=True)
+
+        return {
+            'stages': stages,
+            'peak_rss_kb': _peak_rss_kb(),
+            'top_call_sites': [
+                {'stage': stage, 'location': location, 'size': info['size'], 'count': info['count']}
+                for (stage, location), info in top_sites[:self.top_n]
+            ]
+        }
+
+    def format_report(self) -> str:
+        """Render the aggregated report as plain text."""
+        report = self.report()
+        lines = ["Stage          Docs  Allocated (KiB)  Max peak (KiB)  Worst document"]
+        for name, stage in report['stages'].items():
+            lines.append(
+                f"{name:<14} {stage['documents']:>4}  {stage['total_allocated_bytes'] / 1024:>15.1f}  "
+                f"{stage['max_peak_bytes'] / 1024:>14.1f}  {stage['worst_document']}"
+            )
+        if report['peak_rss_kb'] is not None:
+            lines.append(f"\nPeak RSS: {report['peak_rss_kb'] / 1024:.1f} MiB")
+        lines.append("\nTop allocating call sites:")
+        for site in report['top_call_sites']:
+            lines.append(f"  [{site['stage']}] {site['location']}: "
+                         f"{site['size'] / 1024:.1f} KiB in {site['count']} blocks")
+        return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Profile the pipeline over resume files: python -m resume_scanner.profiler FILE..."""
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description="Per-stage memory profile of resume analysis")
+    arg_parser.add_argument('files', nargs='+', help="Resume files (PDF, DOCX, TXT)")
+    arg_parser.add_argument('--role', default=None, help="Target role for ATS scoring")
+    arg_parser.add_argument('--top', type=int, default=10, help="Number of call sites to report")
+    arg_parser.add_argument('--lean', action='store_true', help="Use the lean shared-buffer text pipeline")
+    args = arg_parser.parse_args(argv)
+
+    profiler = MemoryProfiler(top_n=args.top)
+    try:
+        for file_name in args.files:
+            path = Path(file_name)
+            profiler.profile_document(path.read_bytes(), path.suffix, doc_id=path.name,
+                                      target_role=args.role, lean=args.lean)
+    finally:
+        profiler.stop()
+
+    print(profiler.format_report())
+
+
+if __name__ == "__main__":
+    main()
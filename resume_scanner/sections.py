@@ -0,0 +1,176 @@
+"""
+Section Segmenter Module
+Finds resume section headings in one compiled scan and returns section spans.
+"""
+
+import re
+from bisect import bisect_right
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Iterable
+
+
+# Heading keywords per section; spaces match any (or no) whitespace
+RESUME_SECTIONS = {
+    'education': ['education', 'academic', 'qualification', 'degree'],
+    'experience': ['experience', 'employment', 'work history', 'career'],
+    'skills': ['skills', 'technical skills', 'expertise', 'competencies'],
+    'projects': ['projects', 'portfolio', 'work samples'],
+    'certifications': ['certification', 'certificate', 'license'],
+    'summary': ['summary', 'objective', 'profile', 'about'],
+    'contact': ['contact', 'email', 'phone', 'address']
+}
+
+HEADER_SECTION = 'header'
+
+_LINE_BREAK = re.compile(r'\n')
+# What may precede a heading on its line: indentation and bullet characters
+_LINE_LEAD = re.compile(r'[\s\-\u2022\u25aa\u25cf\u2013*#>|]*')
+
+
+def _key(keyword: str) -> str:
+    return ''.join(keyword.lower().split())
+
+
+class Section(NamedTuple):
+    """A section of the resume text: ``text[start:end]``."""
+    name: str
+    start: int
+    end: int
+    heading: str
+
+
+class SectionSegmenter:
+    """
+    Compiles all section keywords into one regex and segments text by heading.
+
+    Keywords match case-insensitively as whole words, optionally plural
+    ("Certifications" is 'certification'), so "Experienced" is not
+    'experience'. The scan is a zero-width lookahead, so overlapping
+    keywords starting at different positions are all seen; a keyword that
+    contains another section's keyword (e.g. 'career objective' contains
+    'career') also marks that section present.
+    """
+
+    def __init__(self, section_keywords: Dict[str, List[str]], flexible_spaces: bool = True):
+        """
+        Compile the segmenter.
+
+        Args:
+            section_keywords: Mapping of section name to heading keywords
+            flexible_spaces: Let spaces in keywords match any (or no)
+                whitespace; otherwise keywords match literally
+        """
+        self.section_names = list(section_keywords)
+        # Keyword (lowercase, whitespace removed) -> sections it is a heading of,
+        # and -> other sections whose keywords it contains
+        self._owners = {}
+        self._implied = {}
+
+        all_words = {word.lower() for words in section_keywords.values() for word in words}
+        for section, words in section_keywords.items():
+            for word in words:
+                self._owners.setdefault(_key(word), set()).add(section)
+        for word in all_words:
+            self._implied[_key(word)] = {
+                section for section, words in section_keywords.items()
+                if any(w.lower() in word for w in words)
+            } - self._owners[_key(word)]
+
+        # Longest keywords first, so a keyword is never shadowed by a prefix
+        alternatives = sorted(all_words, key=len, reverse=True)
+        if flexible_spaces:
+            alternatives = [r'\s*'.join(re.escape(part) for part in word.split()) for word in alternatives]
+        else:
+            alternatives = [re.escape(word) for word in alternatives]
+        self._pattern = re.compile(r'(?=\b((?:' + "|".join(alternatives) + r')s?)\b)', re.IGNORECASE)
+
+    def scan(self, text: str) -> Dict[str, List[Section]]:
+        """
+        Find every heading keyword occurrence in a single pass.
+
+        Returns:
+            Mapping of section name to its keyword hits (as Sections spanning
+            the matched heading text), in text order
+        """
+        hits = {}
+        for match in self._pattern.finditer(text):
+            start, end = match.span(1)
+            heading = match.group(1)
+            key = _key(heading)
+            if key not in self._owners:
+                key = key[:-1]
+            for section in self._owners[key]:
+                hits.setdefault(section, []).append(Section(section, start, end, heading))
+            for section in self._implied[key]:
+                hits.setdefault(section, [])
+        return hits
+
+    def present(self, text: str) -> Set[str]:
+        """Names of the sections whose keywords appear anywhere in the text."""
+        return set(self.scan(text))
+
+    def segment(self, text: str, line_starts: Optional[Sequence[int]] = None) -> List[Section]:
+        """
+        Split text into section spans.
+
+        Each section starts at its first heading and runs until the next
+        section's heading; keywords mentioned in running text never start a
+        section. When the line structure is known, a heading is a keyword
+        at the start of a line (after any bullet) that is capitalized and
+        ends its line, is followed by a colon or is ALL CAPS. Cleaned text
+        has its lines joined; unless its line starts are given (see
+        ``NormalizedText.line_starts``), only ALL CAPS keywords and
+        capitalized ones followed by a colon count as headings there. Text
+        before the first heading is returned as the 'header' section.
+
+        Args:
+            text: Resume text
+            line_starts: Sorted offsets at which lines of the original text
+                start (defaults to the text's own line breaks)
+
+        Returns:
+            Sections ordered by position, covering the whole text
+        """
+        if line_starts is None:
+            line_starts = getattr(text, 'line_starts', None)
+        if line_starts is None and '\n' in text:
+            line_starts = [0] + [match.end() for match in _LINE_BREAK.finditer(text)]
+
+        headings = []
+        for section, hits in self.scan(text).items():
+            chosen = next((hit for hit in hits if self._is_heading(text, hit, line_starts)), None)
+            if chosen is not None:
+                headings.append(chosen)
+        headings.sort(key=lambda hit: hit.start)
+
+        sections = []
+        if not headings or headings[0].start > 0:
+            first = headings[0].start if headings else len(text)
+            sections.append(Section(HEADER_SECTION, 0, first, ''))
+        for i, hit in enumerate(headings):
+            end = headings[i + 1].start if i + 1 < len(headings) else len(text)
+            sections.append(Section(hit.name, hit.start, end, hit.heading))
+        return sections
+
+    @staticmethod
+    def _is_heading(text: str, hit: Section, line_starts: Optional[Sequence[int]] = None) -> bool:
+        heading = hit.heading
+        capitals = len(heading) > 1 and heading.isupper()
+        colon = text[hit.end:hit.end + 1] == ':' and heading[:1].isupper()
+        if line_starts is None:
+            return capitals or colon
+        line = bisect_right(line_starts, hit.start) - 1
+        if line < 0 or _LINE_LEAD.fullmatch(text, line_starts[line], hit.start) is None:
+            return False
+        line_end = line_starts[line + 1] if line + 1 < len(line_starts) else len(text)
+        ends_line = not text[hit.end:line_end].strip()
+        return capitals or colon or (ends_line and heading[:1].isupper())
+
+
+def section_text(text: str, sections: List[Section], names: Iterable[str]) -> str:
+    """Concatenate the text of the named sections (in document order)."""
+    wanted = set(names)
+    return "\n".join(text[s.start:s.end] for s in sections if s.name in wanted)
+
+
+# Shared, read-only segmenter for the standard resume sections
+RESUME_SEGMENTER = SectionSegmenter(RESUME_SECTIONS)
@@ -0,0 +1,385 @@
+"""
+Skill Index Module
+Per-skill candidate bitmaps for boolean and weighted skill queries over a candidate pool.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from .skill_profile import SkillProfile
+from .taxonomy import SkillTaxonomy, get_taxonomy
+
+
+_QUERY_TOKEN = re.compile(r'"([^"]*)"|(\()|(\))|([^\s()"]+)')
+_OPERATORS = {'AND', 'OR', 'NOT'}
+
+
+def _require_numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("numpy is required for the skill index. Install with: pip install numpy")
+    return np
+
+
+def parse_query(query: str):
+    """
+    Parse a boolean skill query into a nested tuple tree.
+
+    Terms are skill names (several words are one term; quote a term that
+    contains a keyword or parenthesis), combined with upper-case ``AND``,
+    ``OR`` and ``NOT`` and parentheses. ``NOT`` binds tightest, then
+    ``AND``, then ``OR``.
+
+    Returns:
+        ``('term', name)``, ``('not', node)``, ``('and', [nodes])`` or
+        ``('or', [nodes])``
+    """
+    tokens = []
+    mergeable = False
+    for quoted, left, right, word in _QUERY_TOKEN.findall(query):
+        if left or right or word in _OPERATORS:
+            tokens.append(left or right or word)
+            mergeable = False
+        elif word and mergeable:
+            # Adjacent plain words form one multi-word term
+            tokens[-1].append(word)
+        else:
+            tokens.append([word or quoted])
+            mergeable = bool(word)
+    position = 0
+
+    def peek():
+        return tokens[position] if position < len(tokens) else None
+
+    def take():
+        nonlocal position
+        position += 1
+        return tokens[position - 1]
+
+    def parse_or():
+        nodes = [parse_and()]
+        while peek() == 'OR':
+            take()
+            nodes.append(parse_and())
+        return nodes[0] if len(nodes) == 1 else ('or', nodes)
+
+    def parse_and():
+        nodes = [parse_not()]
+        while peek() == 'AND':
+            take()
+            nodes.append(parse_not())
+        return nodes[0] if len(nodes) == 1 else ('and', nodes)
+
+    def parse_not():
+        token = peek()
+        if token == 'NOT':
+            take()
+            return ('not', parse_not())
+        if token == '(':
+            take()
+            node = parse_or()
+            if take_if(')') is None:
+                raise ValueError(f"Unbalanced parentheses in query: {query!r}")
+            return node
+        if isinstance(token, list):
+            take()
+            return ('term', ' '.join(token))
+        raise ValueError(f"Expected a skill name in query: {query!r}")
+
+    def take_if(expected):
+        return take() if peek() == expected else None
+
+    tree = parse_or()
+    if position != len(tokens):
+        raise ValueError(f"Unexpected {tokens[position]!r} in query: {query!r}")
+    return tree
+
+
+class SkillIndex:
+    """
+    Inverted index from skills to the candidates that have them.
+
+    Each skill (canonical taxonomy id) and each free-form tag (e.g.
+    'junior') is a column holding one bit per candidate row, so a boolean
+    query is a few word-wise AND/OR/NOT passes over packed bitmaps, and a
+    weighted ranking adds up the unpacked bits of the weighted columns.
+    Inserts set bits in place; deletes clear the row, whose slot is
+    reused by later inserts. A tag exists while some candidate carries
+    it: when its last candidate is removed its column is reused by the
+    next new tag.
+    """
+
+    def __init__(self, taxonomy: Optional[SkillTaxonomy] = None):
+        """
+        Create an empty index.
+
+        Args:
+            taxonomy: Taxonomy whose skill ids the profiles use (defaults to
+                the current default taxonomy; kept fixed for the index)
+        """
+        np = _require_numpy()
+        self.taxonomy = taxonomy if taxonomy is not None else get_taxonomy()
+        self._tags: List[Optional[str]] = []
+        self._tag_columns: Dict[str, int] = {}
+        self._free_tags: List[int] = []
+        self._rows: List[Optional[str]] = []
+        self._row_of: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._bits = np.zeros((len(self.taxonomy), 1), dtype=np.uint64)
+        self._alive = np.zeros(1, dtype=np.uint64)
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._row_of
+
+    @property
+    def keys(self) -> List[str]:
+        """Keys of the indexed candidates, in row order."""
+        return [key for key in self._rows if key is not None]
+
+    @property
+    def tags(self) -> List[str]:
+        """Tags carried by at least one candidate, in column order."""
+        return [tag for tag in self._tags if tag is not None]
+
+    def _column(self, name: str) -> int:
+        """
+        Column of a skill name, alias or tag.
+
+        Raises:
+            ValueError: If the name is neither in the taxonomy nor a tag
+        """
+        skill_id = self.taxonomy.resolve(name)
+        if skill_id is not None:
+            return skill_id
+        column = self._tag_columns.get(' '.join(name.lower().split()))
+        if column is None:
+            raise ValueError(f"Unknown skill or tag: {name!r}")
+        return column
+
+    def _ensure(self, rows: int, columns: int):
+        """
+        Grow the bitmaps to hold ``rows`` rows and ``columns`` columns.
+
+        Rows and tag columns both grow geometrically so that adding many
+        candidates or tags copies the matrix only a logarithmic number of times.
+        """
+        np = _require_numpy()
+        words = (rows + 63) // 64
+        have_columns, have_words = self._bits.shape
+        if words > have_words or columns > have_columns:
+            new_words = max(words, 2 * have_words) if words > have_words else have_words
+            new_columns = have_columns
+            if columns > have_columns:
+                skills = len(self.taxonomy)
+                new_columns = skills + max(columns - skills, 2 * (have_columns - skills), 8)
+            grown = np.zeros((new_columns, new_words), dtype=np.uint64)
+            grown[:have_columns, :have_words] = self._bits
+            self._bits = grown
+            alive = np.zeros(new_words, dtype=np.uint64)
+            alive[:have_words] = self._alive
+            self._alive = alive
+
+    def add(self, key: str, profile: Union[SkillProfile, str], tags: Iterable[str] = ()) -> int:
+        """
+        Insert or replace a candidate.
+
+        Args:
+            key: Candidate identifier
+            profile: The candidate's SkillProfile, or resume text to profile
+            tags: Free-form labels (e.g. seniority) usable as query terms
+
+        Returns:
+            Row of the candidate
+
+        Raises:
+            ValueError: If a tag is also a skill name or alias (it could
+                never be queried)
+        """
+        np = _require_numpy()
+        tags = [tag for tag in dict.fromkeys(' '.join(tag.lower().split()) for tag in tags) if tag]
+        for tag in tags:
+            if self.taxonomy.resolve(tag) is not None:
+                raise ValueError(f"Tag {tag!r} is a skill name or alias in the taxonomy")
+        if isinstance(profile, str):
+            profile = self.taxonomy.profile(profile)
+        if key in self._row_of:
+            self.remove(key)
+
+        columns = list(profile.ids())
+        if columns and columns[-1] >= len(self.taxonomy):
+            raise ValueError("profile has skill ids beyond the taxonomy")
+        for tag in tags:
+            if tag not in self._tag_columns:
+                if self._free_tags:
+                    slot = self._free_tags.pop()
+                    self._tags[slot] = tag
+                else:
+                    slot = len(self._tags)
+                    self._tags.append(tag)
+                self._tag_columns[tag] = len(self.taxonomy) + slot
+            columns.append(self._tag_columns[tag])
+
+        if self._free:
+            row = self._free.pop()
+            self._rows[row] = key
+        else:
+            row = len(self._rows)
+            self._rows.append(key)
+        self._row_of[key] = row
+        self._ensure(len(self._rows), len(self.taxonomy) + len(self._tags))
+
+        word, bit = row >> 6, np.uint64(1 << (row & 63))
+        if columns:
+            self._bits[columns, word] |= bit
+        self._alive[word] |= bit
+        return row
+
+    def add_many(self, candidates: Iterable[Tuple]):
+        """Insert (key, profile or text) pairs or (key, profile or text, tags) triples."""
+        for candidate in candidates:
+            self.add(*candidate)
+
+    def remove(self, key: str):
+        """Delete a candidate (KeyError if it is not indexed); tags left without candidates are dropped."""
+        np = _require_numpy()
+        row = self._row_of.pop(key)
+        word, bit = row >> 6, np.uint64(1 << (row & 63))
+        first_tag = len(self.taxonomy)
+        carried = np.flatnonzero(self._bits[first_tag:first_tag + len(self._tags), word] & bit)
+        self._bits[:, word] &= ~bit
+        self._alive[word] &= ~bit
+        self._rows[row] = None
+        self._free.append(row)
+
+        for slot in carried.tolist():
+            if not self._bits[first_tag + slot].any():
+                del self._tag_columns[self._tags[slot]]
+                self._tags[slot] = None
+                self._free_tags.append(slot)
+
+    def _evaluate(self, node):
+        """Packed row bitmap of a parsed query."""
+        np = _require_numpy()
+        kind = node[0]
+        if kind == 'term':
+            return self._bits[self._column(node[1])]
+        if kind == 'not':
+            return self._alive & ~self._evaluate(node[1])
+        combine = np.bitwise_and if kind == 'and' else np.bitwise_or
+        result = self._evaluate(node[1][0])
+        for child in node[1][1:]:
+            result = combine(result, self._evaluate(child))
+        return result
+
+    def _rows_of(self, bitmap):
+        np = _require_numpy()
+        bits = np.unpackbits((bitmap & self._alive).view(np.uint8), bitorder='little')
+        return np.flatnonzero(bits)
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Candidates matching a boolean query.
+
+        Args:
+            query: e.g. ``python AND (kubernetes OR docker) AND NOT junior``
+            limit: Maximum number of keys returned (in row order)
+
+        Returns:
+            Matching candidate keys
+
+        Raises:
+            ValueError: If the query is malformed or names an unknown skill or tag
+        """
+        rows = self._rows_of(self._evaluate(parse_query(query)))
+        if limit is not None:
+            rows = rows[:limit]
+        return [self._rows[row] for row in rows.tolist()]
+
+    def count(self, query: str) -> int:
+        """Number of candidates matching a boolean query."""
+        np = _require_numpy()
+        bitmap = self._evaluate(parse_query(query)) & self._alive
+        if hasattr(np, 'bitwise_count'):
+            return int(np.bitwise_count(bitmap).sum())
+        return int(np.unpackbits(bitmap.view(np.uint8)).sum())
+
+    def top_k(self, weights: Dict[str, float], k: int = 10,
+              query: Optional[str] = None) -> List[Tuple[str, float]]:
+        """
+        Rank candidates by the summed weights of the skills they have.
+
+        Args:
+            weights: Skill name (or tag) -> weight; negative weights penalize
+            k: Number of candidates returned
+            query: Optional boolean filter applied first
+
+        Returns:
+            (key, score) pairs, best first
+
+        Raises:
+            ValueError: If a weight or the query names an unknown skill or tag
+        """
+        np = _require_numpy()
+        bitmap = self._evaluate(parse_query(query)) if query else self._alive
+        rows = self._rows_of(bitmap)
+        if not len(rows) or k <= 0:
+            return []
+
+        scores = np.zeros(len(self._rows), dtype=np.float64)
+        for name, weight in weights.items():
+            column = self._column(name)
+            if weight:
+                present = np.unpackbits(self._bits[column].view(np.uint8), count=len(self._rows), bitorder='little')
+                scores += float(weight) * present
+        scores = scores[rows]
+
+        k = min(k, len(rows))
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.lexsort((rows[best], -scores[best]))]
+        return [(self._rows[int(rows[i])], float(scores[i])) for i in best]
+
+    def save(self, path: Union[str, Path]):
+        """Write the index to a ``.npz`` file."""
+        np = _require_numpy()
+        rows = len(self._rows)
+        with open(path, 'wb') as f:
+            np.savez(
+                f,
+                bits=self._bits[:len(self.taxonomy) + len(self._tags), :(rows + 63) // 64],
+                alive=self._alive[:(rows + 63) // 64],
+                rows=np.array([key if key is not None else '' for key in self._rows], dtype=str),
+                deleted=np.array([key is None for key in self._rows], dtype=bool),
+                tags=np.array([tag if tag is not None else '' for tag in self._tags], dtype=str),
+                digest=np.array(self.taxonomy.digest)
+            )
+
+    @classmethod
+    def load(cls, path: Union[str, Path], taxonomy: Optional[SkillTaxonomy] = None) -> 'SkillIndex':
+        """
+        Read an index written by ``save``.
+
+        Raises:
+            ValueError: If the taxonomy differs from the one the index was built with
+        """
+        np = _require_numpy()
+        index = cls(taxonomy)
+        with np.load(path) as data:
+            if str(data['digest']) != index.taxonomy.digest:
+                raise ValueError("Skill index was built with a different taxonomy")
+            index._bits = data['bits'].copy()
+            index._alive = data['alive'].copy()
+            index._tags = [tag or None for tag in data['tags'].tolist()]
+            deleted = data['deleted'].tolist()
+            index._rows = [None if gone else key for key, gone in zip(data['rows'].tolist(), deleted)]
+        index._tag_columns = {tag: len(index.taxonomy) + i for i, tag in enumerate(index._tags) if tag is not None}
+        index._free_tags = [i for i, tag in enumerate(index._tags) if tag is None]
+        index._row_of = {key: row for row, key in enumerate(index._rows) if key is not None}
+        index._free = [row for row, key in enumerate(index._rows) if key is None]
+        if not index._bits.shape[1]:
+            index._ensure(1, len(index.taxonomy) + len(index._tags))
+        return index
@@ -0,0 +1,140 @@
+"""
+Skill Mentions Module
+Per-skill frequencies, positions and section context collected in one skill scan.
+"""
+
+from bisect import bisect_right
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from .sections import Section
+from .taxonomy import SkillTaxonomy
+from .text_buffer import original_span
+
+
+class SkillMention(NamedTuple):
+    """How often and where one canonical skill occurs in a text."""
+    skill_id: int
+    skill: str
+    categories: Tuple[str, ...]
+    count: int
+    first: Tuple[int, int]
+    last: Tuple[int, int]
+    sections: Tuple[str, ...]
+
+
+class SkillMentions:
+    """
+    Every skill occurrence of one text, from a single taxonomy scan.
+
+    Mentions are keyed by display name and ordered by first occurrence;
+    spans are (start, end) offsets into the original text when the text was
+    a NormalizedText with offsets. Consumers (keyword scoring, job
+    matching, badges, highlighting) read this record instead of searching
+    the text again.
+    """
+
+    def __init__(self, taxonomy: SkillTaxonomy, mentions: Dict[str, SkillMention],
+                 spans: Sequence[Tuple[int, int, int, str]]):
+        """
+        Wrap scan results (see ``scan_mentions``).
+
+        Args:
+            taxonomy: Taxonomy the skill ids refer to
+            mentions: Display name -> mention, in order of first occurrence
+            spans: (skill id, start, end, section) of every occurrence, in text order
+        """
+        self.taxonomy = taxonomy
+        self.mentions = mentions
+        self.spans = tuple(spans)
+        self.ids: Set[int] = {mention.skill_id for mention in mentions.values()}
+
+    def __len__(self) -> int:
+        return len(self.mentions)
+
+    def __iter__(self) -> Iterator[SkillMention]:
+        return iter(self.mentions.values())
+
+    def __contains__(self, name: str) -> bool:
+        """Whether a skill (display name or any alias) is mentioned."""
+        return self.taxonomy.resolve(name) in self.ids
+
+    def get(self, name: str) -> Optional[SkillMention]:
+        """Mention of a skill by display name or alias (None if absent)."""
+        skill_id = self.taxonomy.resolve(name)
+        if skill_id is None or skill_id not in self.ids:
+            return None
+        return self.mentions[self.taxonomy.names[skill_id]]
+
+    def _selected(self, sections: Optional[Iterable[str]]) -> Iterator[SkillMention]:
+        if sections is None:
+            return iter(self.mentions.values())
+        wanted = set(sections)
+        return (mention for mention in self.mentions.values() if wanted.intersection(mention.sections))
+
+    def names(self, sections: Optional[Iterable[str]] = None) -> List[str]:
+        """Display names of the mentioned skills, sorted (optionally only those in the given sections)."""
+        return sorted((mention.skill for mention in self._selected(sections)), key=str.lower)
+
+    def by_category(self, sections: Optional[Iterable[str]] = None) -> Dict[str, List[str]]:
+        """Skills by category, as ``NLPEngine.extract_skills`` returns them."""
+        found = {category: [] for category in self.taxonomy.categories}
+        for mention in self._selected(sections):
+            for category in mention.categories:
+                found[category].append(mention.skill)
+        return {category: sorted(skills, key=str.lower) for category, skills in found.items()}
+
+    def counts(self) -> Dict[str, int]:
+        """Occurrences per skill, most mentioned first."""
+        ranked = sorted(self.mentions.values(), key=lambda mention: -mention.count)
+        return {mention.skill: mention.count for mention in ranked}
+
+    def hits(self) -> List[Dict]:
+        """Occurrences for in-context highlighting (as ``NLPEngine.find_skill_spans``)."""
+        hits = []
+        for skill_id, start, end, section in self.spans:
+            for category in self.taxonomy.skill_categories[skill_id]:
+                hits.append({'skill': self.taxonomy.names[skill_id], 'category': category,
+                             'start': start, 'end': end, 'section': section})
+        hits.sort(key=lambda hit: (hit['start'], -hit['end']))
+        return hits
+
+
+def scan_mentions(taxonomy: SkillTaxonomy, text: str, sections: Sequence[Section] = (),
+                  fuzzy: bool = False) -> SkillMentions:
+    """
+    Collect skill counts, positions and sections in one pass over the matches.
+
+    Args:
+        taxonomy: Compiled skill taxonomy
+        text: Text to scan (a NormalizedText maps spans to original offsets)
+        sections: Sections of ``text`` in document order (e.g.
+            ``RESUME_SEGMENTER.segment(text)``); hits outside them get ''
+        fuzzy: Also match misspelled and split skills
+
+    Returns:
+        SkillMentions record
+    """
+    starts = [section.start for section in sections]
+    spans = []
+    found: Dict[int, List] = {}
+    for skill_id, start, end in taxonomy.finditer(text, fuzzy):
+        index = bisect_right(starts, start) - 1
+        section = sections[index].name if index >= 0 and start < sections[index].end else ''
+        span = original_span(text, start, end)
+        spans.append((skill_id, span[0], span[1], section))
+
+        entry = found.get(skill_id)
+        if entry is None:
+            found[skill_id] = [1, span, span, [section]]
+        else:
+            entry[0] += 1
+            entry[2] = span
+            if section not in entry[3]:
+                entry[3].append(section)
+
+    mentions = {}
+    for skill_id, (count, first, last, names) in found.items():
+        name = taxonomy.names[skill_id]
+        mentions[name] = SkillMention(skill_id, name, taxonomy.skill_categories[skill_id],
+                                      count, first, last, tuple(names))
+    return SkillMentions(taxonomy, mentions, spans)
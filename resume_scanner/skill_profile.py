@@ -0,0 +1,205 @@
+"""
+Skill Profile Module
+Compact bitset skill profiles and array-backed candidate pools for fast overlap scoring.
+"""
+
+from typing import Iterable, List, Optional, Tuple
+
+from .matching import popcount
+
+
+def _require_numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("numpy is required for profile matrices. Install with: pip install numpy")
+    return np
+
+
+class SkillProfile:
+    """
+    Set of canonical skill ids stored as one integer bitset.
+
+    Bit ``i`` is set when the skill with taxonomy id ``i`` is present, so
+    overlap, union and Jaccard similarity are bitwise operations plus a
+    popcount. Ids refer to the taxonomy the profile was built with.
+    """
+
+    __slots__ = ('bits',)
+
+    def __init__(self, bits: int = 0):
+        self.bits = bits
+
+    @classmethod
+    def from_ids(cls, ids: Iterable[int]) -> 'SkillProfile':
+        """Profile with the given skill ids set."""
+        ids = list(ids)
+        if not ids:
+            return cls(0)
+        buffer = bytearray(max(ids) // 8 + 1)
+        for skill_id in ids:
+            buffer[skill_id >> 3] |= 1 << (skill_id & 7)
+        return cls(int.from_bytes(buffer, 'little'))
+
+    def ids(self) -> List[int]:
+        """Skill ids in the profile, ascending."""
+        return [i for i, bit in enumerate(bin(self.bits)[:1:-1]) if bit == '1']
+
+    def __len__(self) -> int:
+        return popcount(self.bits)
+
+    def __contains__(self, skill_id: int) -> bool:
+        return bool(self.bits >> skill_id & 1)
+
+    def __and__(self, other: 'SkillProfile') -> 'SkillProfile':
+        return SkillProfile(self.bits & other.bits)
+
+    def __or__(self, other: 'SkillProfile') -> 'SkillProfile':
+        return SkillProfile(self.bits | other.bits)
+
+    def __sub__(self, other: 'SkillProfile') -> 'SkillProfile':
+        return SkillProfile(self.bits & ~other.bits)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, SkillProfile) and self.bits == other.bits
+
+    def __hash__(self) -> int:
+        return hash(self.bits)
+
+    def __repr__(self) -> str:
+        return f"SkillProfile({self.ids()})"
+
+    def overlap(self, other: 'SkillProfile') -> int:
+        """Number of skills in both profiles."""
+        return popcount(self.bits & other.bits)
+
+    def jaccard(self, other: 'SkillProfile') -> float:
+        """Jaccard similarity (0 when both profiles are empty)."""
+        union = popcount(self.bits | other.bits)
+        return popcount(self.bits & other.bits) / union if union else 0.0
+
+    def coverage(self, required: 'SkillProfile') -> float:
+        """Share of the required skills this profile has (1 when nothing is required)."""
+        needed = popcount(required.bits)
+        return popcount(self.bits & required.bits) / needed if needed else 1.0
+
+    def to_bytes(self) -> bytes:
+        """Little-endian bitset bytes (see ``from_bytes``)."""
+        return self.bits.to_bytes((self.bits.bit_length() + 7) // 8, 'little')
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'SkillProfile':
+        return cls(int.from_bytes(data, 'little'))
+
+
+def _popcount_rows(np, words):
+    """Set bits per row of a uint64 matrix."""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words).sum(axis=1, dtype=np.int64)
+    table = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+    return table[words.view(np.uint8)].reshape(len(words), -1).sum(axis=1, dtype=np.int64)
+
+
+class ProfileMatrix:
+    """
+    Skill profiles of a candidate pool packed into a uint64 array.
+
+    Row ``r`` holds candidate ``r``'s bitset in ``ceil(skills / 64)``
+    words, so scoring a requirement profile against the whole pool is a
+    handful of vectorized AND/OR and popcount passes over the array.
+    """
+
+    def __init__(self, skill_count: int):
+        """
+        Create an empty pool.
+
+        Args:
+            skill_count: Number of skills in the taxonomy (bitset width)
+        """
+        np = _require_numpy()
+        self.skill_count = skill_count
+        self.words = max((skill_count + 63) // 64, 1)
+        self._rows = np.zeros((0, self.words), dtype=np.uint64)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _pack(self, profile: SkillProfile):
+        np = _require_numpy()
+        if profile.bits.bit_length() > self.words * 64:
+            raise ValueError("profile has skill ids beyond the matrix width")
+        return np.frombuffer(profile.bits.to_bytes(self.words * 8, 'little'), dtype='<u8').astype(np.uint64)
+
+    def append(self, profile: SkillProfile) -> int:
+        """Add a candidate profile; returns its row."""
+        np = _require_numpy()
+        row = self._count
+        if row == len(self._rows):
+            grown = np.zeros((max(16, 2 * row), self.words), dtype=np.uint64)
+            grown[:row] = self._rows[:row]
+            self._rows = grown
+        self._rows[row] = self._pack(profile)
+        self._count += 1
+        return row
+
+    def extend(self, profiles: Iterable[SkillProfile]):
+        for profile in profiles:
+            self.append(profile)
+
+    def __getitem__(self, row: int) -> SkillProfile:
+        if not 0 <= row < self._count:
+            raise IndexError(row)
+        return SkillProfile(int.from_bytes(self._rows[row].astype('<u8').tobytes(), 'little'))
+
+    def overlap(self, profile: SkillProfile):
+        """Skills shared with the profile, per candidate (int64 array)."""
+        np = _require_numpy()
+        return _popcount_rows(np, self._rows[:self._count] & self._pack(profile)[None, :])
+
+    def jaccard(self, profile: SkillProfile):
+        """Jaccard similarity with the profile, per candidate (float64 array)."""
+        np = _require_numpy()
+        rows, packed = self._rows[:self._count], self._pack(profile)[None, :]
+        shared = _popcount_rows(np, rows & packed)
+        union = _popcount_rows(np, rows | packed)
+        return np.where(union > 0, shared / np.maximum(union, 1), 0.0)
+
+    def coverage(self, required: SkillProfile):
+        """Share of the required skills each candidate has (float64 array)."""
+        needed = len(required)
+        if not needed:
+            np = _require_numpy()
+            return np.ones(self._count)
+        return self.overlap(required) / needed
+
+    def top_k(self, profile: SkillProfile, k: int = 10, metric: str = 'jaccard') -> List[Tuple[int, float]]:
+        """
+        Best-matching candidates.
+
+        Args:
+            profile: Requirement profile
+            k: Number of candidates returned
+            metric: 'jaccard', 'coverage' or 'overlap'
+
+        Returns:
+            (row, score) pairs, best first
+        """
+        np = _require_numpy()
+        scores = {'jaccard': self.jaccard, 'coverage': self.coverage, 'overlap': self.overlap}[metric](profile)
+        k = min(k, len(scores))
+        if not k:
+            return []
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.lexsort((best, -scores[best]))]
+        return [(int(row), float(scores[row])) for row in best]
+
+
+def profile_matrix(profiles: Iterable[SkillProfile], skill_count: Optional[int] = None) -> ProfileMatrix:
+    """Pack profiles into a ProfileMatrix (width from the widest profile by default)."""
+    profiles = list(profiles)
+    if skill_count is None:
+        skill_count = max((p.bits.bit_length() for p in profiles), default=0)
+    matrix = ProfileMatrix(skill_count)
+    matrix.extend(profiles)
+    return matrix
@@ -0,0 +1,293 @@
+"""
+Results Store Module
+Persists analysis results in SQLite for querying the candidate pool without re-analysis.
+"""
+
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+
+# Default database of batch runs (relative to the working directory)
+DEFAULT_DB_PATH = 'resume_results.db'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    digest TEXT,
+    word_count INTEGER,
+    experience_years REAL,
+    analyzed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS scores (
+    document_id INTEGER PRIMARY KEY REFERENCES documents(id) ON DELETE CASCADE,
+    ats_total REAL,
+    grade TEXT,
+    pass_ats INTEGER,
+    sections REAL,
+    formatting REAL,
+    keywords REAL,
+    length REAL,
+    readability REAL,
+    contact REAL,
+    role TEXT,
+    ai_probability REAL,
+    ai_verdict TEXT
+);
+CREATE TABLE IF NOT EXISTS skills (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE COLLATE NOCASE
+);
+CREATE TABLE IF NOT EXISTS document_skills (
+    document_id INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+    skill_id INTEGER NOT NULL REFERENCES skills(id),
+    mentions INTEGER NOT NULL,
+    PRIMARY KEY (document_id, skill_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS job_matches (
+    document_id INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+    role TEXT NOT NULL,
+    match REAL NOT NULL,
+    is_best INTEGER NOT NULL,
+    PRIMARY KEY (document_id, role)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS scores_ats_total ON scores(ats_total);
+CREATE INDEX IF NOT EXISTS scores_ai_probability ON scores(ai_probability);
+CREATE INDEX IF NOT EXISTS documents_experience ON documents(experience_years);
+CREATE INDEX IF NOT EXISTS document_skills_skill ON document_skills(skill_id, document_id);
+CREATE INDEX IF NOT EXISTS job_matches_best ON job_matches(role, match) WHERE is_best;
+"""
+
+ATS_COMPONENTS = ('sections', 'formatting', 'keywords', 'length', 'readability', 'contact')
+
+
+class AnalysisRecord(NamedTuple):
+    """Analysis results of one resume, as stored."""
+    name: str
+    digest: str = ''
+    word_count: int = 0
+    experience_years: Optional[float] = None
+    ats_total: Optional[float] = None
+    grade: Optional[str] = None
+    pass_ats: Optional[bool] = None
+    components: Dict[str, float] = {}
+    role: Optional[str] = None
+    ai_probability: Optional[float] = None
+    ai_verdict: Optional[str] = None
+    skills: Dict[str, int] = {}
+    job_matches: Dict[str, float] = {}
+
+
+class ResultStore:
+    """
+    Analysis results of a candidate pool in a local SQLite database.
+
+    The schema is normalized (documents, scores, skills, per-document skill
+    mentions, job matches) with indexes for the usual screening filters:
+    score ranges, skill membership and best-matching role. Records are
+    buffered and written in batches, each in one transaction with
+    ``executemany``, on a WAL-mode database so readers (e.g. the app) are
+    not blocked by a running ingest. Re-adding a document name replaces
+    its results.
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_DB_PATH, batch_size: int = 500):
+        """
+        Open (and create if needed) a results database.
+
+        Args:
+            path: Database file (``':memory:'`` for a temporary store)
+            batch_size: Records buffered before they are written
+        """
+        self.path = str(path)
+        self.batch_size = batch_size
+        self._pending: List[AnalysisRecord] = []
+        self._skill_ids: Dict[str, int] = {}
+        self.connection = sqlite3.connect(self.path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self) -> 'ResultStore':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Write pending records and close the database."""
+        if self.connection is not None:
+            self.flush()
+            self.connection.close()
+            self.connection = None
+
+    def __len__(self) -> int:
+        self.flush()
+        return self.connection.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def add(self, record: AnalysisRecord):
+        """Buffer a record (written once ``batch_size`` records are pending)."""
+        self._pending.append(record)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def add_many(self, records: Iterable[AnalysisRecord]):
+        """Buffer many records."""
+        for record in records:
+            self.add(record)
+        self.flush()
+
+    def flush(self):
+        """Write all pending records in one transaction."""
+        if not self._pending:
+            return
+        records = list({record.name: record for record in self._pending}.values())
+        self._pending = []
+        with self.connection:
+            cursor = self.connection.cursor()
+            cursor.executemany("DELETE FROM documents WHERE name = ?", [(r.name,) for r in records])
+            now = time.time()
+            cursor.executemany(
+                "INSERT INTO documents (name, digest, word_count, experience_years, analyzed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(r.name, r.digest, r.word_count, r.experience_years, now) for r in records]
+            )
+            ids = self._document_ids(cursor, [r.name for r in records])
+            skill_ids = self._ensure_skills(cursor, {skill for r in records for skill in r.skills})
+
+            cursor.executemany(
+                "INSERT INTO scores VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(ids[r.name], r.ats_total, r.grade, None if r.pass_ats is None else int(r.pass_ats))
+                 + tuple(r.components.get(name) for name in ATS_COMPONENTS)
+                 + (r.role, r.ai_probability, r.ai_verdict) for r in records]
+            )
+            cursor.executemany(
+                "INSERT INTO document_skills VALUES (?, ?, ?)",
+                [(ids[r.name], skill_ids[skill.lower()], count) for r in records for skill, count in r.skills.items()]
+            )
+            rows = []
+            for r in records:
+                best = max(r.job_matches, key=r.job_matches.get) if r.job_matches else None
+                rows.extend((ids[r.name], role, match, int(role == best)) for role, match in r.job_matches.items())
+            cursor.executemany("INSERT INTO job_matches VALUES (?, ?, ?, ?)", rows)
+
+    def _document_ids(self, cursor, names: Sequence[str]) -> Dict[str, int]:
+        ids = {}
+        # Stay below SQLite's bound-parameter limit
+        for i in range(0, len(names), 500):
+            chunk = names[i:i + 500]
+            query = f"SELECT name, id FROM documents WHERE name IN ({','.join('?' * len(chunk))})"
+            ids.update(cursor.execute(query, chunk).fetchall())
+        return ids
+
+    def _ensure_skills(self, cursor, names: Iterable[str]) -> Dict[str, int]:
+        """Ids of skill names (case-insensitive), adding unknown skills."""
+        missing = {name.lower(): name for name in names if name.lower() not in self._skill_ids}
+        if missing:
+            cursor.executemany("INSERT OR IGNORE INTO skills (name) VALUES (?)", [(n,) for n in missing.values()])
+            for name, skill_id in cursor.execute("SELECT name, id FROM skills"):
+                self._skill_ids[name.lower()] = skill_id
+        return self._skill_ids
+
+    def find(self, min_score: Optional[float] = None, max_score: Optional[float] = None,
+             skills: Sequence[str] = (), best_role: Optional[str] = None,
+             max_ai_probability: Optional[float] = None, min_experience: Optional[float] = None,
+             limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        Candidates matching all the given filters.
+
+        Args:
+            min_score: Lowest ATS total
+            max_score: Highest ATS total
+            skills: Skills the candidate must all have (case-insensitive)
+            best_role: Role the candidate matches best
+            max_ai_probability: Highest AI-content probability
+            min_experience: Fewest years of experience
+            limit: Maximum number of results
+
+        Returns:
+            (document name, ATS total) pairs, best score first
+        """
+        self.flush()
+        clauses, params = [], []
+        if min_score is not None:
+            clauses.append("s.ats_total >= ?")
+            params.append(min_score)
+        if max_score is not None:
+            clauses.append("s.ats_total <= ?")
+            params.append(max_score)
+        if max_ai_probability is not None:
+            clauses.append("s.ai_probability <= ?")
+            params.append(max_ai_probability)
+        if min_experience is not None:
+            clauses.append("d.experience_years >= ?")
+            params.append(min_experience)
+        if best_role is not None:
+            clauses.append("d.id IN (SELECT document_id FROM job_matches WHERE is_best AND role = ?)")
+            params.append(best_role)
+        if skills:
+            clauses.append(
+                "d.id IN (SELECT ds.document_id FROM document_skills ds JOIN skills k ON k.id = ds.skill_id "
+                f"WHERE k.name IN ({','.join('?' * len(skills))}) "
+                "GROUP BY ds.document_id HAVING COUNT(*) = ?)"
+            )
+            params.extend(skills)
+            params.append(len({skill.lower() for skill in skills}))
+
+        query = "SELECT d.name, s.ats_total FROM documents d JOIN scores s ON s.document_id = d.id"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY s.ats_total DESC, d.name"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return self.connection.execute(query, params).fetchall()
+
+    def get(self, name: str) -> Optional[AnalysisRecord]:
+        """Stored results of a document (None if unknown)."""
+        self.flush()
+        row = self.connection.execute(
+            "SELECT d.id, d.name, d.digest, d.word_count, d.experience_years, s.ats_total, s.grade, s.pass_ats, "
+            f"{', '.join('s.' + name for name in ATS_COMPONENTS)}, s.role, s.ai_probability, s.ai_verdict "
+            "FROM documents d JOIN scores s ON s.document_id = d.id WHERE d.name = ?", (name,)
+        ).fetchone()
+        if row is None:
+            return None
+        document_id = row[0]
+        skills = dict(self.connection.execute(
+            "SELECT k.name, ds.mentions FROM document_skills ds JOIN skills k ON k.id = ds.skill_id "
+            "WHERE ds.document_id = ? ORDER BY ds.mentions DESC, k.name", (document_id,)))
+        matches = dict(self.connection.execute(
+            "SELECT role, match FROM job_matches WHERE document_id = ? ORDER BY match DESC", (document_id,)))
+        components = {name: value for name, value in zip(ATS_COMPONENTS, row[8:14]) if value is not None}
+        return AnalysisRecord(
+            name=row[1], digest=row[2], word_count=row[3], experience_years=row[4], ats_total=row[5],
+            grade=row[6], pass_ats=None if row[7] is None else bool(row[7]), components=components,
+            role=row[14], ai_probability=row[15], ai_verdict=row[16], skills=skills, job_matches=matches
+        )
+
+    def remove(self, name: str) -> bool:
+        """Delete a document's results; returns whether it was stored."""
+        self.flush()
+        with self.connection:
+            return self.connection.execute("DELETE FROM documents WHERE name = ?", (name,)).rowcount > 0
+
+    def skill_counts(self, limit: Optional[int] = None) -> Dict[str, int]:
+        """Number of candidates per skill, most common first."""
+        self.flush()
+        query = ("SELECT k.name, COUNT(*) AS n FROM document_skills ds JOIN skills k ON k.id = ds.skill_id "
+                 "GROUP BY k.id ORDER BY n DESC, k.name")
+        params = ()
+        if limit is not None:
+            query += " LIMIT ?"
+            params = (limit,)
+        return dict(self.connection.execute(query, params))
+
+    def best_roles(self) -> Dict[str, int]:
+        """Number of candidates per best-matching role."""
+        self.flush()
+        return dict(self.connection.execute(
+            "SELECT role, COUNT(*) AS n FROM job_matches WHERE is_best GROUP BY role ORDER BY n DESC, role"))
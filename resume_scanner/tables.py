@@ -0,0 +1,43 @@
+"""
+Tables Module
+Column dictionaries to pandas DataFrames, or NumPy record arrays without pandas.
+"""
+
+from typing import Dict, Iterable
+
+
+def to_table(np, columns: Dict, object_columns: Iterable[str] = ()):
+    """
+    Build a table from equal-length columns.
+
+    Args:
+        np: The numpy module
+        columns: Mapping of column name to values
+        object_columns: Columns holding tuples or other Python objects
+
+    Returns:
+        pandas DataFrame, or a NumPy record array if pandas is not installed
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        pass
+    else:
+        return pd.DataFrame(columns)
+
+    object_columns = set(object_columns)
+    arrays = {}
+    for name, values in columns.items():
+        if name in object_columns:
+            column = np.empty(len(values), dtype=object)
+            for index, value in enumerate(values):
+                column[index] = value
+        else:
+            column = np.asarray(values)
+        arrays[name] = column
+    length = len(next(iter(arrays.values()))) if arrays else 0
+    array = np.empty(length, dtype=[(name, column.dtype) for name, column in arrays.items()])
+    for name, column in arrays.items():
+        array[name] = column
+    # Record array, so rows support attribute access like the scalar records
+    return array.view(np.recarray)
@@ -0,0 +1,331 @@
+"""
+Skill Taxonomy Module
+Loads the skill taxonomy from a data file and keeps its compiled matcher cached and current.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from .fuzzy import FuzzyPhraseMatcher
+from .matching import DATA_DIR, PhraseMatcher
+from .skill_profile import SkillProfile
+
+
+# Bumped whenever the compiled structure changes, so old cache files are ignored
+FORMAT_VERSION = 4
+
+
+def normalize_skill(name: str) -> str:
+    """Canonical form of a skill name (lowercase, single spaces)."""
+    return ' '.join(name.lower().split())
+
+
+class SkillEntry(NamedTuple):
+    """One canonical skill of the taxonomy."""
+    skill: str
+    name: str
+    aliases: Tuple[str, ...]
+
+
+def _flatten(value) -> Iterator[Union[str, Dict]]:
+    """Skill entries of a category: a list, or groups of lists (e.g. frameworks by language)."""
+    if isinstance(value, dict) and 'name' not in value:
+        for group in value.values():
+            yield from _flatten(group)
+    elif isinstance(value, (str, dict)):
+        yield value
+    else:
+        for item in value:
+            yield from _flatten(item)
+
+
+def parse_taxonomy(data: Dict) -> Dict[str, List[SkillEntry]]:
+    """
+    Normalize taxonomy data.
+
+    Args:
+        data: Mapping of category to skills (lists, possibly grouped in
+            nested mappings). A skill is its display name, or an object
+            ``{"name": ..., "aliases": [...]}`` listing other spellings
+
+    Returns:
+        Mapping of category to de-duplicated skill entries in file order
+    """
+    categories = {}
+    for category, value in data.items():
+        entries = []
+        seen = set()
+        for item in _flatten(value):
+            name, aliases = (item, []) if isinstance(item, str) else (item['name'], item.get('aliases', []))
+            skill = normalize_skill(name)
+            if skill and skill not in seen:
+                seen.add(skill)
+                aliases = tuple(dict.fromkeys(a for a in map(normalize_skill, aliases) if a and a != skill))
+                entries.append(SkillEntry(skill, ' '.join(name.split()), aliases))
+        categories[category] = entries
+    return categories
+
+
+class SkillTaxonomy:
+    """
+    A compiled skill taxonomy.
+
+    Every canonical skill gets an integer id. The alias table maps each
+    spelling (canonical name and aliases) to that id, and all spellings are
+    compiled into one PhraseMatcher, so extracting skills is a single token
+    scan however large the taxonomy is, and "k8s" and "kubernetes" resolve
+    to the same skill at match time. A skill may belong to several
+    categories.
+    """
+
+    def __init__(self, categories: Dict[str, Sequence[SkillEntry]], digest: str = ''):
+        """
+        Compile a taxonomy.
+
+        Args:
+            categories: Mapping of category to skill entries (see ``parse_taxonomy``)
+            digest: Hash of the source data (identifies cache files)
+        """
+        self.digest = digest
+        ids = {}
+        self.names: List[str] = []
+        memberships: List[List[str]] = []
+        for category, entries in categories.items():
+            for entry in entries:
+                if entry.skill not in ids:
+                    ids[entry.skill] = len(ids)
+                    self.names.append(entry.name)
+                    memberships.append([])
+                memberships[ids[entry.skill]].append(category)
+        self.skills: List[str] = list(ids)
+        self.skill_categories: List[Tuple[str, ...]] = [tuple(m) for m in memberships]
+        self.categories = {category: tuple(entry.skill for entry in entries)
+                           for category, entries in categories.items()}
+
+        # Canonical names win over aliases of other skills
+        self.aliases: Dict[str, int] = {}
+        for entries in categories.values():
+            for entry in entries:
+                for alias in entry.aliases:
+                    self.aliases.setdefault(alias, ids[entry.skill])
+        self.aliases.update(ids)
+        self.matcher = PhraseMatcher(self.aliases)
+        self._fuzzy: Optional[FuzzyPhraseMatcher] = None
+
+    def __getstate__(self):
+        # The fuzzy index is built on demand, not cached
+        state = self.__dict__.copy()
+        state['_fuzzy'] = None
+        return state
+
+    def to_state(self) -> Dict:
+        """Compiled taxonomy as plain JSON-serializable data (see ``from_state``)."""
+        return {
+            'digest': self.digest,
+            'names': self.names,
+            'skills': self.skills,
+            'skill_categories': self.skill_categories,
+            'categories': self.categories,
+            'aliases': self.aliases,
+            'matcher': self.matcher.to_state(),
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict) -> 'SkillTaxonomy':
+        """Rebuild a taxonomy from ``to_state`` data without recompiling."""
+        taxonomy = cls.__new__(cls)
+        taxonomy.digest = state['digest']
+        taxonomy.names = list(state['names'])
+        taxonomy.skills = list(state['skills'])
+        taxonomy.skill_categories = [tuple(categories) for categories in state['skill_categories']]
+        taxonomy.categories = {category: tuple(skills) for category, skills in state['categories'].items()}
+        taxonomy.aliases = dict(state['aliases'])
+        taxonomy.matcher = PhraseMatcher.from_state(state['matcher'])
+        taxonomy._fuzzy = None
+        return taxonomy
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def resolve(self, name: str) -> Optional[int]:
+        """Canonical skill id of a skill name or alias (None if unknown)."""
+        return self.aliases.get(normalize_skill(name))
+
+    @property
+    def fuzzy_matcher(self) -> FuzzyPhraseMatcher:
+        """Typo-tolerant matcher over all spellings (its trigram index is built on first use)."""
+        if self._fuzzy is None:
+            self._fuzzy = FuzzyPhraseMatcher(self.aliases, self.matcher)
+        return self._fuzzy
+
+    def _matcher(self, fuzzy: bool):
+        return self.fuzzy_matcher if fuzzy else self.matcher
+
+    def skill_ids(self, text: str, fuzzy: bool = False) -> List[int]:
+        """Ids of the skills present in the text, in ascending order (``fuzzy`` tolerates typos)."""
+        return sorted(self._matcher(fuzzy).ids(text))
+
+    def profile(self, text: str, fuzzy: bool = False) -> SkillProfile:
+        """Bitset profile of the skills present in the text."""
+        return SkillProfile.from_ids(self._matcher(fuzzy).ids(text))
+
+    def profile_of(self, names: Iterable[str]) -> SkillProfile:
+        """Bitset profile of skill names or aliases (e.g. job requirements); unknown names are skipped."""
+        return SkillProfile.from_ids(skill_id for skill_id in map(self.resolve, names) if skill_id is not None)
+
+    def names_of(self, profile: SkillProfile) -> List[str]:
+        """Display names of a profile's skills, in id order."""
+        return [self.names[skill_id] for skill_id in profile.ids()]
+
+    def extract(self, text: str, fuzzy: bool = False) -> Dict[str, List[str]]:
+        """Skills present in the text by category (display names, sorted)."""
+        return self.by_category(self.skill_ids(text, fuzzy))
+
+    def by_category(self, skill_ids: Iterable[int]) -> Dict[str, List[str]]:
+        """Skill ids (e.g. ``profile.ids()``) as display names by category, sorted."""
+        found = {category: [] for category in self.categories}
+        for skill_id in skill_ids:
+            for category in self.skill_categories[skill_id]:
+                found[category].append(self.names[skill_id])
+        return {category: sorted(skills, key=str.lower) for category, skills in found.items()}
+
+    def finditer(self, text: str, fuzzy: bool = False) -> Iterator[Tuple[int, int, int]]:
+        """Yield (canonical skill id, start, end) for every skill occurrence."""
+        return self._matcher(fuzzy).finditer(text)
+
+
+def default_cache_dir() -> Path:
+    """Directory of compiled taxonomy caches (``RESUME_SCANNER_CACHE_DIR`` overrides)."""
+    if os.environ.get('RESUME_SCANNER_CACHE_DIR'):
+        return Path(os.environ['RESUME_SCANNER_CACHE_DIR'])
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'resume_scanner'
+
+
+def compile_taxonomy(path: Union[str, Path], cache_dir: Union[str, Path, None] = None) -> SkillTaxonomy:
+    """
+    Load a taxonomy file, using the compiled cache when it is current.
+
+    The compiled tables are cached as JSON (plain data, never executed),
+    in a file named after the taxonomy file's path and a hash of its
+    contents and the format version. A changed taxonomy or a new compiled
+    format is recompiled and the stale cache files of the same taxonomy
+    file are removed. Cache files that cannot be read or written are
+    ignored.
+
+    Args:
+        path: Taxonomy JSON file
+        cache_dir: Cache directory (defaults to ``default_cache_dir()``)
+
+    Returns:
+        Compiled SkillTaxonomy
+    """
+    path = Path(path)
+    raw = path.read_bytes()
+    digest = hashlib.sha1(raw + b'\0' + str(FORMAT_VERSION).encode()).hexdigest()
+    # Taxonomy files with the same name in different directories get their own caches
+    source = hashlib.sha1(str(path.resolve()).encode('utf-8')).hexdigest()[:8]
+    cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    cache_file = cache_dir / f"{path.stem}-{source}-{digest[:16]}.json"
+
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('digest') == digest:
+            return SkillTaxonomy.from_state(state)
+    except Exception:
+        pass
+
+    taxonomy = SkillTaxonomy(parse_taxonomy(json.loads(raw.decode('utf-8'))), digest)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        temporary = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump(taxonomy.to_state(), f, separators=(',', ':'))
+        os.replace(temporary, cache_file)
+        for stale in cache_dir.glob(f"{path.stem}-{source}-*.json"):
+            if stale != cache_file:
+                stale.unlink()
+    except OSError:
+        pass
+    return taxonomy
+
+
+class TaxonomyLoader:
+    """
+    The current taxonomy of a data file, reloaded when the file changes.
+
+    ``get`` checks the file's modification time at most every
+    ``check_interval`` seconds and recompiles (or loads from cache) when it
+    changed, so long-running servers pick up taxonomy updates without a
+    restart. A file that fails to load keeps the previous taxonomy.
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None, cache_dir: Union[str, Path, None] = None,
+                 check_interval: float = 2.0):
+        """
+        Create a loader (nothing is read until ``get``).
+
+        Args:
+            path: Taxonomy JSON file (defaults to ``data/skills_database.json``)
+            cache_dir: Compiled cache directory (defaults to ``default_cache_dir()``)
+            check_interval: Seconds between checks for file changes
+        """
+        self.path = Path(path) if path is not None else DATA_DIR / 'skills_database.json'
+        self.cache_dir = cache_dir
+        self.check_interval = check_interval
+        self.reloads = 0
+        self._taxonomy: Optional[SkillTaxonomy] = None
+        self._stat = None
+        self._checked = 0.0
+        self._lock = Lock()
+
+    def get(self) -> SkillTaxonomy:
+        """The current compiled taxonomy."""
+        if self._taxonomy is not None and time.monotonic() - self._checked < self.check_interval:
+            return self._taxonomy
+        with self._lock:
+            self._refresh()
+            return self._taxonomy
+
+    def reload(self) -> SkillTaxonomy:
+        """Check the file for changes now."""
+        with self._lock:
+            self._refresh(force=True)
+            return self._taxonomy
+
+    def _refresh(self, force: bool = False):
+        now = time.monotonic()
+        if not force and self._taxonomy is not None and now - self._checked < self.check_interval:
+            return
+        try:
+            stat = self.path.stat()
+            key = (stat.st_mtime_ns, stat.st_size)
+            if key != self._stat:
+                self._taxonomy = compile_taxonomy(self.path, self.cache_dir)
+                self._stat = key
+                self.reloads += 1
+        except (OSError, ValueError) as e:
+            if self._taxonomy is None:
+                raise
+            print(f"Warning: could not reload skill taxonomy {self.path}: {e}")
+        self._checked = now
+
+
+# Process-wide taxonomy used by the NLP engine
+DEFAULT_TAXONOMY = TaxonomyLoader()
+
+
+def get_taxonomy() -> SkillTaxonomy:
+    """The current default taxonomy."""
+    return DEFAULT_TAXONOMY.get()
+
+
+def taxonomy_from_sets(categories: Dict[str, Iterable[str]]) -> SkillTaxonomy:
+    """Compile an in-memory taxonomy (e.g. for tests or custom vocabularies)."""
+    return SkillTaxonomy(parse_taxonomy({category: list(skills) for category, skills in categories.items()}))
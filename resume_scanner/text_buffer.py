@@ -0,0 +1,107 @@
+"""
+Text Buffer Module
+Shared normalized text buffers so analyzers do not re-copy the resume text.
+"""
+
+from array import array
+from bisect import bisect_right
+from typing import List, Optional, Sequence, Tuple
+
+
+class OffsetMap:
+    """
+    Run-length mapping from cleaned-text indices back to raw-text indices.
+
+    Cleaning only deletes characters or collapses whitespace runs, so the
+    offset between the two texts is piecewise constant. One anchor is stored
+    per change of offset: ``clean[k]`` is the first cleaned index of run
+    ``k`` and ``orig[k]`` the raw index it maps to.
+    """
+
+    __slots__ = ('clean', 'orig', 'shift')
+
+    def __init__(self):
+        self.clean = array('q', [0])
+        self.orig = array('q', [0])
+        # Characters removed from the front of the cleaned text by strip()
+        self.shift = 0
+
+    def add_anchor(self, clean_index: int, orig_index: int):
+        """Start a new run at ``clean_index`` (must be non-decreasing)."""
+        if self.clean[-1] == clean_index:
+            self.orig[-1] = orig_index
+        else:
+            self.clean.append(clean_index)
+            self.orig.append(orig_index)
+
+    def to_original(self, index: int) -> int:
+        """Map a cleaned-text index to the raw-text index."""
+        index += self.shift
+        k = bisect_right(self.clean, index) - 1
+        return self.orig[k] + (index - self.clean[k])
+
+    def span(self, start: int, end: int) -> Tuple[int, int]:
+        """Map a cleaned-text ``[start, end)`` span to the raw-text span."""
+        if end <= start:
+            position = self.to_original(start)
+            return position, position
+        return self.to_original(start), self.to_original(end - 1) + 1
+
+    def __len__(self) -> int:
+        return len(self.clean)
+
+
+class NormalizedText(str):
+    """
+    Cleaned resume text carrying one canonical lowercase buffer.
+
+    Behaves exactly like the cleaned ``str`` (original-case view), but
+    ``lower()`` returns a single cached lowercase copy and ``words`` a single
+    cached whitespace split, so every analyzer that receives the same
+    instance works against the same buffers instead of making its own.
+    Cleaning joins the lines of the raw text; ``line_starts``, when known,
+    keeps the offsets at which they started (used to find section headings).
+    """
+
+    def __new__(cls, text: str, lower: Optional[str] = None, offsets: Optional[OffsetMap] = None,
+                line_starts: Optional[Sequence[int]] = None):
+        obj = super().__new__(cls, text)
+        obj._lower = lower
+        obj._words = None
+        obj._tokens = None
+        obj.offsets = offsets
+        obj.line_starts = line_starts
+        return obj
+
+    def lower(self) -> str:
+        """Return the shared lowercase buffer (computed once)."""
+        if self._lower is None:
+            self._lower = str.lower(self)
+        return self._lower
+
+    @property
+    def words(self) -> List[str]:
+        """Whitespace-separated words, split once and shared."""
+        if self._words is None:
+            self._words = self.split()
+        return self._words
+
+    def original_span(self, start: int, end: int) -> Tuple[int, int]:
+        """Map a span of this text to the raw extracted text (identity without offsets)."""
+        if self.offsets is None:
+            return start, end
+        return self.offsets.span(start, end)
+
+
+def split_words(text: str) -> List[str]:
+    """Split text on whitespace, reusing the shared split of a NormalizedText."""
+    if isinstance(text, NormalizedText):
+        return text.words
+    return text.split()
+
+
+def original_span(text: str, start: int, end: int) -> Tuple[int, int]:
+    """Map a span of cleaned text back to the raw text when offsets are tracked."""
+    if isinstance(text, NormalizedText):
+        return text.original_span(start, end)
+    return start, end
@@ -0,0 +1,19 @@
+"""
+In-context highlighting for Resume Scanner
+"""
+
+import html
+
+
+def highlight_spans(text, spans):
+    """Wrap non-overlapping spans of the raw text in highlight markup."""
+    parts = []
+    position = 0
+    for span in sorted(spans, key=lambda s: (s['start'], -s['end'])):
+        if span['start'] < position:
+            continue  # overlaps a span that is already highlighted
+        parts.append(html.escape(text[position:span['start']]))
+        parts.append(f'<mark class="{span["class"]}">{html.escape(text[span["start"]:span["end"]])}</mark>')
+        position = span['end']
+    parts.append(html.escape(text[position:]))
+    return f'<div class="resume-text">{"".join(parts)}</div>'
@@ -173,6 +173,28 @@ CUSTOM_CSS = """
         box-shadow: 0 5px 15px rgba(139, 92, 246, 0.3);
     }
     
+    /* In-context highlights */
+    .resume-text {
+        white-space: pre-wrap;
+        color: #cbd5e1;
+        font-size: 0.9rem;
+        line-height: 1.6;
+    }
+    
+    .highlight-skill {
+        background: rgba(139, 92, 246, 0.35);
+        color: #f1f5f9;
+        border-radius: 4px;
+        padding: 0 2px;
+    }
+    
+    .highlight-ai {
+        background: rgba(245, 158, 11, 0.35);
+        color: #f1f5f9;
+        border-radius: 4px;
+        padding: 0 2px;
+    }
+    
     /* Feedback Items */
     .feedback-item {
         padding: 12px 16px;
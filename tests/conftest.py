@@ -1,5 +1,16 @@
 import sys
 import os
 
+import pytest
+
 # Add the project root to the python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+@pytest.fixture(autouse=True, scope='session')
+def taxonomy_cache_dir(tmp_path_factory):
+    """Keep compiled taxonomy caches out of the user's cache directory."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        cache_dir = tmp_path_factory.mktemp('taxonomy_cache')
+        monkeypatch.setenv('RESUME_SCANNER_CACHE_DIR', str(cache_dir))
+        yield cache_dir
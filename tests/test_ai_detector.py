@@ -0,0 +1,60 @@
+from resume_scanner import AIDetector
+from resume_scanner.ai_detector import load_ai_lexicon
+
+
+TEXT = ("Passionate about data. I leveraged Python and spearheaded a migration, "
+        "then leveraged it again. Transformers are not transformed leveragedx.")
+
+
+def test_single_scan_feeds_scores_and_flags():
+    """Counts, positions and flags all come from one scan of the text."""
+    detector = AIDetector()
+    hits = detector.scan(TEXT)
+
+    assert hits.phrases == {'passionate about': 1}
+    assert hits.verbs == {'leveraged': 2, 'spearheaded': 1, 'transformed': 1}
+    assert [TEXT[start:end] for _, _, start, end in hits.spans] == [
+        'Passionate about', 'leveraged', 'spearheaded', 'leveraged', 'transformed']
+
+    result = detector.analyze(TEXT)
+    assert result['detailed_scores']['ai_phrases'] == 25
+    assert result['detailed_scores']['overused_verbs'] == 60
+    assert result['flags'] == ["Found 1 AI-style phrases",
+                               "Overused buzzwords: leveraged, spearheaded, transformed"]
+
+
+def test_lexicon_from_data_file():
+    """A larger lexicon loads from data/ai_phrases.json and extends the built-in one."""
+    phrases, verbs = load_ai_lexicon()
+    assert phrases[:len(AIDetector.AI_PHRASES)] == AIDetector.AI_PHRASES
+    assert len(phrases) > len(AIDetector.AI_PHRASES) and len(set(phrases)) == len(phrases)
+
+    detector = AIDetector(phrases, verbs)
+    hits = detector.scan("A results-driven self-starter who thrives in a fast-paced environment.")
+    assert list(hits.phrases) == ['results-driven', 'self-starter', 'fast-paced environment']
+
+
+def test_windowed_analysis_streams_over_long_text():
+    """Windows slide by the step, and the aggregate equals a whole-text analysis."""
+    detector = AIDetector()
+    human = "Fixed the billing bug in our invoice service after customers reported double charges. "
+    ai = "Passionate about innovation, I spearheaded initiatives and leveraged synergies. "
+    text = human * 20 + ai * 20
+
+    result = detector.analyze_windows(text, window=60, step=30)
+    assert result['aggregate'] == detector.analyze(text)
+    assert all(window['words'] == 60 for window in result['windows'][:-1])
+    assert result['windows'][0]['ai_probability'] < result['windows'][-1]['ai_probability']
+    assert result['peak_probability'] == result['windows'][-1]['ai_probability']
+
+    whole = detector.analyze_windows(text, window=10_000)
+    assert len(whole['windows']) == 1
+    assert whole['windows'][0]['ai_probability'] == whole['aggregate']['ai_probability']
+
+
+def test_section_analysis():
+    text = open('samples/sample_resume.txt', encoding='utf-8').read()
+    result = AIDetector().analyze_sections(text)
+    assert result['sections'][0]['start'] == 0
+    assert result['sections'][-1]['end'] == len(text)
+    assert result['aggregate'] == AIDetector().analyze(text)
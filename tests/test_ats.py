@@ -0,0 +1,95 @@
+import pytest
+
+from resume_scanner import ResumeParser, ATSScorer
+
+
+def _sample_text():
+    return ResumeParser().parse('samples/sample_resume.txt')
+
+
+def test_feedback_is_derived_from_signals():
+    """calculate_score feedback equals feedback regenerated from measurements."""
+    scorer = ATSScorer()
+    text = _sample_text()
+    result = scorer.calculate_score(text, 'ml_engineer')
+
+    signals = scorer.measure(text, 'ml_engineer')
+    assert signals.role == 'ml_engineer'
+    assert scorer.feedback_from_signals(signals) == result['feedback']
+    assert result['grade'] == scorer._get_grade(result['scores']['total'])
+
+
+def test_batch_scores_match_single_scores():
+    """Batch scoring gives the same component scores as scoring one by one."""
+    pytest.importorskip('numpy')
+    scorer = ATSScorer()
+    text = _sample_text()
+    texts = [text, text[:400], "python sql " * 300]
+    roles = ['data_scientist', None, 'Data Analyst']
+
+    batch = scorer.calculate_score_batch(texts, roles)
+    for index, (doc, role) in enumerate(zip(texts, roles)):
+        single = ATSScorer().calculate_score(doc, role)
+        row = batch[index] if not hasattr(batch, 'iloc') else batch.iloc[index]
+        for name in ATSScorer.COMPONENTS:
+            assert row[name] == pytest.approx(single['scores'][name])
+        assert row['total'] == pytest.approx(single['scores']['total'], abs=0.11)
+        assert scorer.feedback_from_signals(row) == single['feedback']
+
+
+def test_shared_scorer_is_thread_safe():
+    """One scorer instance serves concurrent requests with immutable results."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    scorer = ATSScorer()
+    text = _sample_text()
+    jobs = [(text, 'ml_engineer'), (text[:300], None), ("python " * 500, 'data_analyst')] * 20
+    expected = [ATSScorer().calculate_score(doc, role) for doc, role in jobs]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda job: scorer.score(*job), jobs))
+
+    assert [r.to_dict() for r in results] == expected
+    assert results[1].improvement_suggestions() == ATSScorer.suggestions_from_scores(expected[1]['scores'])
+    with pytest.raises(AttributeError):
+        results[0].total = 100
+
+
+def test_keyword_matching_is_boundary_aware():
+    """Short keywords only match whole tokens, and the role comes from the same scan."""
+    scorer = ATSScorer()
+    signals = scorer.measure("Built React and Vue apps in TypeScript with CSS.")
+    assert signals.role == 'frontend_developer'
+    found, missing = scorer._match_keywords("react, rest and c++", 'data_scientist')
+    assert 'r' in missing
+    found, missing = scorer._match_keywords("Modelling in R, C++ and node.js", 'data_scientist')
+    assert found == ['r']
+
+
+def test_extra_roles_from_keyword_file():
+    """Roles from data/job_keywords.json are added to the built-in ones."""
+    from resume_scanner.ats_scorer import load_role_keywords
+
+    role_keywords = load_role_keywords()
+    assert 'data_engineer' in role_keywords
+    assert role_keywords['data_scientist'][:len(ATSScorer.ROLE_KEYWORDS['data_scientist'])] == \
+        ATSScorer.ROLE_KEYWORDS['data_scientist']
+
+    scorer = ATSScorer(role_keywords)
+    signals = scorer.measure("Pipelines with Spark, Airflow and ETL into a data warehouse on AWS")
+    assert signals.role == 'data_engineer'
+    assert signals.keywords_found >= 5
+
+
+def test_compact_result_round_trips():
+    """Packed results expand to the same result, with feedback and suggestions."""
+    scorer = ATSScorer()
+    text = _sample_text()
+    posting = "Wanted: Rust developer with Kafka and Terraform experience."
+    for result in (scorer.score(text), scorer.score(text[:300], 'frontend_developer'),
+                   scorer.score(text, job_description=posting)):
+        compact = result.compact()
+        assert compact.expand() == result
+        assert compact.to_dict() == result.to_dict()
+        assert (compact.total, compact.grade, compact.pass_ats) == (result.total, result.grade, result.pass_ats)
+        assert compact.improvement_suggestions() == result.improvement_suggestions()
@@ -0,0 +1,75 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from resume_scanner import AIDetector
+from resume_scanner.calibration import FeatureCalibrator, StreamingHistogram
+
+
+HUMAN = "Fixed the billing bug in our invoice service after customers reported double charges. "
+AI = "Passionate about innovation, I spearheaded initiatives and leveraged synergies. "
+
+
+def test_batch_analysis_matches_analyze():
+    detector = AIDetector()
+    texts = [HUMAN * 10, AI * 10, HUMAN * 5 + AI * 5, '', open('samples/sample_resume.txt', encoding='utf-8').read()]
+    table = detector.analyze_batch(texts)
+
+    for row, text in enumerate(texts):
+        result = detector.analyze(text)
+        assert table['ai_probability'][row] == result['ai_probability']
+        assert table['verdict'][row] == result['verdict']
+        assert table['confidence'][row] == result['confidence']
+        for name, score in result['detailed_scores'].items():
+            assert table[name][row] == score
+    assert np.isnan(table['ttr'][3]) and table['word_count'][3] == 0
+
+
+def test_histogram_percentiles():
+    histogram = StreamingHistogram(0.0, 1.0, 100)
+    histogram.update(np.linspace(0, 1, 1001))
+    histogram.update([np.nan])
+    assert histogram.total == 1001
+    assert np.allclose(histogram.percentile([0.25, 0.5, 0.9]), [25, 50, 90], atol=0.5)
+    assert histogram.percentile([np.nan])[0] == 50
+    assert abs(histogram.quantile(0.9) - 0.9) < 0.01
+
+
+def test_calibrator_ranks_against_population(tmp_path):
+    detector = AIDetector()
+    calibrator = FeatureCalibrator()
+    population = [HUMAN * n for n in range(1, 20)] + [AI * 3]
+    calibrator.update(detector.extract_features_batch(population), detector.FEATURES)
+    assert calibrator.documents == len(population)
+
+    table = detector.analyze_batch([HUMAN * 10, AI * 10], calibrator=calibrator)
+    assert table['calibrated_probability'][1] > table['calibrated_probability'][0]
+
+    path = tmp_path / 'calibration.npz'
+    calibrator.save(path)
+    loaded = FeatureCalibrator.load(path)
+    assert loaded.quantiles() == calibrator.quantiles()
+
+
+def test_batch_feeds_calibrator_like_analyze():
+    texts = [HUMAN * 10, AI * 10, HUMAN * 5 + AI * 5, '', "Results-driven,  detail-oriented and\n\nhighly   motivated. "
+             "Drove strategic results; leveraged drivenness. " * 4]
+    streamed = AIDetector(calibrator=FeatureCalibrator())
+    for text in texts:
+        assert 'calibrated_probability' in streamed.analyze(text)
+    batched = AIDetector(calibrator=FeatureCalibrator())
+    table = batched.analyze_batch(texts)
+
+    assert batched.calibrator.documents == streamed.calibrator.documents == len(texts)
+    for name, histogram in streamed.calibrator.histograms.items():
+        assert np.array_equal(batched.calibrator.histograms[name].counts, histogram.counts), name
+    # The last text joins the population last, so it is ranked against the same texts
+    assert table['calibrated_probability'][len(texts) - 1] == streamed.analysis_results['calibrated_probability']
+
+
+def test_sparse_phrase_lookup_matches_full_scan():
+    detector = AIDetector()
+    for text in [HUMAN, AI * 2, "results-driven", "Results -driven", "results-drivenness", "passionate\n\n\t about",
+                 "leveraged" + " " * 500 + "x", "proven track records", "highly motivated"]:
+        words = set(detector._words(text.lower()))
+        assert detector._matcher.sparse_hits(text, words) == detector._matcher.hits(text), text
@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from resume_scanner.corpus_index import CorpusIndex, choose_bands
+
+
+def _variant(text, rate, seed):
+    rng = random.Random(seed)
+    return ' '.join(word if rng.random() >= rate else f"edit{rng.randint(0, 999)}" for word in text.split())
+
+
+def _corpus():
+    base = open('samples/sample_resume.txt', encoding='utf-8').read()
+    rng = random.Random(0)
+    words = base.split()
+    others = [' '.join(rng.sample(words, len(words))) for _ in range(20)]
+    return base, others
+
+
+def test_finds_near_duplicates_only():
+    base, others = _corpus()
+    index = CorpusIndex(threshold=0.7, merge_every=8)
+    index.add('template', base)
+    for i, text in enumerate(others):
+        index.add(f'other-{i}', text)
+    index.add('copy', _variant(base, 0.01, 1))
+
+    matches = dict(index.query(_variant(base, 0.01, 2)))
+    assert set(matches) == {'template', 'copy'}
+    assert all(similarity >= 0.7 for similarity in matches.values())
+    assert index.query(base, exclude='template')[0][0] == 'copy'
+    assert index.query("A completely different resume about cooking and gardening.") == []
+
+
+def test_save_and_load_round_trip(tmp_path):
+    base, others = _corpus()
+    index = CorpusIndex()
+    index.add_many((f'doc-{i}', text) for i, text in enumerate([base] + others))
+    path = tmp_path / 'corpus.npz'
+    index.save(path)
+
+    loaded = CorpusIndex.load(path)
+    assert len(loaded) == len(index) and 'doc-0' in loaded
+    assert loaded.query(base) == index.query(base)
+    loaded.add('new', _variant(base, 0.01, 3))
+    assert 'new' in dict(loaded.query(base))
+
+
+def test_band_layout_tracks_threshold():
+    bands, rows = choose_bands(0.8, 128)
+    assert bands * rows <= 128
+    assert abs((1 / bands) ** (1 / rows) - 0.8) < 0.05
@@ -0,0 +1,70 @@
+from datetime import date
+
+import pytest
+
+from resume_scanner import NLPEngine
+from resume_scanner.experience import merged_months, parse_ranges
+
+TODAY = date(2026, 10, 19)
+
+
+def test_ranges_are_parsed_and_merged():
+    ranges = parse_ranges("Acme 2014 - 2018; Beta Jun 2016 – Dec 2019; Gamma 03/2021 to present; "
+                          "Marketing 2019-2020; 1985 - 1989; 2027 - 2029", TODAY)
+    assert [r.months for r in ranges] == [48, 43, 68, 12]
+    # 2014-01..2020-01 (2014-2019 overlaps collapse) plus 2021-03..2026-10
+    assert merged_months(ranges) == 72 + 68
+
+    text = "EXPERIENCE\nLead, Jan 2020 - Present\nEngineer, 2018 - 2021\nEDUCATION\nBSc 2010 - 2014"
+    years, found = NLPEngine(use_spacy=False).calculate_experience_years(text, TODAY)
+    assert years == 8.8 and [r['start'] for r in found] == [2020, 2018]
+
+
+def test_batch_table_matches_single_documents(tmp_path):
+    np = pytest.importorskip('numpy')
+    from resume_scanner.experience import ExperienceTable, extract_experience_batch
+
+    texts = [
+        "EXPERIENCE\nLead, Jan 2020 - Present\nEngineer, 2018 - 2021\nEDUCATION\nBSc 2010 - 2014",
+        "No dates at all",
+        "Intern Jun 2024 - Aug 2024",
+        "Analyst 2012 - 2015, Consultant 2014 - 2019",
+    ]
+    table = extract_experience_batch(texts, TODAY)
+    engine = NLPEngine(use_spacy=False)
+
+    assert np.allclose(table.total_years, [engine.calculate_experience_years(t, TODAY)[0] for t in texts], atol=0.05)
+    assert table.role_counts.tolist() == [2, 0, 1, 2]
+    assert table.roles(3)[2].tolist() == [3.0, 5.0]
+    assert table.longest_role_years.tolist()[1:] == [0.0, 0.25, 5.0]
+    assert table.at_least(5).tolist() == [0, 3]
+
+    table.save(tmp_path / 'experience.npz')
+    loaded = ExperienceTable.load(tmp_path / 'experience.npz')
+    assert loaded.at_least(5).tolist() == [0, 3] and loaded.role_offsets.tolist() == [0, 2, 2, 3, 5]
+
+
+def test_year_ranges_report_the_written_years():
+    engine = NLPEngine(use_spacy=False)
+    years, found = engine.calculate_experience_years("Acme 2018 - 2021", TODAY)
+    assert years == 3.0
+    assert [(r['start'], r['end'], r['years']) for r in found] == [(2018, 2021, 3.0)]
+
+    # A same-year range is listed with zero years
+    years, found = engine.calculate_experience_years("Acme 2019 - 2019", TODAY)
+    assert years == 0.0 and [(r['start'], r['end'], r['years']) for r in found] == [(2019, 2019, 0.0)]
+
+    _, found = engine.calculate_experience_years("Beta Jun 2020 - Dec 2021, Gamma 2024 - present", TODAY)
+    assert [(r['start'], r['end']) for r in found] == [(2020, 2021), (2024, 2026)]
+
+
+def test_title_case_headings_scope_experience():
+    text = ("Summary\nExperienced engineer with a degree in physics and a focus on skills growth.\n"
+            "Experience\nAcme Corp, Senior Engineer, 2015 - 2020\nGlobex, Engineer, 2009 - 2015\n"
+            "Education\nBSc Physics, 2005 - 2009\nSkills\nPython, Docker\n")
+    engine = NLPEngine(use_spacy=False)
+    for resume in (text, text.replace("Experience\n", "EXPERIENCE\n")):
+        years, found = engine.calculate_experience_years(resume, TODAY)
+        assert years == 11.0 and [r['start'] for r in found] == [2015, 2009]
+    # Without any heading the whole text is searched
+    assert engine.calculate_experience_years("Acme 2015 - 2020. BSc 2005 - 2009", TODAY)[0] == 9.0
@@ -0,0 +1,71 @@
+import pytest
+
+from resume_scanner.export import ColumnarExporter, export_records, iter_row_groups, read_columns, to_dataframe
+from resume_scanner.store import AnalysisRecord
+
+np = pytest.importorskip('numpy')
+
+
+def _record(name, score, skills, matches, grade='B'):
+    return AnalysisRecord(name=name, ats_total=score, grade=grade, pass_ats=score >= 60,
+                          components={'keywords': 50.0}, ai_probability=10.0, ai_verdict='Human',
+                          skills=skills, job_matches=matches)
+
+
+RECORDS = [
+    _record('a', 85, {'Python': 3, 'Docker': 1}, {'ML Engineer': 90.0, 'Data Scientist': 40.0}, 'A'),
+    _record('b', 70, {'Python': 1}, {'Data Scientist': 75.0}),
+    _record('c', 40, {}, {}, None),
+    _record('d', 55, {}, {}, None)._replace(pass_ats=None),
+]
+
+
+def test_export_streams_row_groups(tmp_path):
+    path = tmp_path / 'results.npz'
+    roles = ['ML Engineer', 'Data Scientist']
+    assert export_records(RECORDS, path, roles=roles, row_group_size=2) == 4
+    assert len(list(iter_row_groups(path))) == 2
+
+    columns = read_columns(path)
+    assert columns['ats_total'].dtype == np.float32 and columns['ats_total'].tolist() == [85, 70, 40, 55]
+    assert np.isnan(columns['formatting']).all() and columns['keywords'].tolist() == [50, 50, 50, 50]
+    # Records without an ATS result stay unknown rather than failing
+    assert columns['pass_ats'].dtype == np.int8 and columns['pass_ats'].tolist() == [1, 1, 0, -1]
+    assert columns['job_matches'].shape == (4, 2)
+    assert columns['job_matches'][0].tolist() == [90, 40] and np.isnan(columns['job_matches'][2]).all()
+    assert columns['grade_values'][columns['grade']][:2].tolist() == ['A', 'B'] and columns['grade'][2] == -1
+    assert columns['best_role_values'][columns['best_role'][:2]].tolist() == ['ML Engineer', 'Data Scientist']
+
+    offsets = columns['skill_offsets']
+    assert offsets.tolist() == [0, 2, 3, 3, 3]
+    assert columns['skills'][columns['skill_codes']].tolist() == ['Python', 'Docker', 'Python']
+    assert columns['skill_mentions'].tolist() == [3, 1, 1]
+
+
+def test_exporter_dataframe(tmp_path):
+    pytest.importorskip('pandas')
+    path = tmp_path / 'results.npz'
+    with ColumnarExporter(path, roles=['ML Engineer', 'Data Scientist'], row_group_size=10) as exporter:
+        for record in RECORDS:
+            exporter.add(record)
+        assert len(exporter) == 4 and exporter.row_groups == 0
+
+    frame = to_dataframe(path)
+    assert frame['name'].tolist() == ['a', 'b', 'c', 'd']
+    assert frame['skills'].tolist() == [['Python', 'Docker'], ['Python'], [], []]
+    assert str(frame['pass_ats'].dtype) == 'boolean' and frame['pass_ats'][:3].tolist() == [True, True, False]
+    assert frame['pass_ats'].isna().tolist() == [False, False, False, True]
+    assert str(frame['grade'].dtype) == 'category' and frame['grade'].isna().tolist() == [False, False, True, True]
+    assert frame['match_Data Scientist'][:2].tolist() == [40.0, 75.0] and frame['match_ML Engineer'].isna().sum() == 3
+
+
+def test_parquet_export(tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    path = tmp_path / 'results.parquet'
+    export_records(RECORDS, path, roles=['ML Engineer', 'Data Scientist'], row_group_size=2)
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_row_groups == 2
+    table = parquet.read()
+    assert table.column('skills').to_pylist() == [['Python', 'Docker'], ['Python'], [], []]
+    assert table.column('pass_ats').to_pylist() == [True, True, False, None]
+    assert table.column('job_matches').to_pylist()[0] == [90.0, 40.0]
@@ -0,0 +1,45 @@
+from resume_scanner import ResumeParser, ATSScorer
+from resume_scanner.features import scan_features
+
+
+def test_contact_info_comes_from_feature_scan():
+    """The parser's contact info and the scorer's signals share one scan."""
+    parser = ResumeParser()
+    parser.parse('samples/sample_resume.txt')
+
+    assert parser.extract_contact_info() == {
+        'email': 'john.doe@email.com',
+        'phone': '(555) 123-4567',
+        'linkedin': 'linkedin.com/in/johndoe',
+        'github': 'github.com/johndoe'
+    }
+    assert parser.get_features() is parser.get_features()
+
+    shared = ATSScorer().calculate_score(parser.text, features=parser.get_features())
+    assert shared == ATSScorer().calculate_score(parser.text)
+    assert shared['scores']['contact'] == 100
+
+
+def test_formatting_signals():
+    """Special characters, bullet styles, ALL CAPS and tables are counted."""
+    text = "• one ○ two ■ three * four - five | a | b | SKILLS ABOUT ★★"
+    features = scan_features(text)
+
+    assert features.bullet_types == 5
+    assert features.all_caps_words == 2
+    assert features.special_chars == 9
+    assert features.has_table
+    assert features.email is None and not features.mentions_linkedin
+
+
+def test_tokens_inside_contacts_are_still_counted():
+    """Emails and profile links do not hide capital runs, phone numbers or headings."""
+    text = "ACMECORP.SALES@example.com\nLINKEDIN GITHUB PORTFOLIO\nlinkedin.com/in/jane5551234567"
+    features = scan_features(text)
+
+    # ACMECORP and SALES inside the address, plus the three headings
+    assert features.all_caps_words == 5
+    assert features.phone == '5551234567'
+    assert features.email == 'ACMECORP.SALES@example.com'
+    assert features.linkedin == 'linkedin.com/in/jane5551234567'
+    assert features.mentions_linkedin and features.mentions_portfolio
@@ -0,0 +1,47 @@
+from resume_scanner import NLPEngine
+from resume_scanner.fuzzy import FuzzyPhraseMatcher, bounded_distance
+from resume_scanner.taxonomy import taxonomy_from_sets
+
+
+def test_bounded_distance():
+    assert bounded_distance('kubernates', 'kubernetes', 2) == 1
+    assert bounded_distance('pyhton', 'python', 1) == 1
+    assert bounded_distance('tensorflow2', 'tensorflow', 2) == 1
+    assert bounded_distance('docker', 'python', 2) is None
+    assert bounded_distance('go', 'golang', 2) is None
+
+
+def test_fuzzy_matches_typos_and_split_words():
+    taxonomy = taxonomy_from_sets({'skills': ['Python', 'JavaScript', 'Java', 'Kubernetes', 'TensorFlow',
+                                              'Machine Learning', 'React', 'Node.js', 'Terraform']})
+    text = "Kubernates, Tensorflow2, Py thon, Java Script, machine lerning, Node. js, Terrafrom, Reakt and Java"
+    assert taxonomy.extract(text)['skills'] == ['Java']
+    assert taxonomy.extract(text, fuzzy=True)['skills'] == [
+        'Java', 'JavaScript', 'Kubernetes', 'Machine Learning', 'Node.js', 'Python', 'TensorFlow', 'Terraform']
+
+    spans = [(taxonomy.names[i], text[s:e]) for i, s, e in taxonomy.finditer(text, fuzzy=True)]
+    assert ('Python', 'Py thon') in spans and ('JavaScript', 'Java Script') in spans
+    assert ('Java', 'Java') in spans and ('Java', 'Java Script') not in spans
+
+    matcher = FuzzyPhraseMatcher({'kubernetes': 0, 'react': 1, 'python': 2})
+    assert matcher.ids("kubernets and reakt, pyhton, Kubrenetes") == {0}
+
+
+def test_common_words_are_not_skills():
+    engine = NLPEngine(use_spacy=False, fuzzy=True)
+    sentences = [
+        "Designed the database schema to be perfect for string processing.",
+        "Handled every request and looked into reports.",
+        "Wrote jobs to scrape pages and solidify results, then roll up the totals.",
+    ]
+    for sentence in sentences:
+        assert engine.get_all_skills_flat(sentence) == [], sentence
+    # Exact names and real typos still match
+    assert engine.get_all_skills_flat("Scheme, Spring, Requests, Looker, Scrapy, Kubernates") == [
+        'Kubernetes', 'Looker', 'Requests', 'Scheme', 'Scrapy', 'Spring']
+
+
+def test_engine_fuzzy_mode():
+    text = "Skills: Kubernates, Scikitlearn, Tensorflw"
+    assert NLPEngine().get_all_skills_flat(text) == []
+    assert NLPEngine(fuzzy=True).get_all_skills_flat(text) == ['Kubernetes', 'scikit-learn', 'TensorFlow']
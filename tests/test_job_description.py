@@ -0,0 +1,38 @@
+from resume_scanner import ATSScorer
+from resume_scanner.job_description import JobDescriptionCache, extract_terms, get_job_description
+
+
+JD = """Data Engineer. You will build Airflow pipelines in Python and SQL,
+stream events through Kafka into Snowflake on AWS. Kafka and Airflow pipelines
+run daily."""
+
+
+def test_extract_terms_ranks_skills_first():
+    """Known skills come first, most mentioned first, then repeated words."""
+    terms = extract_terms(JD)
+    assert terms[:2] == ['airflow', 'python']
+    assert {'sql', 'snowflake', 'aws'} <= set(terms)
+    assert terms.index('kafka') > terms.index('aws')
+    assert 'and' not in terms and 'daily' not in terms
+
+
+def test_cache_compiles_each_posting_once_and_evicts_lru():
+    """Repeated postings hit the cache; the least recently used one is evicted."""
+    cache = JobDescriptionCache(maxsize=2)
+    first = cache.get(JD)
+    assert cache.get("  " + JD.upper()) is first
+    cache.get("Java developer with Spring and Java microservices")
+    cache.get(JD)
+    cache.get("Frontend role: React, TypeScript, React Native")
+    assert cache.info() == {'hits': 2, 'misses': 3, 'size': 2, 'maxsize': 2}
+    assert cache.get(JD) is first
+
+
+def test_score_against_job_description():
+    """Keyword targets come from the posting instead of the role lists."""
+    job = get_job_description(JD)
+    result = ATSScorer().score("Python and SQL developer; Airflow pipelines on AWS.", job_description=job)
+    assert result.signals.role == ATSScorer.JOB_DESCRIPTION_ROLE
+    assert result.signals.keywords_total == len(job.terms)
+    assert 'snowflake' in result.signals.missing_keywords
+    assert 'python' not in result.signals.missing_keywords
@@ -0,0 +1,44 @@
+from resume_scanner import JobMatcher, NLPEngine, ResumeParser
+
+
+def test_compact_match_result():
+    text = ResumeParser().parse('samples/sample_resume.txt')
+    engine = NLPEngine(use_spacy=False)
+    mentions = engine.scan_skills(text)
+    matcher = JobMatcher()
+
+    result = matcher.score(text, skills=mentions)
+    assert result.to_dict() == matcher.match(text, skills=mentions)
+    assert list(result.role_matches) == list(JobMatcher.JOB_DESCRIPTIONS)
+    assert result.best_match == result.all_matches[0]
+    assert result.roles is matcher.score("SQL and Excel").roles
+    assert 'missing_skills' not in matcher.score(text).to_dict()
+
+
+def test_profile_expands_to_categories():
+    text = ResumeParser().parse('samples/sample_resume.txt')
+    engine = NLPEngine(use_spacy=False)
+    profile = engine.skill_profile(text)
+    assert engine.taxonomy.by_category(profile.ids()) == engine.extract_skills(text)
+
+
+def test_role_skills_are_cached_per_taxonomy_object():
+    import gc
+    from resume_scanner.taxonomy import SkillTaxonomy, parse_taxonomy
+
+    matcher = JobMatcher()
+    engine = NLPEngine(use_spacy=False)
+    role = 'Data Engineer'
+    mentions = engine.scan_skills("Python and SQL")
+    assert matcher.role_skills(role, mentions) is matcher.role_skills(role, mentions)
+
+    # Same (empty) digest, different skills: never served from the other's cache
+    small = SkillTaxonomy(parse_taxonomy({'data': ['Kafka']}))
+    other = SkillTaxonomy(parse_taxonomy({'data': ['Spark', 'Kafka']}))
+    assert small.digest == other.digest
+    assert matcher.role_skills(role, NLPEngine(use_spacy=False, taxonomy=small).scan_skills("Kafka")) == [0]
+    assert matcher.role_skills(role, NLPEngine(use_spacy=False, taxonomy=other).scan_skills("Kafka")) == [0, 1]
+
+    del small, other
+    gc.collect()
+    assert len(matcher._role_skills) == 1
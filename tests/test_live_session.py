@@ -0,0 +1,68 @@
+import random
+
+from resume_scanner import ATSScorer, NLPEngine, AIDetector
+from resume_scanner.live_session import LiveSession, split_units
+
+
+def _sample_text():
+    return open('samples/sample_resume.txt', encoding='utf-8').read()
+
+
+def test_split_units_ends_after_terminator_and_whitespace():
+    units, complete = split_units("One. Two!\nThree? node.js")
+    assert units == ["One. ", "Two!\n", "Three? ", "node.js"]
+    assert not complete
+
+
+def test_lines_and_bullets_are_units():
+    units, complete = split_units("SKILLS\n\n- Python\n- Docker\nPhone: 555\n123 4567\n")
+    assert units == ["SKILLS\n\n", "- Python\n", "- Docker\n", "Phone: 555\n123 4567\n"]
+    assert complete
+
+    session = LiveSession(_sample_text())
+    assert session.stats()['units'] > 40
+    assert max(len(unit.text) for unit in session._units) < 200
+
+
+def test_phrases_and_sentences_run_on_across_lines():
+    """Phrases split by a line break and sentences without periods are carried across units."""
+    engine = NLPEngine(use_spacy=False)
+    text = "Skills\nmachine\nlearning, spring\nboot\n- passionate\nabout data\n- Led a team of engineers\n- Shipped"
+    session = LiveSession(text, nlp_engine=engine)
+    assert session.skills() == engine.extract_skills(text)
+    assert session.ai() == AIDetector().analyze(text)
+    assert session.ats() == ATSScorer().score(text)
+
+    # Editing a word next to a seam updates the hits across it
+    session.update(text.replace("learning", "learnings"))
+    assert 'Machine Learning' not in session.skills()['ml_ai_concepts']
+    session.update(text)
+    assert 'Machine Learning' in session.skills()['ml_ai_concepts']
+
+
+def test_edits_match_full_analysis():
+    """After every edit the session agrees with analyzing the whole text."""
+    scorer, engine, detector = ATSScorer(), NLPEngine(use_spacy=False), AIDetector()
+    snippets = ['. ', '\n', ' | ', 'Python', ' machine learning ', 'leveraged', 'passionate about',
+                'EXPERIENCE', 'jane@example.com ', '•', 'The team was great. ', '\n- ', ' machine\nlearning ',
+                'spring\nboot', '555\n123 4567', 'runs on across\nthe line']
+    rng = random.Random(3)
+    session = LiveSession(_sample_text(), ats_scorer=scorer, nlp_engine=engine, ai_detector=detector)
+
+    for _ in range(60):
+        text = session.text
+        start = rng.randint(0, len(text))
+        end = min(len(text), start + rng.choice([0, 1, 15, 120]))
+        new_text = text[:start] + rng.choice(snippets) + text[end:]
+        session.update(new_text)
+
+        assert session.text == new_text
+        assert session.ats() == scorer.score(new_text)
+        assert session.skills() == engine.extract_skills(new_text)
+        assert session.ai() == AIDetector().analyze(new_text)
+
+
+def test_update_reports_minimal_edit():
+    session = LiveSession("Built APIs. Led a team.")
+    assert session.update("Built REST APIs. Led a team.") == (6, 6, "REST ")
+    assert session.stats()['word_count'] == 6
@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from resume_scanner import AIDetector
+from resume_scanner.live_session import LiveSession
+from resume_scanner.ngram_model import NGramModel, load_language_model
+
+
+HUMAN_WORDS = "fixed bug shipped wrote tests on-call invoice billing cut latency migrated postgres ran".split()
+AI_WORDS = "leveraged synergies innovative cutting-edge dynamic seamless stakeholders holistic robust".split()
+
+
+def _doc(words, seed, n=200):
+    rng = random.Random(seed)
+    return ' '.join(rng.choice(words + ['the', 'and', 'to']) for _ in range(n)) + '.'
+
+
+@pytest.fixture(scope='module')
+def model():
+    return NGramModel.train([_doc(HUMAN_WORDS, i) for i in range(20)],
+                            [_doc(AI_WORDS, 100 + i) for i in range(20)], bits=14)
+
+
+def test_model_separates_classes_and_round_trips(model, tmp_path):
+    human, ai = _doc(HUMAN_WORDS, 999), _doc(AI_WORDS, 998)
+    assert model.probability(human) < 10 < 90 < model.probability(ai)
+    assert model.probability('') == model.probability('   ')
+
+    path = tmp_path / 'model.npy'
+    model.save(path)
+    loaded = load_language_model(path)
+    assert isinstance(loaded.table, np.memmap)
+    assert loaded.probability(ai) == model.probability(ai)
+    assert load_language_model(tmp_path / 'missing.npy') is None
+
+
+def test_language_model_is_a_weighted_component(model):
+    text = open('samples/sample_resume.txt', encoding='utf-8').read()
+    plain = AIDetector().analyze(text)
+    detector = AIDetector(language_model=model, language_model_weight=0.5)
+    result = detector.analyze(text)
+
+    lm = result['detailed_scores']['language_model']
+    assert lm == round(model.probability(text), 1)
+    assert result['ai_probability'] == pytest.approx(plain['ai_probability'] * 0.5 + lm * 0.5, abs=0.1)
+    assert detector.analyze_windows(text)['aggregate'] == result
+    assert detector.analyze_batch([text])['ai_probability'][0] == result['ai_probability']
+    assert LiveSession(text, ai_detector=detector).ai() == result
@@ -0,0 +1,41 @@
+import pytest
+
+pytest.importorskip('spacy')
+
+from resume_scanner import NLPEngine
+from resume_scanner.nlp_engine import SPACY_UNUSED_COMPONENTS, load_spacy_model
+
+
+@pytest.fixture(scope='module')
+def nlp():
+    nlp = load_spacy_model('en_core_web_sm')
+    if nlp is None:
+        pytest.skip("spaCy model 'en_core_web_sm' is not installed")
+    return nlp
+
+
+def _sorted(entities):
+    return {key: sorted(values) for key, values in entities.items()}
+
+
+def test_spacy_model_is_loaded_lazily_and_shared(nlp):
+    engine = NLPEngine(spacy_model='en_core_web_sm')
+    assert 'nlp' not in vars(engine)
+    assert engine.nlp is NLPEngine().nlp is nlp
+    assert NLPEngine(use_spacy=False).nlp is None
+
+
+def test_unused_components_are_not_loaded(nlp):
+    assert 'ner' in nlp.pipe_names
+    assert not {'tagger', 'parser', 'lemmatizer'} & set(nlp.pipe_names)
+    assert not set(SPACY_UNUSED_COMPONENTS) & set(nlp.component_names)
+
+
+def test_batch_entities_match_single_documents(nlp):
+    text = open('samples/sample_resume.txt', encoding='utf-8').read()
+    texts = [text, "Master of Science, University of Oxford", ""]
+    engine = NLPEngine()
+    batch = engine.extract_entities_batch(texts, batch_size=2)
+
+    assert [_sorted(entities) for entities in batch] == [_sorted(engine.extract_entities(t)) for t in texts]
+    assert 'Master' in batch[1]['education']
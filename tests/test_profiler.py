@@ -0,0 +1,42 @@
+from pathlib import Path
+
+from resume_scanner.profiler import MemoryProfiler
+
+
+def test_profile_document_records_every_stage():
+    """Each pipeline stage is recorded once per document and reported."""
+    content = Path('samples/sample_resume.txt').read_bytes()
+    profiler = MemoryProfiler(top_n=5)
+    try:
+        records = profiler.profile_document(content, 'txt', doc_id='sample')
+    finally:
+        profiler.stop()
+
+    assert [r['stage'] for r in records] == ['extract', 'clean', 'skills', 'ats', 'ai', 'job_match']
+    assert all(r['document'] == 'sample' for r in records)
+
+    report = profiler.report()
+    assert report['stages']['skills']['documents'] == 1
+    assert len(report['top_call_sites']) <= 5
+    assert "Top allocating call sites" in profiler.format_report()
+
+
+def test_stages_measure_their_own_growth():
+    """RSS is reported as growth above each stage's baseline, and setup stays out of the stages."""
+    content = Path('samples/sample_resume.txt').read_bytes()
+    profiler = MemoryProfiler()
+    try:
+        first = profiler.profile_document(content, 'txt', doc_id='first')
+        pipeline = profiler._pipeline(False)
+        second = profiler.profile_document(content, 'txt', doc_id='second')
+    finally:
+        profiler.stop()
+
+    assert profiler._pipeline(False) is pipeline
+    for record in first + second:
+        assert 'peak_rss_kb' not in record
+        assert record['peak_bytes'] >= 0
+        assert record['rss_growth_kb'] is None or record['rss_growth_kb'] >= 0
+    # The engine and taxonomy are built before the first stage, so the
+    # skills stage retains no more for the first document than the second
+    assert first[2]['allocated_bytes'] <= max(second[2]['allocated_bytes'], 0) + 64 * 1024
@@ -0,0 +1,81 @@
+from resume_scanner import ResumeParser, NLPEngine
+from resume_scanner.sections import RESUME_SEGMENTER, SectionSegmenter
+
+
+def _sample_parser():
+    parser = ResumeParser()
+    parser.parse('samples/sample_resume.txt')
+    return parser
+
+
+def test_section_spans_cover_text_in_order():
+    """Segments are contiguous, start at their headings and cover the text."""
+    parser = _sample_parser()
+    spans = parser.get_section_spans()
+
+    assert spans[0].start == 0
+    assert spans[-1].end == len(parser.text)
+    assert all(a.end == b.start for a, b in zip(spans, spans[1:]))
+    names = [s.name for s in spans]
+    assert names.index('experience') < names.index('education') < names.index('skills')
+    skills = next(s for s in spans if s.name == 'skills')
+    assert parser.text[skills.start:skills.end].startswith('SKILLS')
+
+
+def test_presence_includes_keywords_nested_in_longer_ones():
+    """'career objective' marks summary and also experience (via 'career')."""
+    segmenter = SectionSegmenter({
+        'summary': ['career objective', 'summary'],
+        'experience': ['experience', 'career'],
+    })
+    assert segmenter.present("my career objective") == {'summary', 'experience'}
+    assert _sample_parser().get_sections()['projects'] is True
+
+
+def test_skills_restricted_to_sections():
+    """Section-scoped extraction only sees text inside the chosen sections."""
+    parser = _sample_parser()
+    engine = NLPEngine(use_spacy=False)
+    everywhere = engine.get_all_skills_flat(parser.text)
+    education_only = engine.extract_skills(parser.text, sections=['education'])
+
+    assert sum(len(v) for v in education_only.values()) < len(everywhere)
+    assert engine.extract_skills_by_section(parser.text)['skills']['programming_languages']
+
+
+TITLE_CASE_RESUME = (
+    "Jane Roe\n"
+    "Summary\n"
+    "Experienced engineer with a degree in physics and a focus on skills growth.\n"
+    "Experience\n"
+    "Acme Corp, Senior Engineer, 2015 - 2020\n"
+    "- Built Python services\n"
+    "Globex, Engineer, 2009 - 2015\n"
+    "Education\n"
+    "BSc Physics, 2005 - 2009\n"
+    "Skills\n"
+    "Python, Docker\n"
+)
+
+
+def test_title_case_headings_start_sections_at_line_starts():
+    """Keywords inside running text ('Experienced', 'degree', 'skills growth') are not headings."""
+    sections = RESUME_SEGMENTER.segment(TITLE_CASE_RESUME)
+    assert [(s.name, TITLE_CASE_RESUME[s.start:s.end].split('\n')[0]) for s in sections] == [
+        ('header', 'Jane Roe'), ('summary', 'Summary'), ('experience', 'Experience'),
+        ('education', 'Education'), ('skills', 'Skills')]
+
+    engine = NLPEngine(use_spacy=False)
+    assert engine.extract_skills(TITLE_CASE_RESUME, sections=['skills'])['cloud_devops'] == ['Docker']
+    assert engine.extract_skills(TITLE_CASE_RESUME, sections=['summary'])['programming_languages'] == []
+
+
+def test_cleaned_text_uses_tracked_line_starts():
+    """Cleaning joins lines; the parser keeps their starts so Title Case headings are still found."""
+    parser = ResumeParser(track_offsets=True)
+    text = parser.parse(file_content=TITLE_CASE_RESUME.encode(), file_type='txt')
+    assert '\n' not in text
+    names = [s.name for s in parser.get_section_spans()]
+    assert names == ['header', 'summary', 'experience', 'education', 'skills']
+    # Without line information only ALL CAPS or 'Heading:' keywords count
+    assert [s.name for s in RESUME_SEGMENTER.segment(str(text))] == ['header']
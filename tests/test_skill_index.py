@@ -0,0 +1,99 @@
+import pytest
+
+pytest.importorskip('numpy')
+
+from resume_scanner.skill_index import SkillIndex, parse_query
+
+
+def _index():
+    index = SkillIndex()
+    index.add('ana', "Python and Kubernetes on AWS", tags=['senior'])
+    index.add('ben', "Python and Docker", tags=['junior'])
+    index.add('cai', "Java, Docker and K8s", tags=['senior'])
+    index.add('dev', "Golang only")
+    return index
+
+
+def test_query_parser_precedence():
+    assert parse_query('python AND (k8s OR docker) AND NOT junior') == (
+        'and', [('term', 'python'), ('or', [('term', 'k8s'), ('term', 'docker')]), ('not', ('term', 'junior'))])
+    assert parse_query('machine learning OR "spring boot" AND c++') == (
+        'or', [('term', 'machine learning'), ('and', [('term', 'spring boot'), ('term', 'c++')])])
+    with pytest.raises(ValueError):
+        parse_query('python AND (docker')
+
+
+def test_boolean_queries_and_updates():
+    index = _index()
+    assert index.search('python AND (kubernetes OR docker)') == ['ana', 'ben']
+    assert index.search('python AND (kubernetes OR docker) AND NOT junior') == ['ana']
+    assert index.search('NOT python') == ['cai', 'dev']
+    assert index.count('kubernetes') == 2
+    assert index.search('cobol') == []
+    with pytest.raises(ValueError, match='unknown-tag'):
+        index.search('cobol OR unknown-tag')
+    with pytest.raises(ValueError):
+        index.top_k({'pyhton': 1})
+
+    index.remove('ana')
+    assert index.search('kubernetes') == ['cai']
+    index.add('eve', "Python, Kubernetes")
+    assert index.search('python AND k8s') == ['eve'] and len(index) == 4
+    index.add('ben', "Rust")
+    assert index.search('python') == ['eve']
+
+
+def test_weighted_top_k_and_persistence(tmp_path):
+    index = _index()
+    weights = {'python': 3, 'kubernetes': 2, 'docker': 1, 'junior': -2}
+    assert index.top_k(weights, k=3) == [('ana', 5.0), ('cai', 3.0), ('ben', 2.0)]
+    assert index.top_k(weights, k=2, query='NOT senior') == [('ben', 2.0), ('dev', 0.0)]
+
+    index.remove('dev')
+    path = tmp_path / 'skills.npz'
+    index.save(path)
+    loaded = SkillIndex.load(path)
+    assert loaded.keys == index.keys
+    assert loaded.search('python AND NOT junior') == ['ana']
+    assert loaded.add('fay', "Go") == 3
+
+
+def test_tags_cannot_shadow_skills():
+    index = SkillIndex()
+    for tag in ('go', 'R', 'K8s'):
+        with pytest.raises(ValueError, match='skill name or alias'):
+            index.add('ana', "Python", tags=['senior', tag])
+    assert 'ana' not in index and index.tags == []
+
+    index.add_many([('ana', "Python and Go", ['Senior']), ('ben', "R and SQL"), ('cai', "Go", ('junior',))])
+    assert index.search('go AND NOT junior') == ['ana']
+    assert index.search('r') == ['ben'] and index.search('senior OR junior') == ['ana', 'cai']
+
+
+def test_tag_columns_grow_geometrically_and_are_reclaimed(tmp_path):
+    index = SkillIndex()
+    skills = len(index.taxonomy)
+    shapes = set()
+    for i in range(100):
+        index.add(f'c{i}', "Python", tags=[f'batch-{i}'])
+        shapes.add(index._bits.shape[0])
+    assert len(shapes) <= 6 and len(index.tags) == 100
+
+    for i in range(50):
+        index.remove(f'c{i}')
+    assert len(index.tags) == 50 and 'batch-0' not in index.tags
+    with pytest.raises(ValueError, match='batch-0'):
+        index.search('batch-0')
+
+    columns = index._bits.shape[0]
+    index.add('new', "Go", tags=['fresh', 'batch-99'])
+    assert index._bits.shape[0] == columns and index._tag_columns['fresh'] < skills + 50
+    assert index.search('fresh') == ['new']
+    assert sorted(index.search('batch-99')) == ['c99', 'new']
+
+    path = tmp_path / 'tags.npz'
+    index.save(path)
+    loaded = SkillIndex.load(path)
+    assert loaded.tags == index.tags and loaded.search('fresh') == ['new']
+    loaded.add('old', "Rust", tags=['again'])
+    assert sorted(loaded.search('again OR fresh')) == ['new', 'old']
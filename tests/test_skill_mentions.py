@@ -0,0 +1,49 @@
+from resume_scanner import ATSScorer, JobMatcher, NLPEngine
+from resume_scanner.parser import ResumeParser
+
+
+TEXT = """SUMMARY
+Python developer shipping machine learning services.
+
+EXPERIENCE
+Built Python APIs and deployed them to K8s with Docker.
+
+SKILLS
+Python, Docker, Kubernetes, SQL
+"""
+
+
+def test_mentions_record_counts_positions_and_sections():
+    mentions = NLPEngine(use_spacy=False).scan_skills(TEXT)
+    python = mentions.get('python')
+
+    assert python.count == 3
+    assert python.first == (TEXT.index('Python'), TEXT.index('Python') + 6)
+    assert python.last[0] == TEXT.rindex('Python')
+    assert python.sections == ('summary', 'experience', 'skills')
+    assert mentions.get('kubernetes').count == 2 and 'k8s' in mentions
+    assert list(mentions.counts())[0] == 'Python'
+    assert mentions.names(['summary']) == ['Machine Learning', 'Python']
+    assert mentions.get('rust') is None
+
+
+def test_consumers_read_the_record():
+    parser = ResumeParser()
+    text = parser.parse('samples/sample_resume.txt')
+    engine = NLPEngine(use_spacy=False)
+    mentions = engine.scan_skills(text)
+
+    assert mentions.by_category() == engine.extract_skills(text)
+    assert mentions.hits() == engine.find_skill_spans(text)
+
+    scorer = ATSScorer()
+    for role in (None, 'ml_engineer', 'backend_developer'):
+        assert scorer.score(text, role, skills=mentions) == scorer.score(text, role)
+    # Aliases count for role keywords when read from the record
+    k8s = "Deployed services to K8s."
+    assert 'kubernetes' in scorer.measure(k8s, 'ml_engineer').missing_keywords
+    assert 'kubernetes' not in scorer.measure(k8s, 'ml_engineer', skills=engine.scan_skills(k8s)).missing_keywords
+
+    matched = JobMatcher().match(text, skills=mentions)
+    assert matched['all_matches'] == JobMatcher().match(text)['all_matches']
+    assert 'Python' not in matched['missing_skills']
@@ -0,0 +1,32 @@
+import random
+
+import pytest
+
+from resume_scanner.skill_profile import SkillProfile, profile_matrix
+
+
+def test_profile_set_operations():
+    a = SkillProfile.from_ids([1, 5, 300])
+    b = SkillProfile.from_ids([5, 300, 7])
+    assert a.ids() == [1, 5, 300] and len(a) == 3 and 300 in a and 2 not in a
+    assert (a & b).ids() == [5, 300]
+    assert (a | b).ids() == [1, 5, 7, 300]
+    assert (a - b).ids() == [1]
+    assert a.jaccard(b) == 0.5 and SkillProfile().jaccard(SkillProfile()) == 0.0
+    assert SkillProfile.from_bytes(a.to_bytes()) == a
+
+
+def test_matrix_scores_match_profiles():
+    pytest.importorskip('numpy')
+    rng = random.Random(0)
+    profiles = [SkillProfile.from_ids(rng.sample(range(200), rng.randint(0, 20))) for _ in range(300)]
+    matrix = profile_matrix(profiles, 200)
+    required = SkillProfile.from_ids(range(0, 200, 9))
+
+    assert matrix[17] == profiles[17]
+    assert matrix.overlap(required).tolist() == [p.overlap(required) for p in profiles]
+    assert matrix.jaccard(required).tolist() == [p.jaccard(required) for p in profiles]
+    assert matrix.coverage(required).tolist() == [p.coverage(required) for p in profiles]
+
+    best = matrix.top_k(required, k=5, metric='coverage')
+    assert [score for _, score in best] == sorted((p.coverage(required) for p in profiles), reverse=True)[:5]
@@ -0,0 +1,63 @@
+import pytest
+
+from resume_scanner.batch import BatchRunner
+from resume_scanner.store import AnalysisRecord, ResultStore
+
+
+def _record(name, score, skills, best, ai=10.0):
+    return AnalysisRecord(name=name, ats_total=score, grade='B', pass_ats=score >= 60,
+                          components={'keywords': 50.0}, ai_probability=ai, experience_years=score / 10,
+                          skills=skills, job_matches={best: 90.0, 'Other': 10.0})
+
+
+def test_store_filters_and_replaces(tmp_path):
+    path = tmp_path / 'results.db'
+    with ResultStore(path, batch_size=2) as store:
+        store.add_many([
+            _record('a', 85, {'Python': 3, 'Docker': 1}, 'ML Engineer'),
+            _record('b', 70, {'Python': 1}, 'Data Scientist'),
+            _record('c', 40, {'Docker': 2, 'Kubernetes': 1}, 'ML Engineer', ai=80.0),
+        ])
+        assert [name for name, _ in store.find(skills=['python'])] == ['a', 'b']
+        assert store.find(skills=['Python', 'docker']) == [('a', 85.0)]
+        assert [name for name, _ in store.find(best_role='ML Engineer')] == ['a', 'c']
+        assert [name for name, _ in store.find(min_score=50, max_score=80)] == ['b']
+        assert [name for name, _ in store.find(max_ai_probability=50, min_experience=8)] == ['a']
+        assert store.find(skills=['Rust']) == []
+
+        store.add(_record('a', 30, {'Rust': 1}, 'Data Scientist'))
+        assert store.find(skills=['Python']) == [('b', 70.0)]
+        assert store.remove('c') and not store.remove('c')
+
+    with ResultStore(path) as store:
+        assert len(store) == 2
+        record = store.get('a')
+        assert record.skills == {'Rust': 1} and record.job_matches['Data Scientist'] == 90.0
+        assert record.components == {'keywords': 50.0} and record.pass_ats is False
+        assert store.best_roles() == {'Data Scientist': 2}
+        assert store.connection.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+
+
+def test_batch_runner_stores_analysis(tmp_path):
+    with ResultStore(tmp_path / 'results.db') as store:
+        stored, failed = BatchRunner(store).run(['samples', tmp_path / 'missing.pdf'])
+        assert stored == 1 and len(failed) == 1
+        record = store.get('sample_resume.txt')
+        assert record.skills['Python'] == 6 and record.experience_years > 0
+        assert store.find(skills=['python', 'tensorflow'])[0][0] == 'sample_resume.txt'
+        assert max(record.job_matches, key=record.job_matches.get) in store.best_roles()
+
+
+def test_batch_runner_keeps_same_named_files_apart(tmp_path):
+    sample = open('samples/sample_resume.txt', encoding='utf-8').read()
+    for folder in ('a', 'b'):
+        (tmp_path / 'resumes' / folder).mkdir(parents=True)
+        (tmp_path / 'resumes' / folder / 'cv.txt').write_text(sample, encoding='utf-8')
+
+    with ResultStore(tmp_path / 'results.db') as store:
+        stored, failed = BatchRunner(store).run([tmp_path / 'resumes'])
+        assert stored == 2 and not failed
+        assert len(store) == 2 and store.get('a/cv.txt') and store.get('b/cv.txt')
+
+        with pytest.raises(ValueError):
+            BatchRunner(store).run([tmp_path / 'resumes' / 'a' / 'cv.txt', tmp_path / 'resumes' / 'b' / 'cv.txt'])
@@ -0,0 +1,98 @@
+import json
+import os
+
+from resume_scanner import NLPEngine
+from resume_scanner.taxonomy import TaxonomyLoader, compile_taxonomy, default_cache_dir, parse_taxonomy
+
+
+def test_taxonomy_is_normalized_from_grouped_json():
+    categories = parse_taxonomy({
+        'languages': ['Python', ' python ', 'C++'],
+        'frameworks': {'python': ['Django', 'Spring  Boot'], 'java': ['Spring Boot']},
+        'cloud': [{'name': 'Kubernetes', 'aliases': ['K8s', 'kubernetes']}],
+    })
+    assert {category: [entry.skill for entry in entries] for category, entries in categories.items()} == {
+        'languages': ['python', 'c++'], 'frameworks': ['django', 'spring boot'], 'cloud': ['kubernetes']}
+    assert categories['frameworks'][1].name == 'Spring Boot'
+    assert categories['cloud'][0].aliases == ('k8s',)
+
+
+def test_aliases_resolve_to_canonical_skills():
+    engine = NLPEngine(use_spacy=False)
+    taxonomy = engine.taxonomy
+    skills = engine.extract_skills("Deployed Golang services to K8s backed by Postgres and PostgreSQL.")
+    assert skills['programming_languages'] == ['Go']
+    assert skills['cloud_devops'] == ['Kubernetes']
+    assert skills['databases'] == ['PostgreSQL']
+    assert taxonomy.resolve('k8s') == taxonomy.resolve('Kubernetes')
+
+    profile = engine.skill_profile("Go, kubernetes and postgres")
+    assert taxonomy.names_of(profile) == ['Go', 'PostgreSQL', 'Kubernetes']
+    required = taxonomy.profile_of(['golang', 'k8s', 'terraform', 'not a skill'])
+    assert profile.overlap(required) == 2
+    assert profile.coverage(required) == 2 / 3
+    assert profile.jaccard(required) == 2 / 4
+
+
+def test_default_taxonomy_drives_skill_extraction():
+    engine = NLPEngine(use_spacy=False)
+    skills = engine.extract_skills("Built services in C++ and C# on Kubernetes with Spring Boot.")
+    assert {'C#', 'C++'} <= set(skills['programming_languages'])
+    assert skills['frameworks_libraries'] == ['Spring', 'Spring Boot']
+    assert skills['cloud_devops'] == ['Kubernetes']
+
+
+def test_compiled_taxonomy_is_cached(tmp_path):
+    path = tmp_path / 'skills.json'
+    path.write_text(json.dumps({'tools': ['Docker']}))
+    cache_dir = tmp_path / 'cache'
+
+    first = compile_taxonomy(path, cache_dir)
+    assert len(list(cache_dir.glob('skills-*.json'))) == 1
+    cached = compile_taxonomy(path, cache_dir)
+    assert cached is not first and cached.skills == first.skills == ['docker']
+    assert cached.aliases == first.aliases and cached.extract("Docker") == {'tools': ['Docker']}
+
+    path.write_text(json.dumps({'tools': ['Docker', 'Terraform']}))
+    assert compile_taxonomy(path, cache_dir).skills == ['docker', 'terraform']
+    assert len(list(cache_dir.glob('skills-*.json'))) == 1
+
+    # Another taxonomy file of the same name keeps its own cache
+    other = tmp_path / 'other' / 'skills.json'
+    other.parent.mkdir()
+    other.write_text(json.dumps({'tools': ['Ansible']}))
+    assert compile_taxonomy(other, cache_dir).skills == ['ansible']
+    assert len(list(cache_dir.glob('skills-*.json'))) == 2
+
+    # A corrupt cache is ignored, never executed
+    for cache_file in cache_dir.glob('skills-*.json'):
+        cache_file.write_text('{broken')
+    assert compile_taxonomy(path, cache_dir).skills == ['docker', 'terraform']
+
+
+def test_tests_do_not_write_to_the_user_cache(taxonomy_cache_dir):
+    assert default_cache_dir() == taxonomy_cache_dir
+
+
+def test_loader_hot_reloads_changed_file(tmp_path):
+    path = tmp_path / 'skills.json'
+    path.write_text(json.dumps({'tools': ['Docker']}))
+    loader = TaxonomyLoader(path, tmp_path / 'cache', check_interval=0)
+    engine = NLPEngine(use_spacy=False, taxonomy=loader)
+    assert engine.extract_skills("docker and terraform") == {'tools': ['Docker']}
+
+    path.write_text(json.dumps({'tools': ['Docker', 'Terraform']}))
+    os.utime(path, ns=(0, 10 ** 9))
+    assert engine.extract_skills("docker and terraform") == {'tools': ['Docker', 'Terraform']}
+
+    path.write_text('{broken')
+    os.utime(path, ns=(0, 2 * 10 ** 9))
+    assert loader.get().skills == ['docker', 'terraform']
+    assert loader.reloads == 2
+
+
+def test_skills_sort_case_insensitively():
+    engine = NLPEngine(use_spacy=False)
+    text = "Python, spaCy, scikit-learn, Keras and TensorFlow"
+    assert engine.get_all_skills_flat(text) == ['Keras', 'Python', 'scikit-learn', 'spaCy', 'TensorFlow']
+    assert engine.scan_skills(text).names() == engine.get_all_skills_flat(text)
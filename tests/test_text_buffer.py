@@ -0,0 +1,53 @@
+from pathlib import Path
+
+from resume_scanner import ResumeParser, NLPEngine, ATSScorer, AIDetector
+from resume_scanner.text_buffer import NormalizedText, split_words
+
+
+SAMPLE = Path('samples/sample_resume.txt').read_bytes()
+
+
+def test_clean_text_matches_multi_pass_cleaning():
+    """The fused cleaner produces the same text as the original three passes."""
+    raw = "JOHN  DOE\n\n\n\n• Python | SQL ★ \t C++ — ok\r\nemail: a@b.com"
+    text = ResumeParser()._clean_text(raw)
+    assert text == "JOHN DOE  Python  SQL  C++  ok email: a@b.com"
+
+
+def test_lean_parse_shares_buffers():
+    """Lean mode returns one cached lowercase buffer and word split."""
+    parser = ResumeParser(lean=True)
+    text = parser.parse(file_content=SAMPLE, file_type='txt')
+
+    assert isinstance(text, NormalizedText)
+    assert text == ResumeParser().parse(file_content=SAMPLE, file_type='txt')
+    assert text.lower() is text.lower()
+    assert split_words(text) is text.words
+
+
+def test_analyzers_agree_in_lean_mode():
+    """Analyzers give identical results on plain and lean text."""
+    plain = ResumeParser().parse(file_content=SAMPLE, file_type='txt')
+    lean = ResumeParser(lean=True).parse(file_content=SAMPLE, file_type='txt')
+
+    engine = NLPEngine(use_spacy=False)
+    assert engine.extract_skills(plain) == engine.extract_skills(lean)
+    assert ATSScorer().calculate_score(plain) == ATSScorer().calculate_score(lean)
+    assert AIDetector().analyze(plain) == AIDetector().analyze(lean)
+
+
+def test_offset_map_points_back_to_raw_text():
+    """Hits found in cleaned text map back to the same words in the raw text."""
+    parser = ResumeParser(track_offsets=True)
+    text = parser.parse(file_content=SAMPLE, file_type='txt')
+    raw = parser.raw_text
+
+    for hit in NLPEngine(use_spacy=False).find_skill_spans(text):
+        assert raw[hit['start']:hit['end']].lower() == hit['skill'].lower()
+    for hit in AIDetector().find_phrase_spans(text):
+        assert raw[hit['start']:hit['end']].lower() == hit['term']
+
+    _, offsets, line_starts = parser._clean_text_with_offsets("  •  Led   ★ team\n\nwork")
+    cleaned = parser._clean_text("  •  Led   ★ team\n\nwork")
+    assert offsets.span(cleaned.index('team'), cleaned.index('team') + 4) == (13, 17)
+    assert line_starts == [0, cleaned.index('work')]